@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import sys
 import threading
+import traceback
 from pathlib import Path
 from typing import Callable, Optional, Protocol
 
-from PySide6.QtCore import QAbstractNativeEventFilter, Qt
+from PySide6.QtCore import QAbstractNativeEventFilter, QObject, QRunnable, QThreadPool, Qt
 from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
-from overlay_app.models.config import AppConfig, load_config, save_config
-from overlay_app.ui.control_panel import ControlPanel
+from overlay_app.models.config import AppConfig, config_snapshot, load_config, save_config, write_config_snapshot
+from overlay_app.ui.control_panel import ControlPanel, preload_fonts
 
 
 class WindowsHotkeyManager(QAbstractNativeEventFilter):
@@ -456,6 +457,61 @@ class MacOSHotkeyManager:
         return expression, normalized
 
 
+class _ConfigWriteTask(QRunnable):
+    def __init__(self, saver: "BackgroundConfigSaver") -> None:
+        super().__init__()
+        self._saver = saver
+
+    def run(self) -> None:
+        self._saver._drain()
+
+
+class BackgroundConfigSaver(QObject):
+    """Writes config snapshots on a worker thread; a newer snapshot replaces one that is still waiting."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pending: Optional[dict] = None
+        self._last_snapshot: Optional[dict] = None  # last snapshot queued, to drop saves that changed nothing
+        self._draining = False
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+    def submit(self, config: AppConfig) -> None:
+        """Snapshot config on the calling (GUI) thread and queue the JSON dump + file write."""
+        snapshot = config_snapshot(config)
+        with self._lock:
+            if snapshot == self._last_snapshot:
+                return
+            self._last_snapshot = snapshot
+            self._pending = snapshot
+            if self._draining:
+                return
+            self._draining = True
+        self._pool.start(_ConfigWriteTask(self))
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                data, self._pending = self._pending, None
+                if data is None:
+                    self._draining = False
+                    return
+            try:
+                write_config_snapshot(data)
+            except Exception:
+                # Worker thread: nothing above us reports the failure, so print it like a failing Qt slot would
+                traceback.print_exc()
+                with self._lock:
+                    # Let the next submit retry even if the config is unchanged
+                    self._last_snapshot = None
+
+    def wait(self) -> None:
+        """Block until queued writes are on disk (call before exiting)."""
+        self._pool.waitForDone()
+
+
 def _create_qapp() -> QApplication:
     if sys.platform == "win32":
         import ctypes
@@ -516,13 +572,16 @@ def _build_fallback_s_icon() -> QIcon:
 def main() -> None:
     app = _create_qapp()
     app.setQuitOnLastWindowClosed(False)
+    preload_fonts()
 
     config: AppConfig = load_config()
     hotkey_manager: Optional[HotkeyManager] = None
     tray: Optional[QSystemTrayIcon] = None
 
+    config_saver = BackgroundConfigSaver(app)
+
     def on_config_changed(new_config: AppConfig) -> None:
-        save_config(new_config)
+        config_saver.submit(new_config)
 
     def on_hotkey_changed(hotkey: str) -> str:
         if hotkey_manager is None:
@@ -658,6 +717,7 @@ def main() -> None:
         tray.show()
 
     exit_code = app.exec()
+    config_saver.wait()
     if hotkey_manager is not None:
         hotkey_manager.close()
     sys.exit(exit_code)
@@ -1,7 +1,8 @@
 import json
+import os
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Tuple
+from typing import FrozenSet, List, Literal, Optional, Tuple, get_args
 
 from appdirs import user_config_dir
 
@@ -26,6 +27,7 @@ class CaptureRect:
 
 
 ThemeType = Literal["dark", "light", "ember", "sea", "emerald", "cherry", "pastel", "neon", "late", "fire", "galaxy", "ducky"]
+VALID_THEMES: FrozenSet[str] = frozenset(get_args(ThemeType))
 
 
 @dataclass
@@ -172,7 +174,7 @@ def load_config() -> AppConfig:
     focus_hotkey_enabled = bool(data.get("focus_hotkey_enabled", False))
     click_through_hotkey = str(data.get("click_through_hotkey", "")).strip()
     theme = str(data.get("theme", "dark")).strip().lower()
-    if theme not in ("dark", "light", "ember", "sea", "emerald", "cherry", "pastel", "neon", "late", "fire", "galaxy", "ducky"):
+    if theme not in VALID_THEMES:
         theme = "dark"
     keep_control_panel_on_top = bool(data.get("keep_control_panel_on_top", False))
     return AppConfig(
@@ -186,9 +188,9 @@ def load_config() -> AppConfig:
     )
 
 
-def save_config(config: AppConfig) -> None:
-    path = _config_path()
-    serializable = {
+def config_snapshot(config: AppConfig) -> dict:
+    """Plain-data copy of config (no shared references), safe to serialize off the GUI thread."""
+    return {
         "profiles": [asdict(p) for p in config.profiles],
         "active_profile_id": config.active_profile_id,
         "chat_hotkey": config.chat_hotkey,
@@ -197,4 +199,23 @@ def save_config(config: AppConfig) -> None:
         "theme": config.theme,
         "keep_control_panel_on_top": config.keep_control_panel_on_top,
     }
-    path.write_text(json.dumps(serializable, indent=2), encoding="utf-8")
+
+
+def write_config_snapshot(data: dict) -> None:
+    """Write a config_snapshot() to config.json via a temp file + rename so readers never see a partial file."""
+    path = _config_path()
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # Don't leave a stale half-written temp file behind; the next save rewrites it from scratch
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
+
+
+def save_config(config: AppConfig) -> None:
+    write_config_snapshot(config_snapshot(config))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+import time
 from typing import Callable, Optional
 
 from PySide6.QtCore import QPoint, Qt, QRect, QEvent
@@ -14,6 +15,8 @@ class BaseOverlayWindow(QWidget):
     """
 
     RESIZE_MARGIN = 14
+    # Minimum seconds between unforced SetWindowPos(HWND_TOPMOST) calls
+    TOPMOST_MIN_INTERVAL = 0.5
 
     def __init__(self, opacity: float = 0.8, locked: bool = False, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -39,6 +42,7 @@ class BaseOverlayWindow(QWidget):
         self._pan_start_pos: Optional[QPoint] = None
         self._draw_resize_border = False
         self._border_color = QColor(139, 92, 246)  # default dark theme purple
+        self._topmost_at = 0.0
 
         self.on_state_changed: Optional[Callable[[], None]] = None
 
@@ -122,13 +126,17 @@ class BaseOverlayWindow(QWidget):
         else:
             ex_style &= ~WS_EX_TRANSPARENT
         user32.SetWindowLongW(hwnd, GWL_EXSTYLE, ex_style)
-        self.ensure_topmost()
+        self.ensure_topmost(force=True)
 
-    def ensure_topmost(self) -> None:
+    def ensure_topmost(self, force: bool = False) -> None:
+        """Re-assert HWND_TOPMOST; unforced calls (the refresh loop) are rate-limited per window."""
         if sys.platform != "win32":
             return
         if not self.isVisible():
             return
+        now = time.monotonic()
+        if not force and now - self._topmost_at < self.TOPMOST_MIN_INTERVAL:
+            return
         try:
             hwnd = int(self.winId())
         except Exception:
@@ -150,12 +158,34 @@ class BaseOverlayWindow(QWidget):
             0,
             SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE,
         )
+        self._topmost_at = now
 
     def set_overlay_opacity(self, opacity: float) -> None:
         self.setWindowOpacity(opacity)
         if self.on_state_changed:
             self.on_state_changed()
 
+    def apply_overlay_state(
+        self,
+        title: Optional[str] = None,
+        opacity: Optional[float] = None,
+        zoom: Optional[float] = None,
+    ) -> None:
+        """Apply the given detail edits (None = unchanged) and notify on_state_changed once, not per setter."""
+        callback = self.on_state_changed
+        self.on_state_changed = None
+        try:
+            if title is not None:
+                self.setWindowTitle(title)
+            if opacity is not None:
+                self.set_overlay_opacity(opacity)
+            if zoom is not None and callable(getattr(self, "set_zoom", None)):
+                self.set_zoom(zoom)
+        finally:
+            self.on_state_changed = callback
+        if callback and (opacity is not None or zoom is not None):
+            callback()
+
     def fit_to_content(self) -> None:
         """Subclasses can override if they can infer an ideal content size."""
         return None
@@ -343,7 +373,7 @@ class BaseOverlayWindow(QWidget):
 
     def showEvent(self, event):  # type: ignore[override]
         super().showEvent(event)
-        self.ensure_topmost()
+        self.ensure_topmost(force=True)
 
 
 class OverlayDragHandle(QLabel):
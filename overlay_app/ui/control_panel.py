@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
+import re
 import sys
 import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterator, Literal, Optional
 
-from PySide6.QtCore import QEvent, QSize, QTimer, Qt, QEventLoop, QUrl
-from PySide6.QtGui import QCloseEvent, QFont, QFontDatabase, QKeySequence, QPixmap, QResizeEvent, QDesktopServices, QAction
+from PySide6.QtCore import Property, QEvent, QModelIndex, QPoint, QRect, QSignalBlocker, QSize, QTimer, Qt, QUrl, Signal
+from PySide6.QtGui import QCloseEvent, QColor, QDropEvent, QFont, QFontDatabase, QFontMetrics, QIcon, QKeySequence, QPainter, QPixmap, QPixmapCache, QResizeEvent, QDesktopServices, QAction
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -30,6 +34,7 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QFormLayout,
     QToolButton,
+    QToolTip,
     QSpinBox,
     QSplitter,
     QKeySequenceEdit,
@@ -38,7 +43,8 @@ from PySide6.QtWidgets import (
     QTabWidget,
 )
 
-from overlay_app.models.config import AppConfig, OverlayConfig, OverlayProfile, CaptureRect, ThemeType
+from overlay_app.models.config import AppConfig, OverlayConfig, OverlayProfile, CaptureRect, ThemeType, VALID_THEMES
+from overlay_app.overlays.base_overlay import BaseOverlayWindow
 from overlay_app.overlays.image_overlay import ImageOverlayWindow
 from overlay_app.overlays.screen_capture_overlay import ScreenCaptureOverlay
 from overlay_app.overlays.web_overlay import WebOverlayWindow
@@ -46,210 +52,12 @@ from overlay_app.ui.region_picker import RegionPickerOverlay
 from overlay_app.ui.window_picker import WindowPickerDialog
 from overlay_app.ui.window_crop_picker import WindowCropPickerDialog
 
-# Minimal dark theme: near-black, dark gray panels, soft purple accent
-CONTROL_PANEL_DARK_QSS = """
-    QWidget { background-color: #0B0D10; color: #E7EAF0; }
-    QLabel { color: #E7EAF0; font-size: 14px; background: transparent; }
-    QLabel[class="muted"] { color: #AAB2C0; font-size: 12px; }
-    QLabel[class="section"] { color: #8B5CF6; font-size: 12px; font-weight: bold; margin-top: 6px; margin-bottom: 2px; letter-spacing: 0.5px; }
-    QListWidget {
-        background-color: #0B0D10; border: 1px solid #2a3140; border-radius: 12px;
-        padding: 6px; outline: none;
-    }
-    QListWidget::item {
-        padding: 0; margin: 2px; background: transparent; border-radius: 10px;
-    }
-    QListWidget::item:selected {
-        background-color: rgba(139, 92, 246, 0.16);
-        border: 1px solid rgba(139, 92, 246, 0.35);
-        border-radius: 10px;
-    }
-    QListWidget::item:hover:!selected {
-        background-color: rgba(255, 255, 255, 0.05); border-radius: 10px;
-    }
-    QLineEdit, QSpinBox, QKeySequenceEdit, QPlainTextEdit {
-        background-color: #0B0D10; color: #E7EAF0; border: 1px solid #2a3140;
-        border-radius: 8px; padding: 8px 12px; min-height: 24px; font-size: 14px;
-    }
-    QLineEdit:focus, QSpinBox:focus, QKeySequenceEdit:focus { border-color: #8B5CF6; }
-    QSlider::groove:horizontal {
-        height: 6px; background: #242C3A; border-radius: 3px;
-    }
-    QSlider::handle:horizontal {
-        width: 14px; margin: -4px 0; background: #8B5CF6; border-radius: 7px;
-    }
-    QSlider::handle:horizontal:hover { background: #9d7af0; }
-    QPushButton {
-        background-color: #111318; color: #E7EAF0; border: 1px solid #2a3140;
-        border-radius: 10px; padding: 8px 14px; min-height: 24px; font-size: 13px;
-    }
-    QPushButton:hover { background-color: #1e2430; border-color: #8B5CF6; color: #E7EAF0; }
-    QPushButton:pressed { background-color: #242C3A; }
-    QPushButton:disabled { color: #6b7280; }
-    QPushButton[class="primary"] {
-        background-color: #8B5CF6; border-color: #8B5CF6; color: #E7EAF0;
-    }
-    QPushButton[class="primary"]:hover {
-        background-color: #9d7af0; border-color: #9d7af0; color: #E7EAF0;
-    }
-    QPushButton[class="primary"]:pressed { background-color: #7c3aed; border-color: #7c3aed; }
-    QPushButton[class="primary"]:disabled { background-color: #3f3f46; border-color: #3f3f46; color: #6b7280; }
-    QPushButton[class="action-primary"] {
-        background-color: #eab308; border-color: #eab308; color: #0f0f14;
-        border-radius: 12px; padding: 8px 16px; font-weight: 600;
-    }
-    QPushButton[class="action-primary"]:hover {
-        background-color: #facc15; border-color: #facc15;
-    }
-    QPushButton[class="action-primary"]:pressed { background-color: #ca8a04; border-color: #ca8a04; }
-    QPushButton[class="action-primary"]:disabled { background-color: #3f3f46; border-color: #3f3f46; color: #6b7280; }
-    QPushButton[class="action-secondary"] {
-        background-color: rgba(168, 85, 247, 0.08);
-        border: 1px solid rgba(168, 85, 247, 0.45);
-        color: #f5f3ff;
-        border-radius: 12px; padding: 8px 16px; font-weight: 600;
-    }
-    QPushButton[class="action-secondary"]:hover {
-        background-color: rgba(168, 85, 247, 0.16);
-        border-color: rgba(168, 85, 247, 0.7);
-    }
-    QPushButton[class="action-secondary"]:pressed {
-        background-color: rgba(168, 85, 247, 0.24);
-    }
-    QPushButton[class="action-secondary"]:disabled {
-        background-color: rgba(168, 85, 247, 0.04);
-        border-color: rgba(168, 85, 247, 0.2);
-        color: #6b7280;
-    }
-    QPushButton[class="action-primary"] {
-        background-color: #8B5CF6; border-color: #8B5CF6; color: #E7EAF0;
-        border-radius: 12px; padding: 8px 16px; font-weight: 600;
-    }
-    QPushButton[class="action-primary"]:hover {
-        background-color: #9d7af0; border-color: #9d7af0;
-    }
-    QPushButton[class="action-primary"]:pressed { background-color: #7c3aed; border-color: #7c3aed; }
-    QPushButton[class="action-primary"]:disabled { background-color: #3f3f46; border-color: #3f3f46; color: #6b7280; }
-    QPushButton[class="action-secondary"] {
-        background-color: rgba(139, 92, 246, 0.08);
-        border: 1px solid rgba(139, 92, 246, 0.45);
-        color: #E7EAF0;
-        border-radius: 12px; padding: 8px 16px; font-weight: 600;
-    }
-    QPushButton[class="action-secondary"]:hover {
-        background-color: rgba(139, 92, 246, 0.16);
-        border-color: rgba(139, 92, 246, 0.7);
-    }
-    QPushButton[class="action-secondary"]:pressed {
-        background-color: rgba(139, 92, 246, 0.24);
-    }
-    QPushButton[class="action-secondary"]:disabled {
-        background-color: rgba(139, 92, 246, 0.04);
-        border-color: rgba(139, 92, 246, 0.2);
-        color: #6b7280;
-    }
-    QPushButton[class="subtle"] { background: transparent; border: none; color: #AAB2C0; }
-    QPushButton[class="subtle"]:hover { color: #8B5CF6; }
-    QPushButton[class="destructive"]:hover { border-color: #c62828; color: #ef5350; }
-    QPushButton[class="compact"] { font-size: 12px; padding: 6px 12px; min-height: 22px; }
-    QScrollArea { border: none; background: transparent; }
-    QScrollArea > QWidget > QWidget { background: transparent; }
-    QTabWidget::pane {
-        border: 1px solid #2a3140;
-        border-radius: 12px; background: #0B0D10;
-        margin-top: 6px; padding: 12px 14px 18px 14px;
-    }
-    QTabBar {
-        background: #111318;
-        border: 1px solid #2a3140;
-        border-radius: 12px;
-        padding: 4px;
-    }
-    QTabBar::tab {
-        background: transparent; color: #AAB2C0;
-        padding: 8px 16px; margin-right: 4px;
-        border: none;
-        border-radius: 8px; font-size: 13px;
-    }
-    QTabBar::tab:selected {
-        background: #8B5CF6; color: #E7EAF0;
-    }
-    QTabBar::tab:hover:!selected {
-        background: #1a1f2e; color: #E7EAF0;
-    }
-    QMenu {
-        background-color: #111318;
-        color: #E7EAF0;
-        border: 1px solid #2a3140;
-        padding: 4px 0;
-    }
-    QMenu::item {
-        padding: 6px 14px;
-        background: transparent;
-    }
-    QMenu::item:selected {
-        background-color: #8B5CF6;
-        color: #E7EAF0;
-    }
-    QFrame#HeroHeader {
-        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-            stop: 0 rgba(139, 92, 246, 0.06), stop: 0.65 rgba(139, 92, 246, 0.03), stop: 1 rgba(139, 92, 246, 0.14));
-        border: 1px solid #2a3140;
-        border-radius: 14px;
-    }
-    QLabel#HeaderIcon {
-        background: transparent;
-        border: none;
-        padding: 0;
-    }
-    QLabel[class="header-title"] {
-        font-size: 16px;
-        font-weight: 700;
-        margin: 0;
-        padding: 0;
-    }
-    QLabel[class="header-subtitle"] {
-        font-size: 11px;
-        color: #AAB2C0;
-        margin: -2px 0 0 0;
-        padding: 0;
-    }
-    QLabel[class="header-meta"] {
-        font-size: 11px;
-        color: #AAB2C0;
-    }
-    QFrame#HeaderGlow {
-        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-            stop: 0 rgba(139, 92, 246, 0.0), stop: 0.5 rgba(139, 92, 246, 0.45), stop: 1 rgba(139, 92, 246, 0.0));
-        border-radius: 1px;
-    }
-    QPushButton[class="header-cta"] {
-        background-color: #111318;
-        border: 1px solid #8B5CF6;
-        color: #E7EAF0;
-        border-radius: 10px;
-        padding: 6px 14px;
-        font-size: 12px;
-        font-weight: 600;
-    }
-    QPushButton[class="header-cta"]:hover {
-        background-color: #1e2430;
-        border-color: #9d7af0;
-    }
-    QPushButton[class="header-cta"]:pressed {
-        background-color: #242C3A;
-        border-color: #7c3aed;
-    }
-"""
-
-
-def _hex_to_rgba_015(hex_color: str) -> str:
-    """Convert #RRGGBB to 'r, g, b' for rgba(r, g, b, 0.15)."""
+def _with_alpha(hex_color: str, alpha: float) -> str:
+    """Convert #RRGGBB plus an alpha fraction to Qt's #AARRGGBB form (alpha comes first in Qt color strings)."""
     h = hex_color.lstrip("#")
     if len(h) != 6:
-        return "139, 92, 246"
-    r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-    return f"{r}, {g}, {b}"
+        h = "8b5cf6"
+    return f"#{round(alpha * 255):02x}{h}"
 
 
 def _theme_qss(
@@ -264,7 +72,6 @@ def _theme_qss(
     text_muted: str,
 ) -> str:
     """Build full QSS for a dark theme with given palette."""
-    rgba = _hex_to_rgba_015(accent)
     return f"""
     QWidget {{ background-color: {bg}; color: {text}; }}
     QLabel {{ color: {text}; font-size: 14px; background: transparent; }}
@@ -278,12 +85,12 @@ def _theme_qss(
         padding: 0; margin: 2px; background: transparent; border-radius: 10px;
     }}
     QListWidget::item:selected {{
-        background-color: rgba({rgba}, 0.16);
-        border: 1px solid rgba({rgba}, 0.35);
+        background-color: {_with_alpha(accent, 0.16)};
+        border: 1px solid {_with_alpha(accent, 0.35)};
         border-radius: 10px;
     }}
     QListWidget::item:hover:!selected {{
-        background-color: rgba(255, 255, 255, 0.06); border-radius: 10px;
+        background-color: #0fffffff; border-radius: 10px;
     }}
     QLineEdit, QSpinBox, QKeySequenceEdit, QPlainTextEdit {{
         background-color: {bg}; color: {text}; border: 1px solid {border};
@@ -322,21 +129,21 @@ def _theme_qss(
     QPushButton[class="action-primary"]:pressed {{ background-color: {accent_pressed}; border-color: {accent_pressed}; }}
     QPushButton[class="action-primary"]:disabled {{ background-color: #3f3f46; border-color: #3f3f46; color: #6b7280; }}
     QPushButton[class="action-secondary"] {{
-        background-color: rgba({rgba}, 0.08);
-        border: 1px solid rgba({rgba}, 0.45);
+        background-color: {_with_alpha(accent, 0.08)};
+        border: 1px solid {_with_alpha(accent, 0.45)};
         color: {text};
         border-radius: 12px; padding: 8px 16px; font-weight: 600;
     }}
     QPushButton[class="action-secondary"]:hover {{
-        background-color: rgba({rgba}, 0.16);
-        border-color: rgba({rgba}, 0.7);
+        background-color: {_with_alpha(accent, 0.16)};
+        border-color: {_with_alpha(accent, 0.7)};
     }}
     QPushButton[class="action-secondary"]:pressed {{
-        background-color: rgba({rgba}, 0.24);
+        background-color: {_with_alpha(accent, 0.24)};
     }}
     QPushButton[class="action-secondary"]:disabled {{
-        background-color: rgba({rgba}, 0.04);
-        border-color: rgba({rgba}, 0.2);
+        background-color: {_with_alpha(accent, 0.04)};
+        border-color: {_with_alpha(accent, 0.2)};
         color: #6b7280;
     }}
     QPushButton[class="subtle"] {{ background: transparent; border: none; color: {text_muted}; }}
@@ -384,7 +191,7 @@ def _theme_qss(
     }}
     QFrame#HeroHeader {{
         background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-            stop: 0 rgba({rgba}, 0.06), stop: 0.65 rgba({rgba}, 0.03), stop: 1 rgba({rgba}, 0.14));
+            stop: 0 {_with_alpha(accent, 0.06)}, stop: 0.65 {_with_alpha(accent, 0.03)}, stop: 1 {_with_alpha(accent, 0.14)});
         border: 1px solid {border};
         border-radius: 14px;
     }}
@@ -411,7 +218,7 @@ def _theme_qss(
     }}
     QFrame#HeaderGlow {{
         background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-            stop: 0 rgba({rgba}, 0.0), stop: 0.5 rgba({rgba}, 0.45), stop: 1 rgba({rgba}, 0.0));
+            stop: 0 {_with_alpha(accent, 0.0)}, stop: 0.5 {_with_alpha(accent, 0.45)}, stop: 1 {_with_alpha(accent, 0.0)});
         border-radius: 1px;
     }}
     QPushButton[class="header-cta"] {{
@@ -434,272 +241,225 @@ def _theme_qss(
     """
 
 
-# Full theme QSS: Ember (reds/oranges), Sea (blues), Emerald (greens)
-CONTROL_PANEL_EMBER_QSS = _theme_qss(
-    bg="#1a0f0a",
-    bg_panel="#251510",
-    border="#3d2318",
-    border_light="#4a2a1c",
-    accent="#ea580c",
-    accent_hover="#f97316",
-    accent_pressed="#c2410c",
-    text="#fef3e8",
-    text_muted="#d4a574",
-)
-CONTROL_PANEL_SEA_QSS = _theme_qss(
-    bg="#0a0f14",
-    bg_panel="#0f1820",
-    border="#1e3a4a",
-    border_light="#243d52",
-    accent="#0284c7",
-    accent_hover="#0ea5e9",
-    accent_pressed="#0369a1",
-    text="#e8f4fc",
-    text_muted="#7dd3fc",
-)
-CONTROL_PANEL_EMERALD_QSS = _theme_qss(
-    bg="#0a100d",
-    bg_panel="#0f1812",
-    border="#1a2e24",
-    border_light="#234a36",
-    accent="#059669",
-    accent_hover="#10b981",
-    accent_pressed="#047857",
-    text="#e8f5f0",
-    text_muted="#6ee7b7",
-)
-CONTROL_PANEL_CHERRY_QSS = _theme_qss(
-    bg="#1a0a12",
-    bg_panel="#251018",
-    border="#3d1a2a",
-    border_light="#4a2438",
-    accent="#db2777",
-    accent_hover="#ec4899",
-    accent_pressed="#be185d",
-    text="#fdf2f8",
-    text_muted="#f9a8d4",
-)
-CONTROL_PANEL_PASTEL_QSS = _theme_qss(
-    bg="#221e28",
-    bg_panel="#2a2532",
-    border="#3d3548",
-    border_light="#4a4058",
-    accent="#a78bfa",
-    accent_hover="#c4b5fd",
-    accent_pressed="#8b5cf6",
-    text="#f5f3ff",
-    text_muted="#c4b5fd",
-)
-CONTROL_PANEL_NEON_QSS = _theme_qss(
-    bg="#0d0208",
-    bg_panel="#1a0510",
-    border="#3d0a20",
-    border_light="#5c1530",
-    accent="#ff006e",
-    accent_hover="#ff2d92",
-    accent_pressed="#c71585",
-    text="#ffe4ec",
-    text_muted="#ff85c1",
-)
-CONTROL_PANEL_DUCKY_QSS = _theme_qss(
-    # Much brighter, more yellow overall
-    bg="#11100a",            # dark but with a warm yellow tint
-    bg_panel="#1b1809",      # slightly brighter panel
-    border="#4b3f16",        # warm golden-brown border
-    border_light="#5b4c1a",  # lighter border for hovers
-    accent="#fde047",        # very bright yellow
-    accent_hover="#facc15",  # strong ducky yellow
-    accent_pressed="#eab308",# deeper pressed yellow
-    text="#fefce8",          # soft off‑white
-    text_muted="#fef9c3",    # pale yellow for muted text
-)
-# Fashionably Late: rainbow theme — each accent role gets a different color (ROYGBV)
-CONTROL_PANEL_LATE_QSS = """
-    QWidget { background-color: #0f0f14; color: #f5f3ff; }
-    QLabel { color: #f5f3ff; font-size: 14px; background: transparent; }
-    QLabel[class="muted"] { color: #a1a1aa; font-size: 12px; }
-    QLabel[class="section"] { color: #ef4444; font-size: 12px; font-weight: bold; margin-top: 6px; margin-bottom: 2px; letter-spacing: 0.5px; }
-    QListWidget {
-        background-color: #0f0f14; border: 1px solid #27272a; border-radius: 12px;
-        padding: 6px; outline: none;
-    }
-    QListWidget::item {
-        padding: 0; margin: 2px; background: transparent; border-radius: 10px;
-    }
-    QListWidget::item:selected {
-        background-color: rgba(34, 197, 94, 0.16);
-        border: 1px solid rgba(34, 197, 94, 0.35);
-        border-radius: 10px;
-    }
-    QListWidget::item:hover:!selected {
-        background-color: rgba(255, 255, 255, 0.06); border-radius: 10px;
-    }
-    QLineEdit, QSpinBox, QKeySequenceEdit, QPlainTextEdit {
-        background-color: #0f0f14; color: #f5f3ff; border: 1px solid #27272a;
-        border-radius: 8px; padding: 8px 12px; min-height: 24px; font-size: 14px;
-    }
-    QLineEdit:focus, QSpinBox:focus, QKeySequenceEdit:focus { border-color: #8b5cf6; }
-    QSlider::groove:horizontal {
-        height: 6px; background: #27272a; border-radius: 3px;
-    }
-    QSlider::handle:horizontal {
-        width: 14px; margin: -4px 0; background: #f97316; border-radius: 7px;
-    }
-    QSlider::handle:horizontal:hover { background: #fb923c; }
-    QPushButton {
-        background-color: #18181b; color: #f5f3ff; border: 1px solid #27272a;
-        border-radius: 10px; padding: 8px 14px; min-height: 24px; font-size: 13px;
-    }
-    QPushButton:hover { background-color: #27272a; border-color: #8b5cf6; color: #f5f3ff; }
-    QPushButton:pressed { background-color: #3f3f46; }
-    QPushButton:disabled { color: #6b7280; }
-    QPushButton[class="primary"] {
-        background-color: #eab308; border-color: #eab308; color: #0f0f14;
-    }
-    QPushButton[class="primary"]:hover {
-        background-color: #facc15; border-color: #facc15; color: #0f0f14;
-    }
-    QPushButton[class="primary"]:pressed { background-color: #ca8a04; border-color: #ca8a04; }
-    QPushButton[class="primary"]:disabled { background-color: #3f3f46; border-color: #3f3f46; color: #6b7280; }
-    QPushButton[class="subtle"] { background: transparent; border: none; color: #a1a1aa; }
-    QPushButton[class="subtle"]:hover { color: #8b5cf6; }
-    QPushButton[class="destructive"]:hover { border-color: #c62828; color: #ef5350; }
-    QPushButton[class="compact"] { font-size: 12px; padding: 6px 12px; min-height: 22px; }
-    QScrollArea { border: none; background: transparent; }
-    QScrollArea > QWidget > QWidget { background: transparent; }
-    QTabWidget::pane {
-        border: 1px solid #27272a;
-        border-radius: 12px; background: #0f0f14;
-        margin-top: 6px; padding: 12px 14px 18px 14px;
-    }
-    QTabBar {
-        background: #18181b;
-        border: 1px solid #27272a;
-        border-radius: 12px;
-        padding: 4px;
-    }
-    QTabBar::tab {
-        background: transparent; color: #a1a1aa;
-        padding: 8px 16px; margin-right: 4px;
-        border: none;
-        border-radius: 8px; font-size: 13px;
-    }
-    QTabBar::tab:selected {
-        background: #3b82f6; color: #E7EAF0;
-    }
-    QTabBar::tab:hover:!selected {
-        background: #27272a; color: #f5f3ff;
-    }
-    QFrame#HeroHeader {
-        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-            stop: 0 rgba(168, 85, 247, 0.06), stop: 0.65 rgba(168, 85, 247, 0.03), stop: 1 rgba(168, 85, 247, 0.14));
-        border: 1px solid #27272a;
-        border-radius: 14px;
-    }
-    QLabel#HeaderIcon {
-        background: transparent;
-        border: none;
-        padding: 0;
-    }
-    QLabel[class="header-title"] {
-        font-size: 16px;
-        font-weight: 700;
-        margin: 0;
-        padding: 0;
-    }
-    QLabel[class="header-subtitle"] {
-        font-size: 11px;
-        color: #a1a1aa;
-        margin: -2px 0 0 0;
-        padding: 0;
-    }
-    QLabel[class="header-meta"] {
-        font-size: 11px;
-        color: #a1a1aa;
-    }
-    QFrame#HeaderGlow {
-        background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-            stop: 0 rgba(168, 85, 247, 0.0), stop: 0.5 rgba(168, 85, 247, 0.45), stop: 1 rgba(168, 85, 247, 0.0));
-        border-radius: 1px;
-    }
-    QPushButton[class="header-cta"] {
-        background-color: #18181b;
-        border: 1px solid #a855f7;
-        color: #f5f3ff;
-        border-radius: 10px;
-        padding: 6px 14px;
-        font-size: 12px;
-        font-weight: 600;
-    }
-    QPushButton[class="header-cta"]:hover {
-        background-color: #27272a;
-        border-color: #c084fc;
-    }
-    QPushButton[class="header-cta"]:pressed {
-        background-color: #3f3f46;
-        border-color: #a855f7;
-    }
-    """
+_THEMES_DIR = Path(__file__).resolve().parent.parent / "resources" / "themes"
+
+# Themes built from _theme_qss; dark, light and late are hand-written files in resources/themes.
+_THEME_QSS_PARAMS: dict[str, dict[str, str]] = {
+    # Ember (reds/oranges), Sea (blues), Emerald (greens)
+    "ember": dict(
+        bg="#1a0f0a",
+        bg_panel="#251510",
+        border="#3d2318",
+        border_light="#4a2a1c",
+        accent="#ea580c",
+        accent_hover="#f97316",
+        accent_pressed="#c2410c",
+        text="#fef3e8",
+        text_muted="#d4a574",
+    ),
+    "sea": dict(
+        bg="#0a0f14",
+        bg_panel="#0f1820",
+        border="#1e3a4a",
+        border_light="#243d52",
+        accent="#0284c7",
+        accent_hover="#0ea5e9",
+        accent_pressed="#0369a1",
+        text="#e8f4fc",
+        text_muted="#7dd3fc",
+    ),
+    "emerald": dict(
+        bg="#0a100d",
+        bg_panel="#0f1812",
+        border="#1a2e24",
+        border_light="#234a36",
+        accent="#059669",
+        accent_hover="#10b981",
+        accent_pressed="#047857",
+        text="#e8f5f0",
+        text_muted="#6ee7b7",
+    ),
+    "cherry": dict(
+        bg="#1a0a12",
+        bg_panel="#251018",
+        border="#3d1a2a",
+        border_light="#4a2438",
+        accent="#db2777",
+        accent_hover="#ec4899",
+        accent_pressed="#be185d",
+        text="#fdf2f8",
+        text_muted="#f9a8d4",
+    ),
+    "pastel": dict(
+        bg="#221e28",
+        bg_panel="#2a2532",
+        border="#3d3548",
+        border_light="#4a4058",
+        accent="#a78bfa",
+        accent_hover="#c4b5fd",
+        accent_pressed="#8b5cf6",
+        text="#f5f3ff",
+        text_muted="#c4b5fd",
+    ),
+    "neon": dict(
+        bg="#0d0208",
+        bg_panel="#1a0510",
+        border="#3d0a20",
+        border_light="#5c1530",
+        accent="#ff006e",
+        accent_hover="#ff2d92",
+        accent_pressed="#c71585",
+        text="#ffe4ec",
+        text_muted="#ff85c1",
+    ),
+    "ducky": dict(
+        # Much brighter, more yellow overall
+        bg="#11100a",            # dark but with a warm yellow tint
+        bg_panel="#1b1809",      # slightly brighter panel
+        border="#4b3f16",        # warm golden-brown border
+        border_light="#5b4c1a",  # lighter border for hovers
+        accent="#fde047",        # very bright yellow
+        accent_hover="#facc15",  # strong ducky yellow
+        accent_pressed="#eab308",# deeper pressed yellow
+        text="#fefce8",          # soft off‑white
+        text_muted="#fef9c3",    # pale yellow for muted text
+    ),
+    # Fire Nation: red theme throughout
+    "fire": dict(
+        bg="#140808",
+        bg_panel="#220a0a",
+        border="#3d1515",
+        border_light="#5c2020",
+        accent="#dc2626",
+        accent_hover="#f87171",
+        accent_pressed="#b91c1c",
+        text="#fef2f2",
+        text_muted="#fca5a5",
+    ),
+    # Galaxy: deep space purples and blues
+    "galaxy": dict(
+        bg="#0d0a14",
+        bg_panel="#151020",
+        border="#2a2040",
+        border_light="#3a3050",
+        accent="#7c3aed",
+        accent_hover="#a78bfa",
+        accent_pressed="#5b21b6",
+        text="#f5f3ff",
+        text_muted="#a78bfa",
+    ),
+}
 
-# Fire Nation: red theme throughout
-CONTROL_PANEL_FIRE_QSS = _theme_qss(
-    bg="#140808",
-    bg_panel="#220a0a",
-    border="#3d1515",
-    border_light="#5c2020",
-    accent="#dc2626",
-    accent_hover="#f87171",
-    accent_pressed="#b91c1c",
-    text="#fef2f2",
-    text_muted="#fca5a5",
-)
 
-# Galaxy: deep space purples and blues
-CONTROL_PANEL_GALAXY_QSS = _theme_qss(
-    bg="#0d0a14",
-    bg_panel="#151020",
-    border="#2a2040",
-    border_light="#3a3050",
-    accent="#7c3aed",
-    accent_hover="#a78bfa",
-    accent_pressed="#5b21b6",
-    text="#f5f3ff",
-    text_muted="#a78bfa",
-)
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
+_QSS_PUNCT_RE = re.compile(r"\s*([{}:;,])\s*")
+
 
-# Per-theme colors for widgets that use setStyleSheet (list item icons, badge, etc.)
-THEME_COLORS: dict[ThemeType, tuple[str, str, str, str]] = {
-    "dark": ("#8B5CF6", "#9d7af0", "#AAB2C0", "139, 92, 246"),
-    "light": ("#6366f1", "#818cf8", "#64748b", "99, 102, 241"),
-    "ember": ("#ea580c", "#f97316", "#d4a574", "234, 88, 12"),
-    "sea": ("#0284c7", "#0ea5e9", "#7dd3fc", "2, 132, 199"),
-    "emerald": ("#059669", "#10b981", "#6ee7b7", "5, 150, 105"),
-    "cherry": ("#db2777", "#ec4899", "#f9a8d4", "219, 39, 119"),
-    "pastel": ("#a78bfa", "#c4b5fd", "#c4b5fd", "167, 139, 250"),
-    "neon": ("#ff006e", "#ff2d92", "#ff85c1", "255, 0, 110"),
-    "late": ("#a855f7", "#c084fc", "#c4b5fd", "168, 85, 247"),
-    "fire": ("#dc2626", "#f87171", "#fca5a5", "220, 38, 38"),
-    "galaxy": ("#7c3aed", "#a78bfa", "#a78bfa", "124, 58, 237"),
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt's stylesheet parser has less to walk."""
+    qss = _QSS_COMMENT_RE.sub("", qss)
+    qss = _QSS_SPACE_RE.sub(" ", qss)
+    return _QSS_PUNCT_RE.sub(r"\1", qss).strip()
+
+
+@functools.lru_cache(maxsize=3)
+def _load_theme_qss(name: str) -> str:
+    """Minified QSS for a theme, built or read from resources/themes on first use; only recent themes stay resident."""
+    params = _THEME_QSS_PARAMS.get(name)
+    if params is not None:
+        qss = _theme_qss(**params)
+    else:
+        path = _THEMES_DIR / f"{name}.qss"
+        if not path.exists():
+            path = _THEMES_DIR / "dark.qss"
+        qss = path.read_text(encoding="utf-8")
+    return _minify_qss(qss + _row_qss(THEME_PALETTES.get(name, THEME_PALETTES["dark"])))
+
+
+def apply_theme(widget: QWidget, theme: ThemeType) -> bool:
+    """Set the theme stylesheet on widget unless that theme is already applied. Returns True if it changed."""
+    if theme not in VALID_THEMES:
+        theme = "dark"
+    if widget.property("_applied_theme") == theme:
+        return False
+    widget.setStyleSheet(_load_theme_qss(theme))
+    widget.setProperty("_applied_theme", theme)
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class ThemePalette:
+    """Per-theme colors for the generated widget rules appended to the theme QSS (list row icons, badge, etc.)."""
+
+    accent: str
+    accent_hover: str
+    text_muted: str
+    rgba: str  # accent as "r, g, b" for rgba(...)
+
+
+THEME_PALETTES: dict[ThemeType, ThemePalette] = {
+    "dark": ThemePalette("#8B5CF6", "#9d7af0", "#AAB2C0", "139, 92, 246"),
+    "light": ThemePalette("#6366f1", "#818cf8", "#64748b", "99, 102, 241"),
+    "ember": ThemePalette("#ea580c", "#f97316", "#d4a574", "234, 88, 12"),
+    "sea": ThemePalette("#0284c7", "#0ea5e9", "#7dd3fc", "2, 132, 199"),
+    "emerald": ThemePalette("#059669", "#10b981", "#6ee7b7", "5, 150, 105"),
+    "cherry": ThemePalette("#db2777", "#ec4899", "#f9a8d4", "219, 39, 119"),
+    "pastel": ThemePalette("#a78bfa", "#c4b5fd", "#c4b5fd", "167, 139, 250"),
+    "neon": ThemePalette("#ff006e", "#ff2d92", "#ff85c1", "255, 0, 110"),
+    "late": ThemePalette("#a855f7", "#c084fc", "#c4b5fd", "168, 85, 247"),
+    "fire": ThemePalette("#dc2626", "#f87171", "#fca5a5", "220, 38, 38"),
+    "galaxy": ThemePalette("#7c3aed", "#a78bfa", "#a78bfa", "124, 58, 237"),
     # Ducky: lots of bright yellow for icons/badges/accents
-    "ducky": ("#fde047", "#facc15", "#fef9c3", "253, 224, 71"),
+    "ducky": ThemePalette("#fde047", "#facc15", "#fef9c3", "253, 224, 71"),
 }
 
 
-def _section_header(text: str) -> QLabel:
-    out = QLabel(text)
+def _row_qss(palette: ThemePalette) -> str:
+    """Overlay list row and accent widget rules, appended to the panel theme so they need no inline stylesheets."""
+    return f"""
+OverlayListItemWidget {{ qproperty-accentColor: {palette.accent}; qproperty-mutedColor: {palette.text_muted}; qproperty-hoverColor: {palette.accent_hover}; }}
+QToolButton#ShowControls {{ color: {palette.accent}; border: none; background: transparent; min-width: 28px; min-height: 28px; }}
+QToolButton#ShowControls:checked {{ color: {palette.accent}; }}
+QToolButton#ShowControls:hover {{ color: {palette.accent_hover}; }}
+QLabel#ToggleTools {{ color: {palette.text_muted}; font-size: 13px; }}
+QLabel#OverlayTypeBadge {{ background-color: rgba({palette.rgba}, 0.3); color: {palette.accent}; padding: 3px 10px; border-radius: 6px; font-size: 11px; font-weight: bold; }}
+QLabel#HotkeyHint, QLabel#ClickThroughHint {{ color: {palette.text_muted}; font-size: 12px; }}
+"""
+
+
+def _section_header(text: str, parent: Optional[QWidget] = None) -> QLabel:
+    out = QLabel(text, parent)
     out.setProperty("class", "section")
     return out
 
 
-def _divider() -> QFrame:
-    line = QFrame()
+def _divider(parent: Optional[QWidget] = None) -> QFrame:
+    line = QFrame(parent)
     line.setFrameShape(QFrame.HLine)
     line.setProperty("class", "divider")
     line.setFixedHeight(1)
     return line
 
 
+@functools.lru_cache(maxsize=32)
+def _key_sequence(text: str = "") -> QKeySequence:
+    """Parsed key sequence for a hotkey string, shared since the edits only copy it ("" is the empty sequence)."""
+    return QKeySequence(text)
+
+
+def _set_sequence_quiet(edit: QKeySequenceEdit, seq: QKeySequence) -> None:
+    """Set a key sequence programmatically without emitting keySequenceChanged/editingFinished."""
+    # A normalized hotkey (e.g. different case) often parses to the sequence the edit already holds
+    if edit.keySequence() == seq:
+        return
+    with QSignalBlocker(edit):
+        edit.setKeySequence(seq)
+
+
+@functools.lru_cache(maxsize=1)
 def _header_icon_pixmap() -> QPixmap:
+    """Branding image for the header, decoded from disk once per process."""
     base = Path(__file__).resolve().parent.parent
     for name in ("shastas_projector.png", "projectoricon.png"):
         path = base / "resources" / name
@@ -710,6 +470,17 @@ def _header_icon_pixmap() -> QPixmap:
     return QPixmap()
 
 
+def _header_icon_scaled(pix: QPixmap, w: int, h: int) -> QPixmap:
+    """Header icon smooth-scaled to fit w x h; each size is scaled once and then served from QPixmapCache."""
+    key = f"header_icon_{w}x{h}"
+    out = QPixmap()
+    if QPixmapCache.find(key, out):
+        return out
+    out = pix.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, out)
+    return out
+
+
 # Font Awesome 6/7 solid (fa-solid-900) Unicode PUA codepoints
 FA_EYE = "\uf06e"
 FA_EYE_SLASH = "\uf070"
@@ -729,84 +500,73 @@ FA_TOGGLE_OFF = "\uf204"
 # Use Unicode GEAR (U+2699) with default font so a gear always displays.
 GEAR_CHAR = "\u2699"
 
-_FONT_AWESOME_FAMILY: Optional[str] = None
-_FONT_AWESOME_REGULAR_FAMILY: Optional[str] = None
 
+_FONTS_DIR = Path(__file__).resolve().parent.parent / "resources" / "fonts"
+
+# Preferred Font Awesome files per variant (exact names first, then any matching *Solid*900* / *Regular*400*)
+_FA_CANDIDATES: dict[str, tuple[Path, ...]] = {
+    "solid": (
+        _FONTS_DIR / "Font Awesome 7 Free-Solid-900.otf",
+        _FONTS_DIR / "fa-solid-900.otf",
+        _FONTS_DIR / "fa-solid-900.ttf",
+        _FONTS_DIR.parent / "fa-solid-900.ttf",
+    ),
+    "regular": (
+        _FONTS_DIR / "Font Awesome 7 Free-Regular-400.otf",
+        _FONTS_DIR / "fa-regular-400.otf",
+        _FONTS_DIR / "fa-regular-400.ttf",
+    ),
+}
+# (required stem keywords, excluded stem keywords) for the fallback directory scan
+_FA_STEM_KEYWORDS: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "solid": (("solid", "900"), ()),
+    "regular": (("regular", "400"), ("solid",)),
+}
 
-def _load_font_awesome() -> Optional[str]:
-    """Load Font Awesome Solid from overlay_app/resources/fonts. Returns family name or None."""
-    global _FONT_AWESOME_FAMILY
-    if _FONT_AWESOME_FAMILY is not None:
-        return _FONT_AWESOME_FAMILY
-    base = Path(__file__).resolve().parent.parent
-    fonts_dir = base / "resources" / "fonts"
-    # Prefer Solid font (exact names first, then any *Solid*900*)
-    candidates = [
-        fonts_dir / "Font Awesome 7 Free-Solid-900.otf",
-        fonts_dir / "fa-solid-900.otf",
-        fonts_dir / "fa-solid-900.ttf",
-        base / "resources" / "fa-solid-900.ttf",
-    ]
-    for path in candidates:
-        if path.exists():
-            fid = QFontDatabase.addApplicationFont(str(path))
-            if fid != -1:
-                families = QFontDatabase.applicationFontFamilies(fid)
-                if families:
-                    _FONT_AWESOME_FAMILY = families[0]
-                    return _FONT_AWESOME_FAMILY
-    # Fallback: any font in fonts/ whose name suggests Solid 900
-    if fonts_dir.exists():
-        for path in fonts_dir.iterdir():
-            if path.suffix.lower() in (".otf", ".ttf") and "solid" in path.stem.lower() and "900" in path.stem:
-                fid = QFontDatabase.addApplicationFont(str(path))
-                if fid != -1:
-                    families = QFontDatabase.applicationFontFamilies(fid)
-                    if families:
-                        _FONT_AWESOME_FAMILY = families[0]
-                        return _FONT_AWESOME_FAMILY
-    return None
 
+def _add_font_family(path: Path) -> Optional[str]:
+    fid = QFontDatabase.addApplicationFont(str(path))
+    if fid == -1:
+        return None
+    families = QFontDatabase.applicationFontFamilies(fid)
+    return families[0] if families else None
 
-def _load_font_awesome_regular() -> Optional[str]:
-    """Load Font Awesome Regular from overlay_app/resources/fonts. Returns family name or None."""
-    global _FONT_AWESOME_REGULAR_FAMILY
-    if _FONT_AWESOME_REGULAR_FAMILY is not None:
-        return _FONT_AWESOME_REGULAR_FAMILY
-    base = Path(__file__).resolve().parent.parent
-    fonts_dir = base / "resources" / "fonts"
-    candidates = [
-        fonts_dir / "Font Awesome 7 Free-Regular-400.otf",
-        fonts_dir / "fa-regular-400.otf",
-        fonts_dir / "fa-regular-400.ttf",
-    ]
-    for path in candidates:
+
+@functools.cache
+def _load_fa(variant: Literal["solid", "regular"]) -> Optional[str]:
+    """Load a Font Awesome variant from overlay_app/resources/fonts (once). Returns family name or None."""
+    for path in _FA_CANDIDATES[variant]:
         if path.exists():
-            fid = QFontDatabase.addApplicationFont(str(path))
-            if fid != -1:
-                families = QFontDatabase.applicationFontFamilies(fid)
-                if families:
-                    _FONT_AWESOME_REGULAR_FAMILY = families[0]
-                    return _FONT_AWESOME_REGULAR_FAMILY
-    if fonts_dir.exists():
-        for path in fonts_dir.iterdir():
-            if path.suffix.lower() in (".otf", ".ttf") and "regular" in path.stem.lower() and "400" in path.stem and "solid" not in path.stem.lower():
-                fid = QFontDatabase.addApplicationFont(str(path))
-                if fid != -1:
-                    families = QFontDatabase.applicationFontFamilies(fid)
-                    if families:
-                        _FONT_AWESOME_REGULAR_FAMILY = families[0]
-                        return _FONT_AWESOME_REGULAR_FAMILY
+            family = _add_font_family(path)
+            if family:
+                return family
+    if _FONTS_DIR.exists():
+        required, excluded = _FA_STEM_KEYWORDS[variant]
+        for path in _FONTS_DIR.iterdir():
+            stem = path.stem.lower()
+            if path.suffix.lower() not in (".otf", ".ttf"):
+                continue
+            if all(k in stem for k in required) and not any(k in stem for k in excluded):
+                family = _add_font_family(path)
+                if family:
+                    return family
     return None
 
 
+def preload_fonts() -> None:
+    """Register the Font Awesome fonts up front (call once the QApplication exists, before building widgets)."""
+    _load_fa("solid")
+    _load_fa("regular")
+
+
 # Explicit point sizes for icon fonts; QFont(family) uses pointSize -1 by default and triggers Qt warning on setFont/hover.
 _ICON_FONT_POINT_SIZE = 10
 
 
+@functools.cache
 def _icon_font() -> QFont:
-    """QFont for Font Awesome icons; use constructor with point size so Qt never sees -1."""
-    fa = _load_font_awesome()
+    """Shared QFont for Font Awesome icons (setFont copies it; don't mutate). Point size set so Qt never sees -1."""
+    fa = _load_fa("solid")
     if fa:
         f = QFont(fa, _ICON_FONT_POINT_SIZE)
     else:
@@ -815,9 +575,10 @@ def _icon_font() -> QFont:
     return f
 
 
+@functools.cache
 def _icon_font_regular() -> QFont:
-    """QFont for Font Awesome Regular (e.g. window-maximize). Use constructor with point size so Qt never sees -1."""
-    fa = _load_font_awesome_regular()
+    """Shared QFont for Font Awesome Regular (e.g. window-maximize); same caching rules as _icon_font."""
+    fa = _load_fa("regular")
     if fa:
         f = QFont(fa, _ICON_FONT_POINT_SIZE)
     else:
@@ -826,6 +587,48 @@ def _icon_font_regular() -> QFont:
     return f
 
 
+def _fa_pixmap(ch: str, color: str, px: int, regular: bool = False, dpr: float = 1.0) -> QPixmap:
+    """Font Awesome glyph rasterized once onto a transparent px x px pixmap and kept in QPixmapCache."""
+    key = f"fa:{ord(ch):x}:{color}:{px}:{int(regular)}:{dpr:g}"
+    pix = QPixmap()
+    if QPixmapCache.find(key, pix):
+        return pix
+    pix = QPixmap(round(px * dpr), round(px * dpr))
+    pix.setDevicePixelRatio(dpr)
+    pix.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pix)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(_icon_font_regular() if regular else _icon_font())
+    painter.setPen(QColor(color))
+    painter.drawText(QRect(0, 0, px, px), Qt.AlignmentFlag.AlignCenter, ch)
+    painter.end()
+    QPixmapCache.insert(key, pix)
+    return pix
+
+
+@functools.lru_cache(maxsize=64)
+def _fa_toggle_icon(on_ch: str, off_ch: str, muted: str, accent: str, hover: str, dpr: float) -> QIcon:
+    """Checkable tool-button icon: accent glyph when checked, muted when not, hover color on mouse-over."""
+    icon = QIcon()
+    icon.addPixmap(_fa_pixmap(on_ch, accent, 16, dpr=dpr), QIcon.Mode.Normal, QIcon.State.On)
+    icon.addPixmap(_fa_pixmap(off_ch, muted, 16, dpr=dpr), QIcon.Mode.Normal, QIcon.State.Off)
+    icon.addPixmap(_fa_pixmap(on_ch, hover, 16, dpr=dpr), QIcon.Mode.Active, QIcon.State.On)
+    icon.addPixmap(_fa_pixmap(off_ch, hover, 16, dpr=dpr), QIcon.Mode.Active, QIcon.State.Off)
+    return icon
+
+
+@functools.cache
+def _row_text_fonts() -> tuple[QFont, QFont, QFontMetrics, QFontMetrics]:
+    """Overlay row name/subtitle fonts and their metrics; the fonts never change, so every row shares one set."""
+    name_font = QFont()
+    name_font.setPixelSize(14)
+    name_font.setBold(True)
+    # Explicit font with positive point size so stylesheet/hover never triggers QFont::setPointSize(-1) warning
+    sub_font = QFont()
+    sub_font.setPointSize(11)
+    return name_font, sub_font, QFontMetrics(name_font), QFontMetrics(sub_font)
+
+
 def _type_icon_char(overlay_type: str, capture_mode: str = "region") -> str:
     """Return Font Awesome character for overlay type: web=globe, image=image, region=object-group, window=window-maximize."""
     if overlay_type == "web":
@@ -856,6 +659,9 @@ THEME_DISPLAY_ORDER: list[tuple[str, ThemeType]] = [
     ("Galaxy", "galaxy"),
     ("Ducky", "ducky"),
 ]
+_THEME_LABELS: tuple[str, ...] = tuple(t[0] for t in THEME_DISPLAY_ORDER)
+_THEME_VALUES: tuple[ThemeType, ...] = tuple(t[1] for t in THEME_DISPLAY_ORDER)
+_THEME_INDEX: dict[ThemeType, int] = {v: i for i, v in enumerate(_THEME_VALUES)}
 
 
 class SettingsDialog(QDialog):
@@ -881,10 +687,8 @@ class SettingsDialog(QDialog):
 
         # Theme selector
         self._theme_combo = QComboBox()
-        theme_values = [t[1] for t in THEME_DISPLAY_ORDER]
-        self._theme_combo.addItems([t[0] for t in THEME_DISPLAY_ORDER])
-        idx = theme_values.index(current_theme) if current_theme in theme_values else 0
-        self._theme_combo.setCurrentIndex(idx)
+        self._theme_combo.addItems(list(_THEME_LABELS))
+        self._theme_combo.setCurrentIndex(_THEME_INDEX.get(current_theme, 0))
         self._theme_combo.currentIndexChanged.connect(self._on_theme_selected)
         form.addRow("Theme", self._theme_combo)
 
@@ -901,22 +705,23 @@ class SettingsDialog(QDialog):
         self.setMinimumWidth(280)
 
     def _on_theme_selected(self, index: int) -> None:
-        theme_values = [t[1] for t in THEME_DISPLAY_ORDER]
-        if 0 <= index < len(theme_values):
-            self._on_theme_changed(theme_values[index])
+        if 0 <= index < len(_THEME_VALUES):
+            self._on_theme_changed(_THEME_VALUES[index])
 
     def _on_keep_on_top_toggled(self, checked: bool) -> None:
         self._on_keep_on_top_changed(checked)
 
 
+_ROW_TOOL_TIPS = ("Toggle visibility", "Lock movement / Unlock movement", "Toggle click-through")
+
+
 class OverlayListItemWidget(QWidget):
-    """Row widget: type icon + overlay name + subtitle + trash + visible/locked/click-through icon buttons."""
+    """Row widget: painted type icon + overlay name + subtitle, then painted visible/locked/click-through toggles."""
 
-    _ICON_STYLE = (
-        "QToolButton { color: #AAB2C0; border: none; background: transparent; min-width: 24px; min-height: 24px; } "
-        "QToolButton:checked { color: #8B5CF6; } "
-        "QToolButton:hover { color: #E7EAF0; }"
-    )
+    # (overlay_id, checked) when the user clicks one of the row's toggles
+    visibleToggled = Signal(str, bool)
+    lockedToggled = Signal(str, bool)
+    clickThroughToggled = Signal(str, bool)
 
     def __init__(
         self,
@@ -928,172 +733,315 @@ class OverlayListItemWidget(QWidget):
         visible: bool,
         locked: bool,
         click_through: bool,
-        on_visible_toggled,
-        on_locked_toggled,
-        on_click_through_toggled,
         parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
         self._overlay_id = overlay_id
-        self._visible = visible
-        self._locked = locked
-        self._click_through = click_through
-        icon_font = _icon_font()
-        type_char = _type_icon_char(overlay_type, capture_mode)
-        use_regular = _type_icon_use_regular(overlay_type, capture_mode)
-        type_font = _icon_font_regular() if use_regular else icon_font
-
-        self._type_icon_label = QLabel(type_char)
-        self._type_icon_label.setFont(type_font)
-        self._type_icon_label.setStyleSheet("color: #8B5CF6; min-width: 20px;")
-        self._type_icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._type_icon_label.setFixedWidth(24)
+        # Type icon, name and subtitle are painted in paintEvent rather than held in child QLabels
+        self._type_char = _type_icon_char(overlay_type, capture_mode)
+        self._type_regular = _type_icon_use_regular(overlay_type, capture_mode)
+        self._accent_color = QColor("#8B5CF6")
+        self._muted_color = QColor("#AAB2C0")
+        self._hover_color = QColor("#E7EAF0")
 
         self._full_name = name
         self._full_subtitle = subtitle
-        self._name_label = QLabel(name)
-        self._name_label.setStyleSheet("font-weight: bold;")
-        self._name_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        self._subtitle_label = QLabel(subtitle)
-        self._subtitle_label.setProperty("class", "muted")
-        # Explicit font with positive point size so stylesheet/hover never triggers QFont::setPointSize(-1) warning
-        sub_font = QFont()
-        sub_font.setPointSize(11)
-        self._subtitle_label.setFont(sub_font)
-        self._subtitle_label.setStyleSheet("color: #AAB2C0; font-weight: normal;")
-        self._subtitle_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self._name_text = name
+        self._subtitle_text = subtitle
+        self._name_font, self._sub_font, self._fm_name, self._fm_sub = _row_text_fonts()
         self._detail_tooltip = ""  # set via set_detail_tooltip(); full URL/region on hover
-
-        self._btn_visible = QToolButton()
-        self._btn_visible.setCheckable(True)
-        self._btn_visible.setChecked(visible)
-        self._btn_visible.setFont(icon_font)
-        self._btn_visible.setStyleSheet(self._ICON_STYLE)
-        self._btn_visible.setToolTip("Toggle visibility")
-        self._btn_visible.setFixedWidth(28)
-        self._btn_visible.toggled.connect(on_visible_toggled)
-        self._btn_visible.toggled.connect(self._update_icons)
-
-        self._btn_locked = QToolButton()
-        self._btn_locked.setCheckable(True)
-        self._btn_locked.setChecked(locked)
-        self._btn_locked.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextOnly)
-        self._btn_locked.setFont(icon_font)
-        self._btn_locked.setStyleSheet(self._ICON_STYLE)
-        self._btn_locked.setToolTip("Lock movement / Unlock movement")
-        self._btn_locked.setFixedWidth(28)
-        self._btn_locked.toggled.connect(on_locked_toggled)
-        self._btn_locked.toggled.connect(self._update_icons)
-
-        self._btn_click_through = QToolButton()
-        self._btn_click_through.setCheckable(True)
-        self._btn_click_through.setChecked(click_through)
-        self._btn_click_through.setFont(icon_font)
-        self._btn_click_through.setStyleSheet(self._ICON_STYLE)
-        self._btn_click_through.setToolTip("Toggle click-through")
-        self._btn_click_through.setFixedWidth(28)
-        self._btn_click_through.toggled.connect(on_click_through_toggled)
-        self._btn_click_through.toggled.connect(self._update_icons)
-
+        # Coalesce resize bursts (splitter/panel drags) into one elide pass per event-loop tick
+        self._elided_width = -1
+        self._elide_timer = QTimer(self)
+        self._elide_timer.setSingleShot(True)
+        self._elide_timer.setInterval(0)
+        self._elide_timer.timeout.connect(self._on_elide_timer)
+
+        # The three toggles are painted and hit-tested in this widget (see _tool_rect) rather than being child QToolButtons
+        self._checked = [visible, locked, click_through]
+        self._tool_signals = (self.visibleToggled, self.lockedToggled, self.clickThroughToggled)
+        self._tool_icons: tuple[QIcon, ...] = ()
+        self._hover_tool = -1
+        self._pressed_tool = -1
+        self._tools_visible = True
+        self.setMouseTracking(True)  # hover swaps a toggle to its Active (hover color) icon
         self._update_icons()
-
-        text_col = QVBoxLayout()
-        text_col.setSpacing(2)
-        text_col.setContentsMargins(0, 0, 0, 0)
-        text_col.addWidget(self._name_label)
-        text_col.addWidget(self._subtitle_label)
-        layout = QHBoxLayout()
-        layout.setContentsMargins(8, 6, 8, 6)
-        layout.setSpacing(8)
-        layout.addWidget(self._type_icon_label)
-        layout.addLayout(text_col)
-        layout.addStretch(1)
-        layout.addSpacing(8)
-        layout.addWidget(self._btn_visible)
-        layout.addWidget(self._btn_locked)
-        layout.addWidget(self._btn_click_through)
-        self.setLayout(layout)
-        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Policy.Fixed)
+        self.setFixedHeight(52)
 
     def sizeHint(self) -> QSize:
         """Fixed height so list rows don't stretch; comfortable for name + sub row."""
         return QSize(200, 52)
 
+    def _tool_rect(self, index: int) -> QRect:
+        """Toggle cell (0 visible, 1 locked, 2 click-through): right-aligned 28px squares with 8px gaps, vertically centered."""
+        return QRect(self.width() - 108 + 36 * index, (self.height() - 28) // 2, 28, 28)
+
+    def _tool_at(self, pos: QPoint) -> int:
+        if self._tools_visible:
+            for index in range(3):
+                if self._tool_rect(index).contains(pos):
+                    return index
+        return -1
+
+    def _set_hover_tool(self, index: int) -> None:
+        if index != self._hover_tool:
+            self._hover_tool = index
+            self.update()
+
+    def _set_checked(self, index: int, checked: bool) -> None:
+        if self._checked[index] != checked:
+            self._checked[index] = checked
+            self.update(self._tool_rect(index))
+
+    # Theme colors, set from the stylesheet via qproperty-accentColor / qproperty-mutedColor / qproperty-hoverColor
+    def _get_accent_color(self) -> QColor:
+        return self._accent_color
+
+    def _set_accent_color(self, color: QColor) -> None:
+        if color == self._accent_color:
+            return
+        self._accent_color = QColor(color)
+        self._update_icons()
+        self.update()
+
+    def _get_muted_color(self) -> QColor:
+        return self._muted_color
+
+    def _set_muted_color(self, color: QColor) -> None:
+        if color == self._muted_color:
+            return
+        self._muted_color = QColor(color)
+        self._update_icons()
+        self.update()
+
+    def _get_hover_color(self) -> QColor:
+        return self._hover_color
+
+    def _set_hover_color(self, color: QColor) -> None:
+        if color == self._hover_color:
+            return
+        self._hover_color = QColor(color)
+        self._update_icons()
+        self.update()
+
+    accentColor = Property(QColor, _get_accent_color, _set_accent_color)
+    mutedColor = Property(QColor, _get_muted_color, _set_muted_color)
+    hoverColor = Property(QColor, _get_hover_color, _set_hover_color)
+
     def _update_icons(self) -> None:
-        self._btn_visible.setText(FA_EYE if self._btn_visible.isChecked() else FA_EYE_SLASH)
-        self._btn_locked.setText(FA_LOCK if self._btn_locked.isChecked() else FA_UNLOCK)
-        self._btn_click_through.setText(FA_BORDER_NONE if self._btn_click_through.isChecked() else FA_HAND_POINTER)
+        """Build each toggle's checked/unchecked icon for the current colors; paintEvent picks the state and hover mode."""
+        colors = (self._muted_color.name(), self._accent_color.name(), self._hover_color.name(), self.devicePixelRatioF())
+        self._tool_icons = (
+            _fa_toggle_icon(FA_EYE, FA_EYE_SLASH, *colors),
+            _fa_toggle_icon(FA_LOCK, FA_UNLOCK, *colors),
+            _fa_toggle_icon(FA_BORDER_NONE, FA_HAND_POINTER, *colors),
+        )
 
     def set_name(self, name: str) -> None:
+        if name == self._full_name:
+            return
         self._full_name = name
         self._update_elided_text()
 
     def set_subtitle(self, subtitle: str) -> None:
+        if subtitle == self._full_subtitle:
+            return
         self._full_subtitle = subtitle
         self._update_elided_text()
 
     def set_detail_tooltip(self, tooltip: str) -> None:
         """Full detail (URL, region coords, window title) shown on hover over sub row."""
         self._detail_tooltip = tooltip or ""
-        self._subtitle_label.setToolTip(self._detail_tooltip)
 
     def _update_elided_text(self) -> None:
-        from PySide6.QtGui import QFontMetrics
         w = self.width()
-        # Row width for text: name gets full line, subtitle (sub row) gets same width, truncated
-        text_width = max(60, w - 120)
-        fm_name = QFontMetrics(self._name_label.font())
-        fm_sub = QFontMetrics(self._subtitle_label.font())
+        # Text runs from x=40 to just left of the tool buttons; name and subtitle share that width, truncated
+        text_width = max(60, w - 156)
+        self._elided_width = w
         # Show name in full when there's space; only elide when very narrow
-        self._name_label.setText(fm_name.elidedText(self._full_name, Qt.TextElideMode.ElideRight, text_width))
+        self._name_text = self._fm_name.elidedText(self._full_name, Qt.TextElideMode.ElideRight, text_width)
         # Sub row: show part of link/region; full detail on hover (tooltip set by set_detail_tooltip)
-        self._subtitle_label.setText(fm_sub.elidedText(self._full_subtitle, Qt.TextElideMode.ElideRight, text_width))
+        self._subtitle_text = self._fm_sub.elidedText(self._full_subtitle, Qt.TextElideMode.ElideRight, text_width)
+        self.update()
+
+    def _text_rects(self) -> tuple[QRect, QRect]:
+        """Name and subtitle rects, stacked and vertically centered to the right of the type icon."""
+        fm_name = self._fm_name
+        fm_sub = self._fm_sub
+        text_width = max(60, self.width() - 156)
+        top = (self.height() - (fm_name.height() + 2 + fm_sub.height())) // 2
+        name_rect = QRect(40, top, text_width, fm_name.height())
+        return name_rect, QRect(40, name_rect.bottom() + 3, text_width, fm_sub.height())
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        type_pix = _fa_pixmap(self._type_char, self._accent_color.name(), 24, self._type_regular, self.devicePixelRatioF())
+        painter.drawPixmap(8, (self.height() - 24) // 2, type_pix)
+        name_rect, sub_rect = self._text_rects()
+        painter.setFont(self._name_font)
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawText(name_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self._name_text)
+        painter.setFont(self._sub_font)
+        painter.setPen(self._muted_color)
+        painter.drawText(sub_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self._subtitle_text)
+        if self._tools_visible:
+            for index, icon in enumerate(self._tool_icons):
+                mode = QIcon.Mode.Active if index == self._hover_tool else QIcon.Mode.Normal
+                state = QIcon.State.On if self._checked[index] else QIcon.State.Off
+                # 16px glyph centered in the 28px cell
+                icon.paint(painter, self._tool_rect(index).adjusted(6, 6, -6, -6), Qt.AlignmentFlag.AlignCenter, mode, state)
+
+    def mousePressEvent(self, event) -> None:
+        index = self._tool_at(event.position().toPoint()) if event.button() == Qt.MouseButton.LeftButton else -1
+        if index < 0:
+            # Ignored by QWidget, so the list still gets it for selection and drag-reorder
+            super().mousePressEvent(event)
+            return
+        self._pressed_tool = index
+        event.accept()
+
+    def mouseReleaseEvent(self, event) -> None:
+        index, self._pressed_tool = self._pressed_tool, -1
+        if index < 0:
+            super().mouseReleaseEvent(event)
+            return
+        event.accept()
+        # Like a button: only a release still inside the toggle that was pressed flips it
+        if self._tool_rect(index).contains(event.position().toPoint()):
+            checked = not self._checked[index]
+            self._set_checked(index, checked)
+            self._tool_signals[index].emit(self._overlay_id, checked)
+
+    def mouseMoveEvent(self, event) -> None:
+        self._set_hover_tool(self._tool_at(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        self._set_hover_tool(-1)
+        super().leaveEvent(event)
+
+    def event(self, event: QEvent) -> bool:
+        # Toggle tooltips over the toggles; detail tooltip only over the sub row, as it was when the subtitle was its own label
+        if event.type() == QEvent.Type.ToolTip:
+            index = self._tool_at(event.pos())
+            if index >= 0:
+                QToolTip.showText(event.globalPos(), _ROW_TOOL_TIPS[index], self, self._tool_rect(index))
+            elif self._detail_tooltip and self._text_rects()[1].contains(event.pos()):
+                QToolTip.showText(event.globalPos(), self._detail_tooltip, self)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().event(event)
+
+    def _on_elide_timer(self) -> None:
+        if self.width() != self._elided_width:
+            self._update_elided_text()
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self._update_elided_text()
+        self._elide_timer.start()
 
+    # Programmatic syncs from the panel: repaint the toggle without emitting its *Toggled signal
     def set_visible(self, visible: bool) -> None:
-        self._btn_visible.blockSignals(True)
-        self._btn_visible.setChecked(visible)
-        self._btn_visible.blockSignals(False)
-        self._update_icons()
+        self._set_checked(0, visible)
 
     def set_locked(self, locked: bool) -> None:
-        self._btn_locked.blockSignals(True)
-        self._btn_locked.setChecked(locked)
-        self._btn_locked.blockSignals(False)
-        self._update_icons()
+        self._set_checked(1, locked)
 
     def set_click_through(self, click_through: bool) -> None:
-        self._btn_click_through.blockSignals(True)
-        self._btn_click_through.setChecked(click_through)
-        self._btn_click_through.blockSignals(False)
-        self._update_icons()
+        self._set_checked(2, click_through)
+
+    def apply_state(self, visible: Optional[bool] = None, click_through: Optional[bool] = None) -> None:
+        """Sync several toggles at once; None leaves that toggle as it is."""
+        if visible is not None:
+            self.set_visible(visible)
+        if click_through is not None:
+            self.set_click_through(click_through)
 
     def set_tools_visible(self, visible: bool) -> None:
         """Show or hide the overlay tools (visibility, lock, click-through)."""
-        self._btn_visible.setVisible(visible)
-        self._btn_locked.setVisible(visible)
-        self._btn_click_through.setVisible(visible)
-
-    def update_theme_colors(self, accent: str, accent_hover: str, text_muted: str) -> None:
-        """Update inline styles to match current theme (called when panel theme changes)."""
-        self._type_icon_label.setStyleSheet(f"color: {accent}; min-width: 20px;")
-        self._subtitle_label.setStyleSheet(f"color: {text_muted}; font-weight: normal;")
-        icon_style = (
-            f"QToolButton {{ color: {text_muted}; border: none; background: transparent; min-width: 24px; min-height: 24px; }} "
-            f"QToolButton:checked {{ color: {accent}; }} "
-            f"QToolButton:hover {{ color: {accent_hover}; }}"
-        )
-        lock_style = (
-            f"QToolButton {{ color: {text_muted}; border: none; background: transparent; min-width: 24px; min-height: 24px; }} "
-            f"QToolButton:checked {{ color: {accent}; }} "
-            f"QToolButton:hover {{ color: {accent_hover}; }}"
-        )
-        self._btn_visible.setStyleSheet(icon_style)
-        self._btn_locked.setStyleSheet(lock_style)
-        self._btn_click_through.setStyleSheet(icon_style)
+        if visible == self._tools_visible:
+            return
+        self._tools_visible = visible
+        self._hover_tool = -1
+        self.update()
+
+
+class OverlayListWidget(QListWidget):
+    """Overlay list whose drag-reorder is a single in-place moveRow, so row widgets stay attached to their items."""
+
+    def dropEvent(self, event: QDropEvent) -> None:
+        src = self.currentRow()
+        if event.source() is not self or src < 0:
+            super().dropEvent(event)
+            return
+        target = self.indexAt(event.position().toPoint())
+        pos = self.dropIndicatorPosition()
+        if not target.isValid() or pos == QAbstractItemView.DropIndicatorPosition.OnViewport:
+            dst = self.count()
+        elif pos == QAbstractItemView.DropIndicatorPosition.BelowItem:
+            dst = target.row() + 1
+        else:
+            dst = target.row()
+        # moveRow's destination is in pre-move coordinates; src and src + 1 both mean "stay put"
+        if dst not in (src, src + 1):
+            self.model().moveRow(QModelIndex(), src, QModelIndex(), dst)
+        # Report a copy so QAbstractItemView doesn't remove the "moved" source row afterwards
+        event.setDropAction(Qt.DropAction.CopyAction)
+        event.accept()
+        self.stopAutoScroll()
+        self.setState(QAbstractItemView.State.NoState)
+        self.viewport().update()
+
+
+def _remove_overlay(overlays: list[OverlayConfig], overlay_id: str) -> None:
+    """Delete the overlay with overlay_id from a profile's list in place (ids are unique within a profile)."""
+    for i, c in enumerate(overlays):
+        if c.id == overlay_id:
+            del overlays[i]
+            return
+
+
+@functools.lru_cache(maxsize=256)
+def _display_strings(
+    kind: str,
+    source: str,
+    capture_mode: str,
+    rect: Optional[tuple[int, int, int, int]],
+    window_title: str,
+) -> tuple[str, str]:
+    """Row (subtitle, tooltip), memoized on the config fields they are built from so edits never see stale text."""
+    if kind == "web":
+        text = source.strip() or "Web"
+        return text, text
+    if kind == "image":
+        return (Path(source).name if source else "Image"), (source or "Image")
+    if kind == "screen":
+        is_region = capture_mode == "region"
+        subtitle = source or ("Region" if is_region else "Window")
+        if is_region and rect:
+            x, y, w, h = rect
+            return subtitle, f"Region ({x}, {y}, {w}×{h})"
+        if capture_mode == "window":
+            return subtitle, f"Window: {window_title or 'Unknown'}"
+        return subtitle, ((source or "Region") if is_region else "Window")
+    return kind, kind
+
+
+# Fallback topmost refresh cadence while the panel is hidden and an overlay is on screen
+# (focus changes drive the refresh otherwise)
+_TOPMOST_INTERVAL_MS = 5000
+# Item data role holding each list row's overlay id, resolved once instead of per lookup
+_ID_ROLE = Qt.ItemDataRole.UserRole
+# Hotkey text format the edits are read back in, resolved once for the hotkey slots
+_PORTABLE_TEXT = QKeySequence.SequenceFormat.PortableText
+# Detail header badge per overlay type; screen overlays pick region/window capture by mode
+_TYPE_BADGE = {"web": "WEB", "image": "IMAGE"}
+# Slider value labels, indexed by percent (config clamps opacity to <= 100% and zoom to <= 300%)
+_OPACITY_LABELS = tuple(f"Opacity {i}%" for i in range(101))
+_ZOOM_LABELS = tuple(f"Zoom {i}%" for i in range(301))
 
 
 class ControlPanel(QWidget):
@@ -1119,25 +1067,79 @@ class ControlPanel(QWidget):
         self._click_through_hotkey_callback = on_click_through_hotkey_changed
         self._on_quit_requested = on_quit_requested
         self._allow_close = False
+        # Fixed save window: the first change starts it and later changes ride along, so sustained input still saves every 350 ms
         self._save_timer = QTimer(self)
         self._save_timer.setSingleShot(True)
         self._save_timer.setInterval(350)
         self._save_timer.timeout.connect(self._flush_config)
+        # Four spin boxes feed one handler; apply the capture rect once the spins settle (80 ms) so an
+        # arrow-held drag doesn't reconfigure the capture on every step
+        self._capture_rect_timer = QTimer(self)
+        self._capture_rect_timer.setSingleShot(True)
+        self._capture_rect_timer.setInterval(80)
+        self._capture_rect_timer.timeout.connect(self._on_capture_rect_changed)
+        # Same for width/height: resize the overlay once the spins have been idle for 60 ms
+        self._size_timer = QTimer(self)
+        self._size_timer.setSingleShot(True)
+        self._size_timer.setInterval(60)
+        self._size_timer.timeout.connect(self._on_size_changed)
+        # Opacity/zoom drags apply to the overlay at most once per frame (~16 ms)
+        self._slider_debounce = QTimer(self)
+        self._slider_debounce.setSingleShot(True)
+        self._slider_debounce.setInterval(16)
+        self._slider_debounce.timeout.connect(self._apply_detail_changes)
+        # Row widths and header breakpoint follow panel resizes at most once per frame (~16 ms)
+        self._resize_coalesce = QTimer(self)
+        self._resize_coalesce.setSingleShot(True)
+        self._resize_coalesce.setInterval(16)
+        self._resize_coalesce.timeout.connect(self._apply_resize)
+        # Newly shown overlays are raised together once they have native handles
+        self._pending_raise: list[BaseOverlayWindow] = []
+        self._raise_batch_timer = QTimer(self)
+        self._raise_batch_timer.setSingleShot(True)
+        self._raise_batch_timer.setInterval(200)
+        self._raise_batch_timer.timeout.connect(self._raise_pending_overlays)
         self._topmost_timer = QTimer(self)
-        self._topmost_timer.setInterval(3000)
-        self._topmost_timer.timeout.connect(self._refresh_overlay_topmost)
-        self._topmost_timer.start()
+        self._topmost_timer.setInterval(_TOPMOST_INTERVAL_MS)
+        self._topmost_timer.timeout.connect(self._on_topmost_timer)
         self._apply_panel_on_top(self._config.keep_control_panel_on_top)
         # Ensure close button is always enabled (Windows can grey it out otherwise)
         self.setWindowFlags(self.windowFlags() | Qt.WindowCloseButtonHint)
         self._is_loading_selection = False
-
-        self._overlay_windows: Dict[str, QWidget] = {}
+        self._region_picker: Optional[RegionPickerOverlay] = None  # open region picker, if any
+        self._image_dialog: Optional[QFileDialog] = None  # Add Image file dialog, built on first use and reused
+        self._last_row_width = -1  # list viewport width last applied to the row widgets
+        self._header_mode: Optional[str] = None  # "compact" / "wide" layout last applied by _update_header_responsive
+        self._context_menu: Optional[QMenu] = None  # row context menu, see _overlay_context_menu
+        self._move_menu_targets: Optional[list[tuple[str, str]]] = None  # (id, name) rows in its "Move to profile" menu
+        self._move_actions: dict[QAction, str] = {}
+        self._last_selected_id: Optional[str] = None  # overlay the detail editors were last loaded for
+        self._selection_dirty = False  # set when config changes, so reselecting the same overlay reloads
+        self._focus_target_id: Optional[str] = None  # fallback chat-focus overlay, see _default_focus_target
+        self._focus_target_dirty = True
+
+        self._overlay_windows: Dict[str, BaseOverlayWindow] = {}
         self._row_widgets: Dict[str, OverlayListItemWidget] = {}
+        self._item_by_id: Dict[str, QListWidgetItem] = {}
         self._config_by_id: Dict[str, OverlayConfig] = {}
+        self._profile_by_id: Dict[str, OverlayProfile] = {}
+        self._combo_cache: list[tuple[str, str]] = []  # (id, name) rows currently in the profile combo
+        self._active_profile: Optional[OverlayProfile] = None  # set by _switch_active_profile
+        self._last_theme_applied: Optional[ThemeType] = None  # theme the overlay borders were last recolored for
+        self._active_palette = THEME_PALETTES.get(self._config.theme, THEME_PALETTES["dark"])
         self._global_hotkeys_supported = sys.platform in ("win32", "darwin")
-
-        self._list = QListWidget()
+        # Primary screen's available geometry, cached for _clamp_geometry_to_screen until the screen setup changes
+        self._screen_geom: Optional[QRect] = None
+        self._geom_screen = None  # screen whose availableGeometryChanged is connected
+        app = QApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._invalidate_screen_geometry)
+            app.screenRemoved.connect(self._invalidate_screen_geometry)
+            app.primaryScreenChanged.connect(self._invalidate_screen_geometry)
+            # Another window taking focus is what pushes overlays down the z-order
+            app.focusWindowChanged.connect(self._on_focus_window_changed)
+
+        self._list = OverlayListWidget()
         self._list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self._list.setAlternatingRowColors(False)
         self._list.setUniformItemSizes(True)
@@ -1162,6 +1164,9 @@ class ControlPanel(QWidget):
         self._width_spin.setRange(150, 5000)
         self._height_spin = QSpinBox()
         self._height_spin.setRange(150, 5000)
+        # Typed sizes apply on Enter/focus-out instead of resizing the overlay through every partial number
+        self._width_spin.setKeyboardTracking(False)
+        self._height_spin.setKeyboardTracking(False)
         self._btn_fit_content = QPushButton("Fit to Content")
         self._btn_reload = QPushButton("Reload Overlay")
         self._btn_fit_content.setProperty("class", "action-secondary")
@@ -1192,26 +1197,44 @@ class ControlPanel(QWidget):
 
         self._hotkey_edit = QKeySequenceEdit()
         self._hotkey_edit.setMaximumSequenceLength(1)
-        self._hotkey_edit.setKeySequence(QKeySequence(self._config.chat_hotkey))
+        _set_sequence_quiet(self._hotkey_edit, _key_sequence(self._config.chat_hotkey))
         self._overlay_hotkey_edit = QKeySequenceEdit()
         self._overlay_hotkey_edit.setMaximumSequenceLength(1)
+        # Editors loaded programmatically on selection change; blocked together by _block_detail_signals
+        self._detail_widgets = (
+            self._name_edit,
+            self._source_edit,
+            self._opacity_slider,
+            self._zoom_slider,
+            self._width_spin,
+            self._height_spin,
+            self._overlay_hotkey_edit,
+        )
+        self._capture_spins = (self._capture_x_spin, self._capture_y_spin, self._capture_w_spin, self._capture_h_spin)
         self._btn_clear_overlay_hotkey = QPushButton("Clear")
         self._btn_clear_overlay_hotkey.setFixedWidth(58)
         self._btn_clear_chat_hotkey = QPushButton("Clear")
         self._btn_clear_chat_hotkey.setFixedWidth(58)
         self._hotkey_hint = QLabel("")
+        self._hotkey_hint.setObjectName("HotkeyHint")
+        self._hotkey_hint_args: Optional[tuple[str, bool]] = None  # inputs the hint text was last built from
         self._click_through_hotkey_edit = QKeySequenceEdit()
         self._click_through_hotkey_edit.setMaximumSequenceLength(1)
-        self._click_through_hotkey_edit.setKeySequence(QKeySequence(self._config.click_through_hotkey))
+        _set_sequence_quiet(self._click_through_hotkey_edit, _key_sequence(self._config.click_through_hotkey))
         self._btn_clear_click_through_hotkey = QPushButton("Clear")
         self._btn_clear_click_through_hotkey.setFixedWidth(58)
         self._click_through_hint = QLabel("")
+        self._click_through_hint.setObjectName("ClickThroughHint")
+        self._click_through_hint_hotkey: Optional[str] = None
         self._overlay_title_label = QLabel("Select an overlay")
         self._overlay_type_badge = QLabel("")
+        self._overlay_type_badge.setObjectName("OverlayTypeBadge")
         self._btn_show_controls = QToolButton()
+        self._btn_show_controls.setObjectName("ShowControls")
         self._btn_show_controls.setCheckable(True)
         self._btn_show_controls.setChecked(True)
         self._toggle_tools_label = QLabel("Hide overlay tools")
+        self._toggle_tools_label.setObjectName("ToggleTools")
         self._opacity_value_label = QLabel("Opacity 100%")
         self._zoom_value_label = QLabel("Zoom 100%")
         self._btn_settings = QToolButton()
@@ -1265,6 +1288,14 @@ class ControlPanel(QWidget):
         self._click_through_hint.setText(note)
 
     def _build_layout(self) -> None:
+        # Nothing can paint before the first show, so skip per-addWidget paint invalidation while building
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_layout_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_layout_widgets(self) -> None:
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(12, 12, 12, 12)
         main_layout.setSpacing(12)
@@ -1289,7 +1320,7 @@ class ControlPanel(QWidget):
         header_icon.setAlignment(Qt.AlignCenter)
         icon_pix = _header_icon_pixmap()
         if not icon_pix.isNull():
-            header_icon.setPixmap(icon_pix.scaled(140, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            header_icon.setPixmap(_header_icon_scaled(icon_pix, 140, 90))
 
         header_title = QLabel("Shastas Projector v2.0.0")
         header_title.setProperty("class", "header-title")
@@ -1355,11 +1386,6 @@ class ControlPanel(QWidget):
         left_container.setLayout(left)
         self._btn_show_controls.setFont(_icon_font())
         self._btn_show_controls.setText(FA_TOGGLE_ON)
-        self._btn_show_controls.setStyleSheet(
-            "QToolButton { color: #8B5CF6; border: none; background: transparent; min-width: 28px; min-height: 28px; } "
-            "QToolButton:checked { color: #8B5CF6; } QToolButton:hover { color: #9d7af0; }"
-        )
-        self._toggle_tools_label.setStyleSheet("color: #AAB2C0; font-size: 13px;")
         toggle_row_left = QHBoxLayout()
         toggle_row_left.addWidget(self._btn_show_controls)
         toggle_row_left.addWidget(self._toggle_tools_label)
@@ -1402,10 +1428,6 @@ class ControlPanel(QWidget):
         right_inner.setLayout(right)
 
         self._overlay_title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
-        self._overlay_type_badge.setStyleSheet(
-            "background-color: rgba(139, 92, 246, 0.3); color: #8B5CF6; "
-            "padding: 3px 10px; border-radius: 6px; font-size: 11px; font-weight: bold;"
-        )
         title_row = QHBoxLayout()
         title_row.addWidget(self._overlay_title_label)
         title_row.addWidget(self._overlay_type_badge)
@@ -1442,13 +1464,50 @@ class ControlPanel(QWidget):
         basic_page.setLayout(basic_layout)
         tabs.addTab(basic_page, "Source")
 
-        # Tab: Display
+        # Tabs: Display / Hotkeys; page contents are built on first activation (see _maybe_build_tab)
         size_page = QWidget()
         size_page.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        tabs.addTab(size_page, "Display")
+        hotkey_page = QWidget()
+        hotkey_page.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        tabs.addTab(hotkey_page, "Hotkeys")
+        self._chat_input_hotkey_group: Optional[QWidget] = None
+        self._chat_input_hotkey_visible = False
+        self._tab_builders: Dict[QWidget, Callable[[QWidget], None]] = {
+            size_page: self._build_display_tab,
+            hotkey_page: self._build_hotkey_tab,
+        }
+        tabs.currentChanged.connect(self._maybe_build_tab)
+
+        # Tab: Capture (shown only for screen overlays); built the first time a screen overlay is selected
+        self._capture_tab_widget: Optional[QWidget] = None
+        self._capture_tab_title = "Capture"
+        self._capture_tab_present = False  # whether the capture tab is currently inserted at index 2
+
+        controls_layout.addWidget(tabs)
+        right.addWidget(self._controls_container)
+        right.addStretch(1)
+        settings_row = QHBoxLayout()
+        settings_row.addStretch(1)
+        settings_row.addWidget(self._btn_settings)
+        right.addLayout(settings_row)
+
+        right_inner.setMinimumWidth(320)
+        splitter.addWidget(right_inner)
+        splitter.setStretchFactor(0, 2)
+        splitter.setStretchFactor(1, 3)
+
+    def _maybe_build_tab(self, index: int) -> None:
+        page = self._tab_widget.widget(index)
+        builder = self._tab_builders.pop(page, None)
+        if builder is not None:
+            builder(page)
+
+    def _build_display_tab(self, page: QWidget) -> None:
         size_layout = QVBoxLayout()
         size_layout.setSpacing(12)
         size_layout.setContentsMargins(4, 6, 4, 12)
-        size_layout.addWidget(_section_header("SIZE & POSITION"))
+        size_layout.addWidget(_section_header("SIZE & POSITION", page))
         size_row = QHBoxLayout()
         size_row.setSpacing(12)
         size_row.addWidget(QLabel("Width"))
@@ -1463,7 +1522,7 @@ class ControlPanel(QWidget):
         self._height_spin.setMaximumWidth(100)
         size_layout.addLayout(size_row)
         size_layout.addSpacing(4)
-        size_layout.addWidget(_section_header("OPACITY & ZOOM"))
+        size_layout.addWidget(_section_header("OPACITY & ZOOM", page))
         self._opacity_value_label.setMinimumWidth(100)
         size_layout.addWidget(self._opacity_value_label)
         size_layout.addWidget(self._opacity_slider)
@@ -1478,16 +1537,13 @@ class ControlPanel(QWidget):
         action_row.addWidget(self._btn_reload)
         size_layout.addLayout(action_row)
         size_layout.addSpacing(12)
-        size_page.setLayout(size_layout)
-        tabs.addTab(size_page, "Display")
+        page.setLayout(size_layout)
 
-        # Tab: Hotkey
-        hotkey_page = QWidget()
-        hotkey_page.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+    def _build_hotkey_tab(self, page: QWidget) -> None:
         hotkey_layout = QVBoxLayout()
         hotkey_layout.setSpacing(2)
         hotkey_layout.setContentsMargins(2, 2, 2, 2)
-        hotkey_layout.addWidget(_section_header("OVERLAY VISIBILITY HOTKEY"))
+        hotkey_layout.addWidget(_section_header("OVERLAY VISIBILITY HOTKEY", page))
         overlay_hotkey_row = QHBoxLayout()
         overlay_hotkey_row.addWidget(self._overlay_hotkey_edit)
         overlay_hotkey_row.addWidget(self._btn_clear_overlay_hotkey)
@@ -1497,27 +1553,25 @@ class ControlPanel(QWidget):
         chat_input_layout = QVBoxLayout()
         chat_input_layout.setSpacing(2)
         chat_input_layout.setContentsMargins(0, 0, 0, 0)
-        chat_input_layout.addWidget(_section_header("OVERLAY CHAT INPUT HOTKEY"))
+        chat_input_layout.addWidget(_section_header("OVERLAY CHAT INPUT HOTKEY", self._chat_input_hotkey_group))
         chat_hotkey_row = QHBoxLayout()
         chat_hotkey_row.addWidget(self._hotkey_edit)
         chat_hotkey_row.addWidget(self._btn_clear_chat_hotkey)
         chat_input_layout.addLayout(chat_hotkey_row)
-        self._hotkey_hint.setStyleSheet("color: #AAB2C0; font-size: 12px;")
         chat_input_layout.addWidget(self._hotkey_hint)
         self._chat_input_hotkey_group.setLayout(chat_input_layout)
-        self._chat_input_hotkey_group.setVisible(False)  # shown only for web/window in _on_selection_changed
+        # shown only for web/window in _on_selection_changed
+        self._chat_input_hotkey_group.setVisible(self._chat_input_hotkey_visible)
         hotkey_layout.addWidget(self._chat_input_hotkey_group)
-        hotkey_layout.addWidget(_section_header("OVERLAY CLICK THROUGH"))
+        hotkey_layout.addWidget(_section_header("OVERLAY CLICK THROUGH", page))
         click_through_hotkey_row = QHBoxLayout()
         click_through_hotkey_row.addWidget(self._click_through_hotkey_edit)
         click_through_hotkey_row.addWidget(self._btn_clear_click_through_hotkey)
         hotkey_layout.addLayout(click_through_hotkey_row)
-        self._click_through_hint.setStyleSheet("color: #AAB2C0; font-size: 12px;")
         hotkey_layout.addWidget(self._click_through_hint)
-        hotkey_page.setLayout(hotkey_layout)
-        tabs.addTab(hotkey_page, "Hotkeys")
+        page.setLayout(hotkey_layout)
 
-        # Tab: Capture (shown only for screen overlays)
+    def _build_capture_tab(self) -> QWidget:
         screen_capture_wrap = QWidget()
         screen_capture_wrap.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
         screen_capture_layout = QVBoxLayout()
@@ -1541,120 +1595,166 @@ class ControlPanel(QWidget):
         capture_size_row.addWidget(self._capture_h_spin)
         screen_capture_layout.addLayout(capture_size_row)
         screen_capture_wrap.setLayout(screen_capture_layout)
-        self._screen_capture_group = screen_capture_wrap
-        self._capture_tab_widget = screen_capture_wrap
-        self._capture_tab_title = "Capture"
+        return screen_capture_wrap
 
-        controls_layout.addWidget(tabs)
-        right.addWidget(self._controls_container)
-        right.addStretch(1)
-        settings_row = QHBoxLayout()
-        settings_row.addStretch(1)
-        settings_row.addWidget(self._btn_settings)
-        right.addLayout(settings_row)
+    def _set_capture_group_visible(self, visible: bool) -> None:
+        if self._capture_tab_widget is not None:
+            self._capture_tab_widget.setVisible(visible)
 
-        right_inner.setMinimumWidth(320)
-        splitter.addWidget(right_inner)
-        splitter.setStretchFactor(0, 2)
-        splitter.setStretchFactor(1, 3)
+    def _set_chat_input_hotkey_visible(self, visible: bool) -> None:
+        """Remember the chat-input hotkey group's visibility; applied now or when the Hotkeys tab is built."""
+        self._chat_input_hotkey_visible = visible
+        if self._chat_input_hotkey_group is not None:
+            self._chat_input_hotkey_group.setVisible(visible)
 
     def _connect_signals(self) -> None:
-        self._list.currentItemChanged.connect(self._on_selection_changed)
-        self._list.model().rowsMoved.connect(self._on_overlay_list_reordered)
-
-        self._btn_add_web.clicked.connect(self._on_add_web)
-        self._btn_add_image.clicked.connect(self._on_add_image)
-        self._btn_add_region.clicked.connect(self._on_add_region)
-        self._btn_add_window.clicked.connect(self._on_add_window)
-
-        self._name_edit.editingFinished.connect(self._apply_detail_changes)
-        self._source_edit.editingFinished.connect(self._apply_detail_changes)
-        self._opacity_slider.valueChanged.connect(self._apply_detail_changes)
-        self._zoom_slider.valueChanged.connect(self._apply_detail_changes)
-        self._width_spin.valueChanged.connect(self._on_size_changed)
-        self._height_spin.valueChanged.connect(self._on_size_changed)
-        self._btn_fit_content.clicked.connect(self._on_fit_content_clicked)
-        self._btn_reload.clicked.connect(self._on_reload_clicked)
-        self._btn_repick_region.clicked.connect(self._on_repick_region_clicked)
-        self._btn_repick_window.clicked.connect(self._on_repick_window_clicked)
-        self._btn_crop_window.clicked.connect(self._on_crop_window_clicked)
-        self._capture_x_spin.valueChanged.connect(self._on_capture_rect_changed)
-        self._capture_y_spin.valueChanged.connect(self._on_capture_rect_changed)
-        self._capture_w_spin.valueChanged.connect(self._on_capture_rect_changed)
-        self._capture_h_spin.valueChanged.connect(self._on_capture_rect_changed)
-        self._hotkey_edit.keySequenceChanged.connect(self._on_hotkey_changed)
-        self._overlay_hotkey_edit.keySequenceChanged.connect(self._on_overlay_hotkey_changed)
-        self._btn_clear_overlay_hotkey.clicked.connect(self._on_clear_overlay_hotkey)
-        self._btn_clear_chat_hotkey.clicked.connect(self._on_clear_chat_hotkey)
-        self._click_through_hotkey_edit.keySequenceChanged.connect(self._on_click_through_hotkey_changed)
-        self._btn_clear_click_through_hotkey.clicked.connect(self._on_clear_click_through_hotkey)
-        self._btn_settings.clicked.connect(self._on_settings_clicked)
-        self._btn_delete_overlay.clicked.connect(self._on_delete_overlay_clicked)
-        self._profile_combo.currentIndexChanged.connect(self._on_profile_selected)
-        self._btn_new_profile.clicked.connect(self._on_new_profile_clicked)
-        self._btn_rename_profile.clicked.connect(self._on_rename_profile_clicked)
-        self._btn_delete_profile.clicked.connect(self._on_delete_profile_clicked)
+        connections = (
+            (self._list.currentItemChanged, self._on_selection_changed),
+            (self._list.model().rowsMoved, self._on_overlay_list_reordered),
+            (self._btn_add_web.clicked, self._on_add_web),
+            (self._btn_add_image.clicked, self._on_add_image),
+            (self._btn_add_region.clicked, self._on_add_region),
+            (self._btn_add_window.clicked, self._on_add_window),
+            (self._name_edit.editingFinished, self._apply_detail_changes),
+            (self._source_edit.editingFinished, self._apply_detail_changes),
+            (self._opacity_slider.valueChanged, self._queue_slider_changes),
+            (self._zoom_slider.valueChanged, self._on_zoom_slider_changed),
+            (self._zoom_slider.sliderReleased, self._queue_slider_changes),
+            (self._width_spin.valueChanged, self._queue_size_changed),
+            (self._height_spin.valueChanged, self._queue_size_changed),
+            (self._btn_fit_content.clicked, self._on_fit_content_clicked),
+            (self._btn_reload.clicked, self._on_reload_clicked),
+            (self._btn_repick_region.clicked, self._on_repick_region_clicked),
+            (self._btn_repick_window.clicked, self._on_repick_window_clicked),
+            (self._btn_crop_window.clicked, self._on_crop_window_clicked),
+            (self._capture_x_spin.valueChanged, self._queue_capture_rect_changed),
+            (self._capture_y_spin.valueChanged, self._queue_capture_rect_changed),
+            (self._capture_w_spin.valueChanged, self._queue_capture_rect_changed),
+            (self._capture_h_spin.valueChanged, self._queue_capture_rect_changed),
+            (self._hotkey_edit.keySequenceChanged, self._on_hotkey_changed),
+            (self._overlay_hotkey_edit.keySequenceChanged, self._on_overlay_hotkey_changed),
+            (self._btn_clear_overlay_hotkey.clicked, self._on_clear_overlay_hotkey),
+            (self._btn_clear_chat_hotkey.clicked, self._on_clear_chat_hotkey),
+            (self._click_through_hotkey_edit.keySequenceChanged, self._on_click_through_hotkey_changed),
+            (self._btn_clear_click_through_hotkey.clicked, self._on_clear_click_through_hotkey),
+            (self._btn_settings.clicked, self._on_settings_clicked),
+            (self._btn_delete_overlay.clicked, self._on_delete_overlay_clicked),
+            (self._profile_combo.currentIndexChanged, self._on_profile_selected),
+            (self._btn_new_profile.clicked, self._on_new_profile_clicked),
+            (self._btn_rename_profile.clicked, self._on_rename_profile_clicked),
+            (self._btn_delete_profile.clicked, self._on_delete_profile_clicked),
+        )
+        for signal, slot in connections:
+            signal.connect(slot)
 
     def _load_from_config(self) -> None:
+        self._profile_by_id = {p.id: p for p in self._config.profiles}
         self._refresh_profile_combo()
         self._switch_active_profile(self._config.active_profile_id, save=False)
 
     def _get_active_profile(self) -> OverlayProfile:
+        profile = self._active_profile
+        if profile is not None and profile.id == self._config.active_profile_id:
+            return profile
+        profile = self._profile_by_id.get(self._config.active_profile_id)
+        if profile is not None:
+            return profile
         if not self._config.profiles:
             default_profile = OverlayProfile(id="default", name="Default", overlays=[])
-            self._config.profiles.append(default_profile)
+            self._add_profile(default_profile)
             self._config.active_profile_id = default_profile.id
             return default_profile
-        for profile in self._config.profiles:
-            if profile.id == self._config.active_profile_id:
-                return profile
         self._config.active_profile_id = self._config.profiles[0].id
         return self._config.profiles[0]
 
+    def _add_profile(self, profile: OverlayProfile) -> None:
+        """Append a profile to the config, keeping the id -> profile index in sync."""
+        self._config.profiles.append(profile)
+        self._profile_by_id[profile.id] = profile
+
     def _refresh_profile_combo(self) -> None:
-        self._profile_combo.blockSignals(True)
-        self._profile_combo.clear()
-        for profile in self._config.profiles:
-            self._profile_combo.addItem(profile.name, profile.id)
-        active_id = self._config.active_profile_id
-        idx = self._profile_combo.findData(active_id)
-        if idx >= 0:
-            self._profile_combo.setCurrentIndex(idx)
-        self._profile_combo.blockSignals(False)
+        combo = self._profile_combo
+        with QSignalBlocker(combo):
+            # Only repopulate when the (id, name) list actually changed; otherwise just sync the current index
+            desired = [(p.id, p.name) for p in self._config.profiles]
+            if desired != self._combo_cache:
+                combo.setUpdatesEnabled(False)
+                try:
+                    combo.clear()
+                    for profile_id, name in desired:
+                        combo.addItem(name, profile_id)
+                finally:
+                    combo.setUpdatesEnabled(True)
+                self._combo_cache = desired
+            idx = combo.findData(self._config.active_profile_id)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+
+    @staticmethod
+    def _dispose_overlay_windows(windows: list) -> None:
+        """Close (runs capture cleanup in closeEvent) and schedule deletion of detached overlay windows."""
+        for win in windows:
+            win.close()
+            win.deleteLater()
 
     def _switch_active_profile(self, profile_id: str, save: bool = True) -> None:
         if profile_id == self._config.active_profile_id and self._config_by_id:
             return
 
+        # Apply still-debounced detail edits while the old overlay and its config are still loaded
+        self._flush_detail_timers()
         # Tear down current profile overlays
         if self._overlay_hotkey_callback is not None:
             for cfg in self._config_by_id.values():
                 if cfg.toggle_hotkey:
                     self._overlay_hotkey_callback(cfg.id, "")
-        for win in self._overlay_windows.values():
-            win.close()
-        self._overlay_windows.clear()
-        self._row_widgets.clear()
-        self._config_by_id.clear()
-        self._list.clear()
-        self._chat_focus_overlay_id = None
-        self._chat_focus_was_click_through = False
-
-        # Switch active profile
-        self._config.active_profile_id = profile_id
-        profile = self._get_active_profile()
+        # Tear down and rebuild the list in one go: no per-row repaint, and no selection signals until the final setCurrentRow
+        self._list.setUpdatesEnabled(False)
+        try:
+            # Hide now, close/destroy on the next event-loop spin so the switch isn't blocked by teardown
+            old_windows = list(self._overlay_windows.values())
+            self._overlay_windows.clear()
+            self._pending_raise.clear()
+            for win in old_windows:
+                win.hide()
+            if old_windows:
+                QTimer.singleShot(0, functools.partial(self._dispose_overlay_windows, old_windows))
+            self._row_widgets.clear()
+            self._item_by_id.clear()
+            self._config_by_id.clear()
+            self._last_selected_id = None
+            self._focus_target_dirty = True
+            self._list.model().removeRows(0, self._list.count())
+            self._chat_focus_overlay_id = None
+            self._chat_focus_was_click_through = False
 
-        # Load overlays for active profile
-        for overlay_cfg in profile.overlays:
-            self._config_by_id[overlay_cfg.id] = overlay_cfg
-            self._create_overlay_window(overlay_cfg)
-            self._add_list_item(overlay_cfg)
-            if overlay_cfg.toggle_hotkey and self._overlay_hotkey_callback is not None:
-                overlay_cfg.toggle_hotkey = self._overlay_hotkey_callback(overlay_cfg.id, overlay_cfg.toggle_hotkey)
+            # Switch active profile
+            self._config.active_profile_id = profile_id
+            self._active_profile = None
+            profile = self._get_active_profile()
+            self._active_profile = profile
+
+            # Load overlays for active profile
+            with QSignalBlocker(self._list):
+                for overlay_cfg in profile.overlays:
+                    self._config_by_id[overlay_cfg.id] = overlay_cfg
+                    # Hidden overlays get their window on first use (_ensure_overlay_window), not at load
+                    if overlay_cfg.visible:
+                        self._create_overlay_window(overlay_cfg)
+                    self._add_list_item(overlay_cfg)
+                    if overlay_cfg.toggle_hotkey and self._overlay_hotkey_callback is not None:
+                        overlay_cfg.toggle_hotkey = self._overlay_hotkey_callback(overlay_cfg.id, overlay_cfg.toggle_hotkey)
+        finally:
+            self._list.setUpdatesEnabled(True)
+            self._list.viewport().update()
 
         self._refresh_profile_combo()
         if self._list.count() > 0:
-            self._list.setCurrentRow(0)
+            if self._list.currentRow() == 0:
+                # The view made row 0 current while the rebuild had the list's signals blocked
+                self._on_selection_changed(self._list.currentItem(), None)
+            else:
+                self._list.setCurrentRow(0)
         if save:
             self._schedule_config_save()
 
@@ -1669,7 +1769,7 @@ class ControlPanel(QWidget):
             return
         name = name.strip() or "New Profile"
         new_profile = OverlayProfile(id=str(uuid.uuid4()), name=name, overlays=[])
-        self._config.profiles.append(new_profile)
+        self._add_profile(new_profile)
         self._switch_active_profile(new_profile.id, save=True)
 
     def _on_rename_profile_clicked(self) -> None:
@@ -1698,39 +1798,58 @@ class ControlPanel(QWidget):
         if reply != QMessageBox.StandardButton.Yes:
             return
         self._config.profiles = [p for p in self._config.profiles if p.id != profile.id]
+        self._profile_by_id.pop(profile.id, None)
+        self._active_profile = None
         new_active = self._config.profiles[0].id if self._config.profiles else "default"
         self._switch_active_profile(new_active, save=True)
 
     def _schedule_config_save(self) -> None:
-        self._save_timer.start()
+        # Every config mutation comes through here, so it also marks the loaded selection and focus target stale
+        self._selection_dirty = True
+        self._focus_target_dirty = True
+        if not self._save_timer.isActive():
+            self._save_timer.start()
 
     def _flush_config(self) -> None:
         self._on_config_changed(self._config)
 
     def _apply_panel_on_top(self, keep_on_top: bool) -> None:
         """Apply always-on-top behavior for the control panel window."""
-        flags = self.windowFlags()
+        current = self.windowFlags()
+        flags = current
         if keep_on_top:
             flags |= Qt.WindowStaysOnTopHint
         else:
             flags &= ~Qt.WindowStaysOnTopHint
         flags |= Qt.WindowCloseButtonHint
+        if flags == current:
+            # setWindowFlags re-creates the native window even when nothing changes
+            return
         self.setWindowFlags(flags)
         # Changing window flags can hide the window; ensure it stays visible.
         if self.isVisible():
             self.show()
 
-    def _raise_overlay_later(self, win: QWidget) -> None:
+    def _raise_overlay_later(self, win: BaseOverlayWindow) -> None:
         """Schedule raise + ensure_topmost so the overlay gets on top after it has a native handle."""
-
-        def _do() -> None:
-            if win.isVisible() and hasattr(win, "ensure_topmost"):
+        if win not in self._pending_raise:
+            self._pending_raise.append(win)
+        if not self._raise_batch_timer.isActive():
+            self._raise_batch_timer.start()
+
+    def _raise_pending_overlays(self) -> None:
+        pending, self._pending_raise = self._pending_raise, []
+        for win in pending:
+            if win.isVisible():
                 win.raise_()
-                win.ensure_topmost()
-
-        QTimer.singleShot(200, _do)
+                # Forced: showEvent's assert ran before the native window was on screen
+                win.ensure_topmost(force=True)
 
     def _update_hotkey_hint(self, hotkey_text: str) -> None:
+        args = (hotkey_text, self._config.focus_hotkey_enabled)
+        if args == self._hotkey_hint_args:
+            return
+        self._hotkey_hint_args = args
         if not self._global_hotkeys_supported:
             self._hotkey_hint.setText("Global hotkeys are currently supported on Windows and macOS.")
             return
@@ -1742,6 +1861,9 @@ class ControlPanel(QWidget):
             self._hotkey_hint.setText("Overlay Chat Input Hotkey is disabled")
 
     def _update_click_through_hint(self, hotkey_text: str) -> None:
+        if hotkey_text == self._click_through_hint_hotkey:
+            return
+        self._click_through_hint_hotkey = hotkey_text
         if not self._global_hotkeys_supported:
             self._click_through_hint.setText("Global hotkeys are currently supported on Windows and macOS.")
             return
@@ -1753,9 +1875,7 @@ class ControlPanel(QWidget):
             self._click_through_hint.setText("Overlay Click Through hotkey is not set")
 
     def set_hotkey_text(self, hotkey_text: str) -> None:
-        self._hotkey_edit.blockSignals(True)
-        self._hotkey_edit.setKeySequence(QKeySequence(hotkey_text))
-        self._hotkey_edit.blockSignals(False)
+        _set_sequence_quiet(self._hotkey_edit, _key_sequence(hotkey_text))
         self._update_hotkey_hint(hotkey_text)
 
     def set_focus_hotkey_enabled(self, enabled: bool) -> None:
@@ -1778,242 +1898,42 @@ class ControlPanel(QWidget):
         self._schedule_config_save()
 
     def _apply_theme(self, theme: ThemeType) -> None:
-        if theme == "light":
-            self.setStyleSheet(
-                """
-                QWidget { color: #1b2430; background-color: #edf1f7; }
-                QLabel { color: #1b2430; background: transparent; }
-                QGroupBox {
-                    background-color: #f7f9fd;
-                    border: 1px solid #cfd7e3;
-                    border-radius: 8px;
-                    margin-top: 8px;
-                    padding-top: 8px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 8px;
-                    padding: 0 3px;
-                    color: #2b3b4f;
-                }
-                QLineEdit, QSpinBox, QListWidget, QKeySequenceEdit, QPlainTextEdit {
-                    background-color: #ffffff;
-                    border: 1px solid #c3cddd;
-                    border-radius: 6px;
-                    padding: 4px;
-                    selection-background-color: #4a8df8;
-                    selection-color: #ffffff;
-                }
-                QListWidget::item {
-                    padding: 0;
-                    margin: 2px;
-                    border-radius: 10px;
-                }
-                QListWidget::item:selected {
-                    background-color: rgba(99, 102, 241, 0.16);
-                    border: 1px solid rgba(99, 102, 241, 0.35);
-                }
-                QListWidget::item:hover:!selected {
-                    background-color: rgba(2, 6, 23, 0.06);
-                }
-                QTabWidget::pane {
-                    border: 1px solid #cfd7e3;
-                    border-radius: 12px; background: #f7f9fd;
-                    margin-top: 6px; padding: 12px 14px 18px 14px;
-                }
-                QTabBar {
-                    background: #ffffff;
-                    border: 1px solid #cfd7e3;
-                    border-radius: 12px;
-                    padding: 4px;
-                }
-                QTabBar::tab {
-                    background: transparent; color: #64748b;
-                    padding: 8px 16px; margin-right: 4px;
-                    border: none;
-                    border-radius: 8px; font-size: 13px;
-                }
-                QTabBar::tab:selected {
-                    background: #6366f1; color: #ffffff;
-                }
-                QTabBar::tab:hover:!selected { background: #edf3ff; color: #1b2430; }
-                QPushButton, QToolButton {
-                    background-color: #ffffff;
-                    border: 1px solid #bac6d9;
-                    border-radius: 6px;
-                    padding: 4px 8px;
-                }
-                QPushButton:hover, QToolButton:hover { background-color: #edf3ff; }
-                QPushButton:checked, QToolButton:checked {
-                    background-color: #d9e7ff;
-                    border-color: #8db1ef;
-                }
-                QPushButton[class="primary"] {
-                    background-color: #6366f1; border-color: #6366f1; color: #ffffff;
-                }
-                QPushButton[class="primary"]:hover {
-                    background-color: #818cf8; border-color: #818cf8; color: #ffffff;
-                }
-                QPushButton[class="primary"]:pressed { background-color: #4f46e5; border-color: #4f46e5; }
-                QPushButton[class="primary"]:disabled { background-color: #c3cddd; border-color: #c3cddd; color: #6b7280; }
-                QPushButton[class="action-primary"] {
-                    background-color: #6366f1; border-color: #6366f1; color: #ffffff;
-                    border-radius: 12px; padding: 8px 16px; font-weight: 600;
-                }
-                QPushButton[class="action-primary"]:hover {
-                    background-color: #818cf8; border-color: #818cf8;
-                }
-                QPushButton[class="action-primary"]:pressed { background-color: #4f46e5; border-color: #4f46e5; }
-                QPushButton[class="action-primary"]:disabled { background-color: #c3cddd; border-color: #c3cddd; color: #6b7280; }
-                QPushButton[class="action-secondary"] {
-                    background-color: rgba(99, 102, 241, 0.08);
-                    border: 1px solid rgba(99, 102, 241, 0.45);
-                    color: #1b2430;
-                    border-radius: 12px; padding: 8px 16px; font-weight: 600;
-                }
-                QPushButton[class="action-secondary"]:hover {
-                    background-color: rgba(99, 102, 241, 0.16);
-                    border-color: rgba(99, 102, 241, 0.7);
-                }
-                QPushButton[class="action-secondary"]:pressed {
-                    background-color: rgba(99, 102, 241, 0.24);
-                }
-                QPushButton[class="action-secondary"]:disabled {
-                    background-color: rgba(99, 102, 241, 0.04);
-                    border-color: rgba(99, 102, 241, 0.2);
-                    color: #6b7280;
-                }
-                QFrame#HeroHeader {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                        stop: 0 rgba(99, 102, 241, 0.06), stop: 0.65 rgba(99, 102, 241, 0.03), stop: 1 rgba(99, 102, 241, 0.14));
-                    border: 1px solid #cfd7e3;
-                    border-radius: 14px;
-                }
-                QLabel#HeaderIcon {
-                    background: transparent;
-                    border: none;
-                    padding: 0;
-                }
-                QLabel[class="header-title"] {
-                    font-size: 16px;
-                    font-weight: 700;
-                    color: #1b2430;
-                    margin: 0;
-                    padding: 0;
-                }
-                QLabel[class="header-subtitle"] {
-                    font-size: 11px;
-                    color: #64748b;
-                    margin: -2px 0 0 0;
-                    padding: 0;
-                }
-                QLabel[class="header-meta"] {
-                    font-size: 11px;
-                    color: #64748b;
-                }
-                QFrame#HeaderGlow {
-                    background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                        stop: 0 rgba(99, 102, 241, 0.0), stop: 0.5 rgba(99, 102, 241, 0.35), stop: 1 rgba(99, 102, 241, 0.0));
-                    border-radius: 1px;
-                }
-                QPushButton[class="header-cta"] {
-                    background-color: #ffffff;
-                    border: 1px solid #6366f1;
-                    color: #1b2430;
-                    border-radius: 10px;
-                    padding: 6px 14px;
-                    font-size: 12px;
-                    font-weight: 600;
-                }
-                QPushButton[class="header-cta"]:hover {
-                    background-color: #edf3ff;
-                    border-color: #818cf8;
-                }
-                QPushButton[class="header-cta"]:pressed {
-                    background-color: #d9e7ff;
-                    border-color: #4f46e5;
-                }
-                """
-            )
-        elif theme == "ember":
-            self.setStyleSheet(CONTROL_PANEL_EMBER_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "sea":
-            self.setStyleSheet(CONTROL_PANEL_SEA_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "emerald":
-            self.setStyleSheet(CONTROL_PANEL_EMERALD_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "cherry":
-            self.setStyleSheet(CONTROL_PANEL_CHERRY_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "pastel":
-            self.setStyleSheet(CONTROL_PANEL_PASTEL_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "neon":
-            self.setStyleSheet(CONTROL_PANEL_NEON_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "late":
-            self.setStyleSheet(CONTROL_PANEL_LATE_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "fire":
-            self.setStyleSheet(CONTROL_PANEL_FIRE_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "galaxy":
-            self.setStyleSheet(CONTROL_PANEL_GALAXY_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        elif theme == "ducky":
-            self.setStyleSheet(CONTROL_PANEL_DUCKY_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
-        else:
-            self.setStyleSheet(CONTROL_PANEL_DARK_QSS)
-            self.style().unpolish(self)
-            self.style().polish(self)
+        if apply_theme(self, theme) and theme != "light":
+            style = self.style()
+            style.unpolish(self)
+            style.polish(self)
         self._update_theme_dependent_styles(theme)
 
     def _update_theme_dependent_styles(self, theme: ThemeType) -> None:
-        """Update widgets that use inline setStyleSheet so they match the current theme."""
-        colors = THEME_COLORS.get(theme, THEME_COLORS["dark"])
-        accent, accent_hover, text_muted, accent_rgba = colors
-        self._btn_show_controls.setStyleSheet(
-            f"QToolButton {{ color: {accent}; border: none; background: transparent; min-width: 28px; min-height: 28px; }} "
-            f"QToolButton:checked {{ color: {accent}; }} QToolButton:hover {{ color: {accent_hover}; }}"
-        )
-        self._toggle_tools_label.setStyleSheet(f"color: {text_muted}; font-size: 13px;")
-        self._overlay_type_badge.setStyleSheet(
-            f"background-color: rgba({accent_rgba}, 0.3); color: {accent}; "
-            "padding: 3px 10px; border-radius: 6px; font-size: 11px; font-weight: bold;"
-        )
-        self._hotkey_hint.setStyleSheet(f"color: {text_muted}; font-size: 12px;")
-        self._click_through_hint.setStyleSheet(f"color: {text_muted}; font-size: 12px;")
-        for widget in self._row_widgets.values():
-            if hasattr(widget, "update_theme_colors"):
-                widget.update_theme_colors(accent, accent_hover, text_muted)
+        """Update things the panel stylesheet can't reach (overlay window borders) to match the current theme."""
+        # Windows created later take the current accent in _create_overlay_window, so a repeat theme is a no-op
+        if theme == self._last_theme_applied:
+            return
+        self._last_theme_applied = theme
+        palette = self._active_palette = THEME_PALETTES.get(theme, THEME_PALETTES["dark"])
         for win in self._overlay_windows.values():
-            if hasattr(win, "set_overlay_border_color"):
-                win.set_overlay_border_color(accent)
+            win.set_overlay_border_color(palette.accent)
 
     def _clamp_geometry_to_screen(self, x: int, y: int, w: int, h: int) -> tuple:
         """Return (x, y, w, h) with position clamped so at least part of the window is on-screen."""
-        screen = QApplication.primaryScreen()
-        if not screen:
-            return (x, y, w, h)
-        gr = screen.availableGeometry()
+        gr = self._screen_geom
+        if gr is None:
+            screen = QApplication.primaryScreen()
+            if not screen:
+                return (x, y, w, h)
+            if screen is not self._geom_screen:
+                # Also drop the cache when the taskbar/dock resizes the available area
+                self._geom_screen = screen
+                screen.availableGeometryChanged.connect(self._invalidate_screen_geometry)
+            gr = self._screen_geom = screen.availableGeometry()
         margin = 80
         x = max(gr.x() - w + margin, min(x, gr.right() - margin))
         y = max(gr.y() - h + margin, min(y, gr.bottom() - margin))
         return (x, y, w, h)
 
+    def _invalidate_screen_geometry(self, *_args) -> None:
+        self._screen_geom = None
+
     def _create_overlay_window(self, cfg: OverlayConfig) -> None:
         if cfg.type == "web":
             win = WebOverlayWindow(url=cfg.source, opacity=cfg.opacity, locked=cfg.locked)
@@ -2039,82 +1959,69 @@ class ControlPanel(QWidget):
         # Respect saved visibility for all overlay types
         if cfg.visible:
             win.show()
-            if hasattr(win, "ensure_topmost"):
-                win.ensure_topmost()
             self._raise_overlay_later(win)
 
         def on_state_changed() -> None:
-            self._update_config_from_window(cfg.id)
-            self._schedule_config_save()
+            if self._update_config_from_window(cfg.id):
+                self._schedule_config_save()
 
         win.on_state_changed = on_state_changed
         self._overlay_windows[cfg.id] = win
         # Apply current theme border color to overlay
-        colors = THEME_COLORS.get(self._config.theme, THEME_COLORS["dark"])
-        if hasattr(win, "set_overlay_border_color"):
-            win.set_overlay_border_color(colors[0])
-
-    def _overlay_subtitle(self, cfg: OverlayConfig) -> str:
-        """Short text for sub row (truncated in UI); full version in tooltip."""
-        if cfg.type == "web":
-            return cfg.source.strip() or "Web"
-        if cfg.type == "image":
-            return Path(cfg.source).name if cfg.source else "Image"
-        if cfg.type == "screen":
-            return cfg.source or ("Region" if cfg.capture_mode == "region" else "Window")
-        return cfg.type
+        win.set_overlay_border_color(self._active_palette.accent)
 
-    def _overlay_detail_tooltip(self, cfg: OverlayConfig) -> str:
-        """Full detail for sub row tooltip (URL, region coords, window title)."""
-        if cfg.type == "web":
-            return cfg.source.strip() or "Web"
-        if cfg.type == "image":
-            return cfg.source or "Image"
-        if cfg.type == "screen":
-            if cfg.capture_mode == "region" and cfg.capture_rect:
-                r = cfg.capture_rect
-                return f"Region ({r.x}, {r.y}, {r.width}×{r.height})"
-            if cfg.capture_mode == "window":
-                return f"Window: {cfg.window_title or 'Unknown'}"
-            return cfg.source or "Region" if cfg.capture_mode == "region" else "Window"
-        return cfg.type
+    def _ensure_overlay_window(self, overlay_id: Optional[str]) -> Optional[BaseOverlayWindow]:
+        """Overlay's window, built from its config on first use if the overlay was hidden when its profile loaded."""
+        win = self._overlay_windows.get(overlay_id)
+        if win is None:
+            cfg = self._config_by_id.get(overlay_id)
+            if cfg is not None:
+                self._create_overlay_window(cfg)
+                win = self._overlay_windows[cfg.id]
+        return win
+
+    def _overlay_display_strings(self, cfg: OverlayConfig) -> tuple[str, str]:
+        """(subtitle, tooltip) for a row: short text for the sub row, full detail (URL, region coords, window title) for its tooltip."""
+        rect = cfg.capture_rect.to_tuple() if cfg.capture_rect else None
+        return _display_strings(cfg.type, cfg.source, cfg.capture_mode, rect, cfg.window_title)
+
+    def _refresh_row_text(self, row: OverlayListItemWidget, cfg: OverlayConfig) -> None:
+        subtitle, tooltip = self._overlay_display_strings(cfg)
+        row.set_subtitle(subtitle)
+        row.set_detail_tooltip(tooltip)
 
     def _add_list_item(self, cfg: OverlayConfig) -> None:
         item = QListWidgetItem()
+        subtitle, tooltip = self._overlay_display_strings(cfg)
         widget = OverlayListItemWidget(
             overlay_id=cfg.id,
             name=cfg.name or cfg.id,
-            subtitle=self._overlay_subtitle(cfg),
+            subtitle=subtitle,
             overlay_type=cfg.type,
             capture_mode=cfg.capture_mode,
             visible=cfg.visible,
             locked=cfg.locked,
             click_through=cfg.click_through,
-            on_visible_toggled=lambda checked, oid=cfg.id: self._on_row_visible_toggled(oid, checked),
-            on_locked_toggled=lambda checked, oid=cfg.id: self._on_row_locked_toggled(oid, checked),
-            on_click_through_toggled=lambda checked, oid=cfg.id: self._on_row_click_through_toggled(oid, checked),
         )
+        widget.visibleToggled.connect(self._on_row_visible_toggled)
+        widget.lockedToggled.connect(self._on_row_locked_toggled)
+        widget.clickThroughToggled.connect(self._on_row_click_through_toggled)
         item.setSizeHint(widget.sizeHint())
-        item.setData(Qt.UserRole, cfg.id)
+        item.setData(_ID_ROLE, cfg.id)
         self._list.addItem(item)
         self._list.setItemWidget(item, widget)
         self._row_widgets[cfg.id] = widget
-        widget.set_detail_tooltip(self._overlay_detail_tooltip(cfg))
+        self._item_by_id[cfg.id] = item
+        if self._last_row_width > 0:
+            widget.setFixedWidth(self._last_row_width)
+        widget.set_detail_tooltip(tooltip)
         widget.set_tools_visible(self._btn_show_controls.isChecked())
-        # Apply current theme colors so new list items match the active theme
-        colors = THEME_COLORS.get(self._config.theme, THEME_COLORS["dark"])
-        accent, accent_hover, text_muted = colors[0], colors[1], colors[2]
-        widget.update_theme_colors(accent, accent_hover, text_muted)
 
     def _on_overlay_list_reordered(self) -> None:
         """Sync active profile overlay order to match the list order after drag/drop."""
-        order_ids = []
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if item:
-                oid = item.data(Qt.UserRole)
-                if oid:
-                    order_ids.append(oid)
+        lst = self._list
+        item_at = lst.item
+        order_ids = [oid for oid in (item_at(i).data(_ID_ROLE) for i in range(lst.count())) if oid]
         if not order_ids:
             return
         profile = self._get_active_profile()
@@ -2126,150 +2033,128 @@ class ControlPanel(QWidget):
         item = self._list.currentItem()
         if not item:
             return None
-        return item.data(Qt.UserRole)
+        return item.data(_ID_ROLE)
 
-    def _find_config(self, overlay_id: str) -> Optional[OverlayConfig]:
+    def _find_config(self, overlay_id: Optional[str]) -> Optional[OverlayConfig]:
         return self._config_by_id.get(overlay_id)
 
+    def _flush_detail_timers(self) -> None:
+        """Stop the capture, size and slider debouncers and apply their pending edits to the loaded overlay."""
+        overlay_id = self._last_selected_id
+        for timer, apply in (
+            (self._capture_rect_timer, self._on_capture_rect_changed),
+            (self._size_timer, self._on_size_changed),
+            (self._slider_debounce, self._apply_detail_changes),
+        ):
+            if timer.isActive():
+                timer.stop()
+                if overlay_id is not None:
+                    apply(overlay_id)
+
     def _on_selection_changed(self, current: QListWidgetItem, _prev: QListWidgetItem) -> None:
+        overlay_id = current.data(_ID_ROLE) if current else None
+        # Apply still-debounced edits to the overlay the editors were showing before they're reloaded
+        self._flush_detail_timers()
+        # Same overlay and no config change since it was loaded: the detail editors already show it
+        if overlay_id is not None and overlay_id == self._last_selected_id and not self._selection_dirty:
+            return
+        self._last_selected_id = overlay_id
+        self._selection_dirty = False
         self._is_loading_selection = True
-        overlay_id = current.data(Qt.UserRole) if current else None
         if overlay_id is None:
-            self._name_edit.blockSignals(True)
-            self._source_edit.blockSignals(True)
-            self._opacity_slider.blockSignals(True)
-            self._zoom_slider.blockSignals(True)
-            self._width_spin.blockSignals(True)
-            self._height_spin.blockSignals(True)
-            self._overlay_hotkey_edit.blockSignals(True)
-
-            self._name_edit.clear()
-            self._source_edit.clear()
-            self._opacity_slider.setValue(100)
-            self._zoom_slider.setValue(100)
-            self._width_spin.setValue(450)
-            self._height_spin.setValue(700)
-            self._overlay_hotkey_edit.setKeySequence(QKeySequence())
+            with self._block_detail_signals():
+                self._name_edit.clear()
+                self._source_edit.clear()
+                self._opacity_slider.setValue(100)
+                self._zoom_slider.setValue(100)
+                self._width_spin.setValue(450)
+                self._height_spin.setValue(700)
+                self._overlay_hotkey_edit.setKeySequence(_key_sequence())
             self._overlay_title_label.setText("Select an overlay")
             self._overlay_type_badge.setText("")
             self._overlay_type_badge.setVisible(False)
             self._opacity_value_label.setText("Opacity 100%")
             self._zoom_value_label.setText("Zoom 100%")
-
-            self._name_edit.blockSignals(False)
-            self._source_edit.blockSignals(False)
-            self._opacity_slider.blockSignals(False)
-            self._zoom_slider.blockSignals(False)
-            self._width_spin.blockSignals(False)
-            self._height_spin.blockSignals(False)
-            self._overlay_hotkey_edit.blockSignals(False)
             self._btn_fit_content.setEnabled(False)
             self._btn_reload.setEnabled(False)
             self._source_edit.setReadOnly(False)
             self._source_edit.setPlaceholderText("")
-            self._screen_capture_group.setVisible(False)
+            self._set_capture_group_visible(False)
             self._overlay_hotkey_edit.setEnabled(False)
             self._btn_clear_overlay_hotkey.setEnabled(False)
             self._update_capture_tab_visibility(None)
             self._btn_delete_overlay.setEnabled(False)
-            self._chat_input_hotkey_group.setVisible(False)
+            self._set_chat_input_hotkey_visible(False)
             self._is_loading_selection = False
             return
 
         cfg = self._find_config(overlay_id)
         if not cfg:
-            self._chat_input_hotkey_group.setVisible(False)
+            self._set_chat_input_hotkey_visible(False)
             self._is_loading_selection = False
             return
 
-        self._name_edit.blockSignals(True)
-        self._source_edit.blockSignals(True)
-        self._opacity_slider.blockSignals(True)
-        self._zoom_slider.blockSignals(True)
-        self._width_spin.blockSignals(True)
-        self._height_spin.blockSignals(True)
-        self._overlay_hotkey_edit.blockSignals(True)
-
-        self._name_edit.setText(cfg.name)
-        self._source_edit.setText(cfg.source)
-        self._opacity_slider.setValue(int(cfg.opacity * 100))
-        self._zoom_slider.setValue(int(cfg.zoom * 100))
-        self._width_spin.setValue(cfg.width)
-        self._height_spin.setValue(cfg.height)
-        self._overlay_hotkey_edit.setKeySequence(QKeySequence(cfg.toggle_hotkey))
+        opacity_pct = int(cfg.opacity * 100)
+        zoom_pct = int(cfg.zoom * 100)
+        with self._block_detail_signals():
+            self._name_edit.setText(cfg.name)
+            self._source_edit.setText(cfg.source)
+            self._opacity_slider.setValue(opacity_pct)
+            self._zoom_slider.setValue(zoom_pct)
+            self._width_spin.setValue(cfg.width)
+            self._height_spin.setValue(cfg.height)
+            self._overlay_hotkey_edit.setKeySequence(_key_sequence(cfg.toggle_hotkey))
         self._overlay_title_label.setText(cfg.name or cfg.id)
         self._overlay_type_badge.setVisible(True)
-        type_badge = {"web": "WEB", "image": "IMAGE", "screen": "REGION CAPTURE" if cfg.capture_mode == "region" else "WINDOW CAPTURE"}
-        self._overlay_type_badge.setText(type_badge.get(cfg.type, cfg.type.upper()))
-        self._opacity_value_label.setText(f"Opacity {int(cfg.opacity * 100)}%")
-        self._zoom_value_label.setText(f"Zoom {int(cfg.zoom * 100)}%")
-
-        self._name_edit.blockSignals(False)
-        self._source_edit.blockSignals(False)
-        self._opacity_slider.blockSignals(False)
-        self._zoom_slider.blockSignals(False)
-        self._width_spin.blockSignals(False)
-        self._height_spin.blockSignals(False)
-        self._overlay_hotkey_edit.blockSignals(False)
+        if cfg.type == "screen":
+            badge = "REGION CAPTURE" if cfg.capture_mode == "region" else "WINDOW CAPTURE"
+        else:
+            badge = _TYPE_BADGE.get(cfg.type) or cfg.type.upper()
+        self._overlay_type_badge.setText(badge)
+        self._opacity_value_label.setText(_OPACITY_LABELS[opacity_pct])
+        self._zoom_value_label.setText(_ZOOM_LABELS[zoom_pct])
 
         self._btn_fit_content.setEnabled(cfg.type == "image")
         self._btn_reload.setEnabled(cfg.type == "web")
         self._source_edit.setReadOnly(cfg.type == "screen")
         # Overlay Chat Input Hotkey only for web and window overlays
-        self._chat_input_hotkey_group.setVisible(
+        self._set_chat_input_hotkey_visible(
             cfg.type == "web" or (cfg.type == "screen" and cfg.capture_mode == "window")
         )
         if cfg.type == "screen":
             self._source_edit.setPlaceholderText("Region or window (use Re-pick or adjust below)")
-            self._screen_capture_group.setVisible(True)
+            self._set_capture_group_visible(True)
             self._btn_repick_region.setEnabled(cfg.capture_mode == "region")
             self._btn_repick_window.setEnabled(cfg.capture_mode == "window")
-            win = self._overlay_windows.get(overlay_id) if overlay_id else None
-            is_window_overlay = cfg.capture_mode == "window" and isinstance(win, ScreenCaptureOverlay)
+            # Window mode reads the live window's size for the spin ranges; region mode works from config alone,
+            # so a hidden region overlay isn't built (and left capturing) just because it was selected
+            win = self._ensure_overlay_window(overlay_id) if cfg.capture_mode == "window" else None
+            is_window_overlay = isinstance(win, ScreenCaptureOverlay)
             self._btn_crop_window.setEnabled(is_window_overlay)
             if cfg.capture_mode == "region" and cfg.capture_rect:
-                self._capture_x_spin.blockSignals(True)
-                self._capture_y_spin.blockSignals(True)
-                self._capture_w_spin.blockSignals(True)
-                self._capture_h_spin.blockSignals(True)
-                self._capture_x_spin.setValue(cfg.capture_rect.x)
-                self._capture_y_spin.setValue(cfg.capture_rect.y)
-                self._capture_w_spin.setValue(cfg.capture_rect.width)
-                self._capture_h_spin.setValue(cfg.capture_rect.height)
-                self._capture_x_spin.blockSignals(False)
-                self._capture_y_spin.blockSignals(False)
-                self._capture_w_spin.blockSignals(False)
-                self._capture_h_spin.blockSignals(False)
+                r = cfg.capture_rect
+                self._set_capture_spins(r.x, r.y, r.width, r.height)
                 self._capture_x_spin.setEnabled(True)
                 self._capture_y_spin.setEnabled(True)
                 self._capture_w_spin.setEnabled(True)
                 self._capture_h_spin.setEnabled(True)
             elif is_window_overlay and win is not None:
                 full = win.get_full_window_rect()
-                if full:
-                    _left, _top, win_w, win_h = full
-                    self._capture_w_spin.setRange(1, max(1, win_w))
-                    self._capture_h_spin.setRange(1, max(1, win_h))
-                    self._capture_x_spin.setRange(0, max(0, win_w - 1))
-                    self._capture_y_spin.setRange(0, max(0, win_h - 1))
-                self._capture_x_spin.blockSignals(True)
-                self._capture_y_spin.blockSignals(True)
-                self._capture_w_spin.blockSignals(True)
-                self._capture_h_spin.blockSignals(True)
-                if cfg.capture_rect:
-                    self._capture_x_spin.setValue(cfg.capture_rect.x)
-                    self._capture_y_spin.setValue(cfg.capture_rect.y)
-                    self._capture_w_spin.setValue(cfg.capture_rect.width)
-                    self._capture_h_spin.setValue(cfg.capture_rect.height)
-                elif full:
-                    self._capture_x_spin.setValue(0)
-                    self._capture_y_spin.setValue(0)
-                    self._capture_w_spin.setValue(full[2])
-                    self._capture_h_spin.setValue(full[3])
-                self._capture_x_spin.blockSignals(False)
-                self._capture_y_spin.blockSignals(False)
-                self._capture_w_spin.blockSignals(False)
-                self._capture_h_spin.blockSignals(False)
+                # Ranges and values change under one block, so a range clamp can't queue a capture-rect edit
+                with self._block_detail_signals(self._capture_spins):
+                    if full:
+                        _left, _top, win_w, win_h = full
+                        x_max = max(0, win_w - 1)
+                        y_max = max(0, win_h - 1)
+                        self._capture_w_spin.setRange(1, x_max + 1)
+                        self._capture_h_spin.setRange(1, y_max + 1)
+                        self._capture_x_spin.setRange(0, x_max)
+                        self._capture_y_spin.setRange(0, y_max)
+                    if cfg.capture_rect:
+                        r = cfg.capture_rect
+                        self._set_capture_spins(r.x, r.y, r.width, r.height)
+                    elif full:
+                        self._set_capture_spins(0, 0, full[2], full[3])
                 self._capture_x_spin.setEnabled(True)
                 self._capture_y_spin.setEnabled(True)
                 self._capture_w_spin.setEnabled(True)
@@ -2280,7 +2165,7 @@ class ControlPanel(QWidget):
                 self._capture_w_spin.setEnabled(False)
                 self._capture_h_spin.setEnabled(False)
         else:
-            self._screen_capture_group.setVisible(False)
+            self._set_capture_group_visible(False)
         self._update_capture_tab_visibility(overlay_id)
         self._overlay_hotkey_edit.setEnabled(True)
         self._btn_clear_overlay_hotkey.setEnabled(bool(cfg.toggle_hotkey))
@@ -2291,6 +2176,15 @@ class ControlPanel(QWidget):
         if win and win.isVisible():
             self._raise_overlay_later(win)
 
+    def _register_new_overlay(self, cfg: OverlayConfig) -> None:
+        """Add a newly created overlay to the active profile, open its window and select its row."""
+        self._get_active_profile().overlays.append(cfg)
+        self._config_by_id[cfg.id] = cfg
+        self._create_overlay_window(cfg)
+        self._add_list_item(cfg)
+        self._list.setCurrentItem(self._item_by_id[cfg.id])
+        self._schedule_config_save()
+
     def _on_add_web(self) -> None:
         new_id = str(uuid.uuid4())
         cfg = OverlayConfig(
@@ -2300,20 +2194,22 @@ class ControlPanel(QWidget):
             source="",
             click_through=False,
         )
-        self._get_active_profile().overlays.append(cfg)
-        self._config_by_id[cfg.id] = cfg
-        self._create_overlay_window(cfg)
-        self._add_list_item(cfg)
-        self._list.setCurrentRow(self._list.count() - 1)
-        self._schedule_config_save()
+        self._register_new_overlay(cfg)
 
     def _on_add_image(self) -> None:
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Image",
-            "",
-            "Images (*.png *.jpg *.jpeg *.webp *.bmp);;All Files (*)",
-        )
+        dlg = self._image_dialog
+        if dlg is None:
+            dlg = self._image_dialog = QFileDialog(
+                self,
+                "Select Image",
+                "",
+                "Images (*.png *.jpg *.jpeg *.webp *.bmp);;All Files (*)",
+            )
+            dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+        if not dlg.exec():
+            return
+        files = dlg.selectedFiles()
+        path = files[0] if files else ""
         if not path:
             return
 
@@ -2325,37 +2221,36 @@ class ControlPanel(QWidget):
             source=path,
             click_through=False,
         )
-        self._get_active_profile().overlays.append(cfg)
-        self._config_by_id[cfg.id] = cfg
-        self._create_overlay_window(cfg)
-        self._add_list_item(cfg)
-        self._list.setCurrentRow(self._list.count() - 1)
-        self._schedule_config_save()
+        self._register_new_overlay(cfg)
 
     def _on_add_region(self) -> None:
         self.hide()
         QTimer.singleShot(300, self._run_region_picker)
 
-    def _run_region_picker(self) -> None:
+    def _start_region_picker(self, on_picked: Callable[[tuple[int, int, int, int]], None]) -> None:
+        """Show the fullscreen region picker and return; on_picked gets the rect unless the pick is cancelled."""
         picker = RegionPickerOverlay()
-        result_holder: list = []
+        self._region_picker = picker  # keep it alive until it reports back
 
         def on_finished(rect) -> None:
-            result_holder.append(rect)
-            loop.quit()
+            self.show()
+            self.raise_()
+            self.activateWindow()
+            # Emitted from the picker's closeEvent: release it only once that has returned
+            QTimer.singleShot(0, self._release_region_picker)
+            if rect:
+                on_picked(rect)
 
         picker.selection_finished.connect(on_finished)
         picker.show_fullscreen()
-        loop = QEventLoop()
-        loop.exec()
-        self.show()
-        self.raise_()
-        self.activateWindow()
 
-        rect = result_holder[0] if result_holder else None
-        if not rect:
-            return
+    def _release_region_picker(self) -> None:
+        self._region_picker = None
 
+    def _run_region_picker(self) -> None:
+        self._start_region_picker(self._on_region_picked)
+
+    def _on_region_picked(self, rect: tuple[int, int, int, int]) -> None:
         x, y, w, h = rect
         capture_rect = CaptureRect(x=x, y=y, width=w, height=h)
         new_id = str(uuid.uuid4())
@@ -2369,71 +2264,41 @@ class ControlPanel(QWidget):
             capture_rect=capture_rect,
             click_through=False,
         )
-        self._get_active_profile().overlays.append(cfg)
-        self._config_by_id[cfg.id] = cfg
-        self._create_overlay_window(cfg)
-        self._add_list_item(cfg)
-        self._list.setCurrentRow(self._list.count() - 1)
-        self._schedule_config_save()
+        self._register_new_overlay(cfg)
 
     def _on_repick_region_clicked(self) -> None:
         overlay_id = self._get_selected_id()
-        cfg = self._find_config(overlay_id) if overlay_id else None
+        cfg = self._find_config(overlay_id)
         if not cfg or cfg.type != "screen" or cfg.capture_mode != "region":
             return
         self.hide()
-        QTimer.singleShot(300, lambda: self._run_repick_region(overlay_id))
+        QTimer.singleShot(300, functools.partial(self._run_repick_region, overlay_id))
 
     def _run_repick_region(self, overlay_id: str) -> None:
-        picker = RegionPickerOverlay()
-        result_holder: list = []
-
-        def on_finished(rect) -> None:
-            result_holder.append(rect)
-            loop.quit()
-
-        picker.selection_finished.connect(on_finished)
-        picker.show_fullscreen()
-        loop = QEventLoop()
-        loop.exec()
-        self.show()
-        self.raise_()
-        self.activateWindow()
+        self._start_region_picker(functools.partial(self._on_region_repicked, overlay_id))
 
-        rect = result_holder[0] if result_holder else None
-        if not rect:
-            return
+    def _on_region_repicked(self, overlay_id: str, rect: tuple[int, int, int, int]) -> None:
         cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id) if overlay_id else None
-        if not cfg or not isinstance(win, ScreenCaptureOverlay):
+        if not cfg or cfg.type != "screen":
             return
         x, y, w, h = rect
         capture_rect = CaptureRect(x=x, y=y, width=w, height=h)
         cfg.capture_rect = capture_rect
         cfg.source = f"Region ({x},{y}) {w}×{h}"
-        win.set_capture_region(capture_rect)
-        self._capture_x_spin.blockSignals(True)
-        self._capture_y_spin.blockSignals(True)
-        self._capture_w_spin.blockSignals(True)
-        self._capture_h_spin.blockSignals(True)
-        self._capture_x_spin.setValue(x)
-        self._capture_y_spin.setValue(y)
-        self._capture_w_spin.setValue(w)
-        self._capture_h_spin.setValue(h)
-        self._capture_x_spin.blockSignals(False)
-        self._capture_y_spin.blockSignals(False)
-        self._capture_w_spin.blockSignals(False)
-        self._capture_h_spin.blockSignals(False)
+        # A hidden overlay without a window is built from this config when it is shown
+        win = self._overlay_windows.get(overlay_id)
+        if isinstance(win, ScreenCaptureOverlay):
+            win.set_capture_region(capture_rect)
+        self._set_capture_spins(x, y, w, h)
         self._source_edit.setText(cfg.source)
-        row = self._row_widgets.get(overlay_id) if overlay_id else None
+        row = self._row_widgets.get(overlay_id)
         if row:
-            row.set_subtitle(self._overlay_subtitle(cfg))
-            row.set_detail_tooltip(self._overlay_detail_tooltip(cfg))
+            self._refresh_row_text(row, cfg)
         self._schedule_config_save()
 
     def _on_repick_window_clicked(self) -> None:
         overlay_id = self._get_selected_id()
-        cfg = self._find_config(overlay_id) if overlay_id else None
+        cfg = self._find_config(overlay_id)
         if not cfg or cfg.type != "screen" or cfg.capture_mode != "window":
             return
         dlg = WindowPickerDialog(self)
@@ -2447,22 +2312,21 @@ class ControlPanel(QWidget):
         cfg.window_title = title
         cfg.source = f"Window: {title[:50]}" + ("…" if len(title) > 50 else "")
         cfg.name = f"Window: {title[:30]}"
-        win = self._overlay_windows.get(overlay_id) if overlay_id else None
+        win = self._overlay_windows.get(overlay_id)
         if isinstance(win, ScreenCaptureOverlay):
             win.set_capture_window(hwnd, title)
         row = self._row_widgets.get(overlay_id)
         if row:
             row.set_name(cfg.name)
-            row.set_subtitle(self._overlay_subtitle(cfg))
-            row.set_detail_tooltip(self._overlay_detail_tooltip(cfg))
+            self._refresh_row_text(row, cfg)
         self._name_edit.setText(cfg.name)
         self._source_edit.setText(cfg.source)
         self._schedule_config_save()
 
     def _on_crop_window_clicked(self) -> None:
         overlay_id = self._get_selected_id()
-        cfg = self._find_config(overlay_id) if overlay_id else None
-        win = self._overlay_windows.get(overlay_id) if overlay_id else None
+        cfg = self._find_config(overlay_id)
+        win = self._ensure_overlay_window(overlay_id)
         if not cfg or cfg.type != "screen" or cfg.capture_mode != "window" or not isinstance(win, ScreenCaptureOverlay):
             return
         window_rect = win.get_full_window_rect()
@@ -2482,42 +2346,71 @@ class ControlPanel(QWidget):
             return
         cfg.capture_rect = crop
         win.set_capture_region(crop)
-        self._capture_x_spin.blockSignals(True)
-        self._capture_y_spin.blockSignals(True)
-        self._capture_w_spin.blockSignals(True)
-        self._capture_h_spin.blockSignals(True)
-        self._capture_x_spin.setValue(crop.x)
-        self._capture_y_spin.setValue(crop.y)
-        self._capture_w_spin.setValue(crop.width)
-        self._capture_h_spin.setValue(crop.height)
-        self._capture_x_spin.blockSignals(False)
-        self._capture_y_spin.blockSignals(False)
-        self._capture_w_spin.blockSignals(False)
-        self._capture_h_spin.blockSignals(False)
+        self._set_capture_spins(crop.x, crop.y, crop.width, crop.height)
         self._schedule_config_save()
 
-    def _on_capture_rect_changed(self) -> None:
+    @contextmanager
+    def _block_detail_signals(self, widgets: Optional[tuple] = None) -> Iterator[None]:
+        """Block signals on the detail editors (or the given widgets) for the duration of the block."""
+        blockers = [QSignalBlocker(w) for w in (self._detail_widgets if widgets is None else widgets)]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
+    def _set_capture_spins(self, x: int, y: int, w: int, h: int) -> None:
+        """Load all four capture spins without firing the capture-rect handler once per spin."""
+        with self._block_detail_signals(self._capture_spins):
+            for spin, value in zip(self._capture_spins, (x, y, w, h)):
+                spin.setValue(value)
+
+    # valueChanged(int) must not reach QTimer.start(msec) directly, so these zero-arg slots restart the coalescers
+    def _queue_capture_rect_changed(self) -> None:
+        self._capture_rect_timer.start()
+
+    def _queue_size_changed(self) -> None:
+        self._size_timer.start()
+
+    def _queue_slider_changes(self) -> None:
+        # Don't restart a pending timer: a long drag still applies every 16 ms, and the last tick reads final values
+        if not self._slider_debounce.isActive():
+            self._slider_debounce.start()
+
+    def _on_zoom_slider_changed(self, value: int) -> None:
+        # Re-zooming a web page is a full relayout, so a drag only previews the label and applies on release
+        if self._zoom_slider.isSliderDown():
+            self._zoom_value_label.setText(_ZOOM_LABELS[value])
+            return
+        self._queue_slider_changes()
+
+    def _on_capture_rect_changed(self, overlay_id: Optional[str] = None) -> None:
         if self._is_loading_selection:
             return
-        overlay_id = self._get_selected_id()
-        cfg = self._find_config(overlay_id) if overlay_id else None
-        win = self._overlay_windows.get(overlay_id) if overlay_id else None
-        if not cfg or cfg.type != "screen" or not isinstance(win, ScreenCaptureOverlay):
+        if overlay_id is None:
+            overlay_id = self._get_selected_id()
+        cfg = self._find_config(overlay_id)
+        if not cfg or cfg.type != "screen":
             return
         x = self._capture_x_spin.value()
         y = self._capture_y_spin.value()
         w = max(1, self._capture_w_spin.value())
         h = max(1, self._capture_h_spin.value())
+        prev = cfg.capture_rect
+        if prev is not None and prev.x == x and prev.y == y and prev.width == w and prev.height == h:
+            # Edit reverted (or a spurious valueChanged): the capture is already showing this rect
+            return
         capture_rect = CaptureRect(x=x, y=y, width=w, height=h)
         cfg.capture_rect = capture_rect
         if cfg.capture_mode == "region":
             cfg.source = f"Region ({x},{y}) {w}×{h}"
             self._source_edit.setText(cfg.source)
-            row = self._row_widgets.get(overlay_id) if overlay_id else None
+            row = self._row_widgets.get(overlay_id)
             if row:
-                row.set_subtitle(self._overlay_subtitle(cfg))
-                row.set_detail_tooltip(self._overlay_detail_tooltip(cfg))
-        win.set_capture_region(capture_rect)
+                self._refresh_row_text(row, cfg)
+        win = self._overlay_windows.get(overlay_id)
+        if isinstance(win, ScreenCaptureOverlay):
+            win.set_capture_region(capture_rect)
         self._schedule_config_save()
 
     def _on_add_window(self) -> None:
@@ -2540,38 +2433,47 @@ class ControlPanel(QWidget):
             window_title=title,
             click_through=False,
         )
-        self._get_active_profile().overlays.append(cfg)
-        self._config_by_id[cfg.id] = cfg
-        self._create_overlay_window(cfg)
-        self._add_list_item(cfg)
-        self._list.setCurrentRow(self._list.count() - 1)
-        self._schedule_config_save()
+        self._register_new_overlay(cfg)
+
+    def _overlay_context_menu(self) -> QMenu:
+        """Row context menu, built once; the "Move to profile" entries are rebuilt only when the other profiles change."""
+        menu = self._context_menu
+        if menu is None:
+            menu = self._context_menu = QMenu(self)
+            act_refresh = menu.addAction("Refresh overlay")
+            act_duplicate = menu.addAction("Duplicate")
+            act_delete = menu.addAction("Delete")
+            self._move_menu = menu.addMenu("Move to profile")
+            act_create = menu.addAction("")
+            self._context_actions = (act_refresh, act_duplicate, act_delete, act_create)
+        targets = [(p.id, p.name) for p in self._config.profiles if p.id != self._config.active_profile_id]
+        if targets != self._move_menu_targets:
+            move_menu = self._move_menu
+            self._move_actions = {}
+            move_menu.clear()
+            for profile_id, name in targets:
+                self._move_actions[move_menu.addAction(name)] = profile_id
+            move_menu.addSeparator()
+            self._act_move_new = move_menu.addAction("New profile...")
+            self._move_menu_targets = targets
+        return menu
 
     def _on_overlay_list_context_menu(self, pos: "QPoint") -> None:
         item = self._list.itemAt(pos)
         if not item:
             return
         self._list.setCurrentItem(item)
-        overlay_id = item.data(Qt.UserRole)
+        overlay_id = item.data(_ID_ROLE)
         if not overlay_id:
             return
         cfg = self._find_config(overlay_id)
         if not cfg:
             return
-        menu = QMenu(self)
-        act_refresh = menu.addAction("Refresh overlay")
+        menu = self._overlay_context_menu()
+        act_refresh, act_duplicate, act_delete, act_create = self._context_actions
+        move_actions = self._move_actions
+        act_move_new = self._act_move_new
         act_refresh.setEnabled(cfg.type == "web")
-        act_duplicate = menu.addAction("Duplicate")
-        act_delete = menu.addAction("Delete")
-        move_menu = menu.addMenu("Move to profile")
-        move_actions: dict[QAction, str] = {}
-        for profile in self._config.profiles:
-            if profile.id == self._config.active_profile_id:
-                continue
-            action = move_menu.addAction(profile.name)
-            move_actions[action] = profile.id
-        move_menu.addSeparator()
-        act_move_new = move_menu.addAction("New profile...")
         if cfg.type == "web":
             create_label = "Create new web overlay"
         elif cfg.type == "image":
@@ -2580,7 +2482,7 @@ class ControlPanel(QWidget):
             create_label = "Create new region overlay"
         else:
             create_label = "Create new window overlay"
-        act_create = menu.addAction(create_label)
+        act_create.setText(create_label)
         action = menu.exec(self._list.mapToGlobal(pos))
         if action == act_refresh:
             self._on_reload_clicked()
@@ -2595,7 +2497,7 @@ class ControlPanel(QWidget):
             if ok:
                 name = name.strip() or "New Profile"
                 new_profile = OverlayProfile(id=str(uuid.uuid4()), name=name, overlays=[])
-                self._config.profiles.append(new_profile)
+                self._add_profile(new_profile)
                 self._move_overlay_to_profile(overlay_id, new_profile.id)
         elif action == act_create:
             if cfg.type == "web":
@@ -2611,14 +2513,14 @@ class ControlPanel(QWidget):
         if target_profile_id == self._config.active_profile_id:
             return
         current_profile = self._get_active_profile()
-        target_profile = next((p for p in self._config.profiles if p.id == target_profile_id), None)
+        target_profile = self._profile_by_id.get(target_profile_id)
         if not target_profile:
             return
         cfg = self._find_config(overlay_id)
         if not cfg:
             return
 
-        current_profile.overlays = [c for c in current_profile.overlays if c.id != overlay_id]
+        _remove_overlay(current_profile.overlays, overlay_id)
         target_profile.overlays.append(cfg)
 
         if self._overlay_hotkey_callback is not None and cfg.toggle_hotkey:
@@ -2629,11 +2531,9 @@ class ControlPanel(QWidget):
             win.close()
         self._config_by_id.pop(overlay_id, None)
         self._row_widgets.pop(overlay_id, None)
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if item and item.data(Qt.UserRole) == overlay_id:
-                self._list.takeItem(i)
-                break
+        item = self._item_by_id.pop(overlay_id, None)
+        if item is not None:
+            self._list.takeItem(self._list.row(item))
         if self._list.count() > 0:
             self._list.setCurrentRow(0)
         self._schedule_config_save()
@@ -2672,15 +2572,7 @@ class ControlPanel(QWidget):
             window_handle=cfg.window_handle,
             window_title=cfg.window_title,
         )
-        self._get_active_profile().overlays.append(new_cfg)
-        self._config_by_id[new_cfg.id] = new_cfg
-        self._create_overlay_window(new_cfg)
-        self._add_list_item(new_cfg)
-        for i in range(self._list.count()):
-            if self._list.item(i).data(Qt.UserRole) == new_id:
-                self._list.setCurrentRow(i)
-                break
-        self._schedule_config_save()
+        self._register_new_overlay(new_cfg)
 
     def _on_delete_overlay_clicked(self) -> None:
         overlay_id = self._get_selected_id()
@@ -2701,8 +2593,7 @@ class ControlPanel(QWidget):
         self._delete_overlay_by_id(overlay_id)
 
     def _delete_overlay_by_id(self, overlay_id: str) -> None:
-        profile = self._get_active_profile()
-        profile.overlays = [c for c in profile.overlays if c.id != overlay_id]
+        _remove_overlay(self._get_active_profile().overlays, overlay_id)
         cfg = self._config_by_id.get(overlay_id)
         if cfg and cfg.toggle_hotkey and self._overlay_hotkey_callback is not None:
             self._overlay_hotkey_callback(overlay_id, "")
@@ -2712,11 +2603,9 @@ class ControlPanel(QWidget):
         if win:
             win.close()
 
-        for i in range(self._list.count()):
-            item = self._list.item(i)
-            if item and item.data(Qt.UserRole) == overlay_id:
-                self._list.takeItem(i)
-                break
+        item = self._item_by_id.pop(overlay_id, None)
+        if item is not None:
+            self._list.takeItem(self._list.row(item))
         self._row_widgets.pop(overlay_id, None)
         if self._chat_focus_overlay_id == overlay_id:
             self._chat_focus_overlay_id = None
@@ -2724,10 +2613,11 @@ class ControlPanel(QWidget):
 
         self._schedule_config_save()
 
-    def _apply_detail_changes(self) -> None:
+    def _apply_detail_changes(self, overlay_id: Optional[str] = None) -> None:
         if self._is_loading_selection:
             return
-        overlay_id = self._get_selected_id()
+        if overlay_id is None:
+            overlay_id = self._get_selected_id()
         if not overlay_id:
             return
 
@@ -2735,111 +2625,128 @@ class ControlPanel(QWidget):
         if not cfg:
             return
 
+        old_name, old_source, old_opacity, old_zoom = cfg.name, cfg.source, cfg.opacity, cfg.zoom
+        old_title = old_name or cfg.id
         cfg.name = self._name_edit.text().strip() or cfg.name
         new_source = self._source_edit.text().strip()
-        old_source = cfg.source
         cfg.source = new_source
-        cfg.opacity = max(0.2, min(1.0, self._opacity_slider.value() / 100.0))
-        cfg.zoom = max(0.5, min(3.0, self._zoom_slider.value() / 100.0))
+        opacity_pct = self._opacity_slider.value()
+        zoom_pct = self._zoom_slider.value()
+        cfg.opacity = max(0.2, min(1.0, opacity_pct / 100.0))
+        cfg.zoom = max(0.5, min(3.0, zoom_pct / 100.0))
+        title = cfg.name or cfg.id
 
-        self._opacity_value_label.setText(f"Opacity {self._opacity_slider.value()}%")
-        self._zoom_value_label.setText(f"Zoom {self._zoom_slider.value()}%")
-        self._overlay_title_label.setText(cfg.name or cfg.id)
+        self._opacity_value_label.setText(_OPACITY_LABELS[opacity_pct])
+        self._zoom_value_label.setText(_ZOOM_LABELS[zoom_pct])
+        self._overlay_title_label.setText(title)
 
+        # Slider ticks change neither, so they leave the row alone
         row_widget = self._row_widgets.get(overlay_id)
-        if row_widget is not None:
+        if row_widget is not None and (cfg.name != old_name or new_source != old_source):
             row_widget.set_name(cfg.name)
-            row_widget.set_subtitle(self._overlay_subtitle(cfg))
-            row_widget.set_detail_tooltip(self._overlay_detail_tooltip(cfg))
+            self._refresh_row_text(row_widget, cfg)
 
         win = self._overlay_windows.get(overlay_id)
         if win:
-            win.setWindowTitle(cfg.name or cfg.id)
             if new_source != old_source:
                 if isinstance(win, WebOverlayWindow) and cfg.type == "web":
                     win.load_url(cfg.source)
                 elif isinstance(win, ImageOverlayWindow) and cfg.type == "image":
                     win.load_image(cfg.source)
+            # Only push what this edit changed; image overlays have no set_zoom, so zoom is skipped for them
+            win.apply_overlay_state(
+                title=title if title != old_title else None,
+                opacity=cfg.opacity if cfg.opacity != old_opacity else None,
+                zoom=cfg.zoom if cfg.zoom != old_zoom else None,
+            )
 
-            if isinstance(win, WebOverlayWindow):
-                win.set_zoom(cfg.zoom)
-            elif isinstance(win, ScreenCaptureOverlay):
-                win.set_zoom(cfg.zoom)
-
-            win.set_overlay_opacity(cfg.opacity)
+        self._schedule_config_save()
 
+    def _apply_row_toggle(self, overlay_id: str, attr: str, value: bool) -> bool:
+        """Store a row toggle on the overlay's config and schedule a save; returns whether the state changed."""
+        cfg = self._config_by_id.get(overlay_id)
+        if cfg is None or getattr(cfg, attr) == value:
+            return False
+        setattr(cfg, attr, value)
         self._schedule_config_save()
+        return True
 
     def _on_row_visible_toggled(self, overlay_id: str, visible: bool) -> None:
-        cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id)
-        if not cfg or not win:
+        if not self._apply_row_toggle(overlay_id, "visible", visible):
             return
-        cfg.visible = visible
         if visible:
-            win.show()
-            if hasattr(win, "ensure_topmost"):
-                win.ensure_topmost()
-            self._raise_overlay_later(win)
+            win = self._ensure_overlay_window(overlay_id)
+            if win is not None:
+                win.show()
+                self._raise_overlay_later(win)
         else:
-            win.hide()
-        self._schedule_config_save()
+            win = self._overlay_windows.get(overlay_id)
+            if win is not None:
+                win.hide()
 
+    # A hidden overlay without a window yet picks up lock/click-through from its config when it is built
     def _on_row_locked_toggled(self, overlay_id: str, locked: bool) -> None:
-        cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id)
-        if not cfg or not win:
-            return
-        cfg.locked = locked
-        win.set_locked(locked)
-        self._schedule_config_save()
+        if self._apply_row_toggle(overlay_id, "locked", locked):
+            win = self._overlay_windows.get(overlay_id)
+            if win is not None:
+                win.set_locked(locked)
 
     def _on_row_click_through_toggled(self, overlay_id: str, click_through: bool) -> None:
-        cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id)
-        if not cfg or not win:
-            return
-        cfg.click_through = click_through
-        win.set_click_through(click_through)
-        self._schedule_config_save()
+        if self._apply_row_toggle(overlay_id, "click_through", click_through):
+            win = self._overlay_windows.get(overlay_id)
+            if win is not None:
+                win.set_click_through(click_through)
 
-    def _update_config_from_window(self, overlay_id: str) -> None:
+    def _update_config_from_window(self, overlay_id: str) -> bool:
+        """Copy the window's geometry and zoom into its config; returns whether anything changed."""
         cfg = self._find_config(overlay_id)
         win = self._overlay_windows.get(overlay_id)
         if not cfg or not win:
-            return
+            return False
 
         g = win.geometry()
-        cfg.x, cfg.y, cfg.width, cfg.height = g.x(), g.y(), g.width(), g.height()
+        geometry = (g.x(), g.y(), g.width(), g.height())
+        zoom = cfg.zoom
         # sync zoom from overlay (e.g. after scroll-wheel zoom)
         if hasattr(win, "_zoom"):
-            cfg.zoom = max(0.5, min(3.0, getattr(win, "_zoom", cfg.zoom)))
+            zoom = max(0.5, min(3.0, getattr(win, "_zoom", cfg.zoom)))
         elif callable(getattr(win, "zoom", None)):
-            cfg.zoom = max(0.5, min(3.0, win.zoom()))
+            zoom = max(0.5, min(3.0, win.zoom()))
+        if geometry == (cfg.x, cfg.y, cfg.width, cfg.height) and zoom == cfg.zoom:
+            return False
+        cfg.x, cfg.y, cfg.width, cfg.height = geometry
+        cfg.zoom = zoom
         # keep size and zoom controls in sync
         if overlay_id == self._get_selected_id():
-            self._width_spin.blockSignals(True)
-            self._height_spin.blockSignals(True)
-            self._width_spin.setValue(cfg.width)
-            self._height_spin.setValue(cfg.height)
-            self._width_spin.blockSignals(False)
-            self._height_spin.blockSignals(False)
-            self._zoom_slider.blockSignals(True)
-            self._zoom_slider.setValue(int(cfg.zoom * 100))
-            self._zoom_slider.blockSignals(False)
+            with self._block_detail_signals((self._width_spin, self._height_spin, self._zoom_slider)):
+                self._width_spin.setValue(cfg.width)
+                self._height_spin.setValue(cfg.height)
+                self._zoom_slider.setValue(int(cfg.zoom * 100))
+        return True
 
-    def _on_size_changed(self) -> None:
-        overlay_id = self._get_selected_id()
+    def _on_size_changed(self, overlay_id: Optional[str] = None) -> None:
+        if overlay_id is None:
+            overlay_id = self._get_selected_id()
         if not overlay_id:
             return
         cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id)
-        if not cfg or not win:
+        if not cfg:
             return
 
         new_w = self._width_spin.value()
         new_h = self._height_spin.value()
+        win = self._overlay_windows.get(overlay_id)
+        if win is None:
+            # Hidden overlay without a window: it is built at the configured size when first shown
+            if (cfg.width, cfg.height) != (new_w, new_h):
+                cfg.width = new_w
+                cfg.height = new_h
+                self._schedule_config_save()
+            return
         geom = win.geometry()
+        if geom.width() == new_w and geom.height() == new_h:
+            # Nothing to resize; setGeometry would still relayout and repaint the overlay
+            return
         geom.setWidth(new_w)
         geom.setHeight(new_h)
         win.setGeometry(geom)
@@ -2859,7 +2766,7 @@ class ControlPanel(QWidget):
     def _on_hotkey_changed(self, sequence: QKeySequence) -> None:
         if not self._global_hotkeys_supported:
             return
-        hotkey_text = sequence.toString(QKeySequence.PortableText).strip()
+        hotkey_text = sequence.toString(_PORTABLE_TEXT).strip()
         if not hotkey_text:
             return
 
@@ -2871,9 +2778,7 @@ class ControlPanel(QWidget):
             applied_hotkey = self._config.chat_hotkey
 
         if applied_hotkey != hotkey_text:
-            self._hotkey_edit.blockSignals(True)
-            self._hotkey_edit.setKeySequence(QKeySequence(applied_hotkey))
-            self._hotkey_edit.blockSignals(False)
+            _set_sequence_quiet(self._hotkey_edit, _key_sequence(applied_hotkey))
 
         if self._config.chat_hotkey != applied_hotkey:
             self._config.chat_hotkey = applied_hotkey
@@ -2883,10 +2788,12 @@ class ControlPanel(QWidget):
         self._update_hotkey_hint(applied_hotkey)
 
     def _set_theme_from_ui(self, theme: ThemeType) -> None:
+        if self._config.theme == theme:
+            # The configured theme was applied at startup; re-picking it changes nothing
+            return
         self._apply_theme(theme)
-        if self._config.theme != theme:
-            self._config.theme = theme
-            self._schedule_config_save()
+        self._config.theme = theme
+        self._schedule_config_save()
 
     def _on_overlay_hotkey_changed(self, sequence: QKeySequence) -> None:
         if not self._global_hotkeys_supported:
@@ -2900,19 +2807,18 @@ class ControlPanel(QWidget):
         if not cfg:
             return
 
-        hotkey_text = sequence.toString(QKeySequence.PortableText).strip()
+        hotkey_text = sequence.toString(_PORTABLE_TEXT).strip()
         applied = hotkey_text
         if self._overlay_hotkey_callback is not None:
             applied = self._overlay_hotkey_callback(overlay_id, hotkey_text)
 
         if applied != hotkey_text:
-            self._overlay_hotkey_edit.blockSignals(True)
-            self._overlay_hotkey_edit.setKeySequence(QKeySequence(applied))
-            self._overlay_hotkey_edit.blockSignals(False)
+            _set_sequence_quiet(self._overlay_hotkey_edit, _key_sequence(applied))
 
-        cfg.toggle_hotkey = applied
         self._btn_clear_overlay_hotkey.setEnabled(bool(applied))
-        self._schedule_config_save()
+        if cfg.toggle_hotkey != applied:
+            cfg.toggle_hotkey = applied
+            self._schedule_config_save()
 
     def _on_clear_overlay_hotkey(self) -> None:
         if not self._global_hotkeys_supported:
@@ -2925,37 +2831,33 @@ class ControlPanel(QWidget):
             return
         if self._overlay_hotkey_callback is not None:
             self._overlay_hotkey_callback(overlay_id, "")
-        cfg.toggle_hotkey = ""
-        self._overlay_hotkey_edit.blockSignals(True)
-        self._overlay_hotkey_edit.setKeySequence(QKeySequence())
-        self._overlay_hotkey_edit.blockSignals(False)
+        _set_sequence_quiet(self._overlay_hotkey_edit, _key_sequence())
         self._btn_clear_overlay_hotkey.setEnabled(False)
-        self._schedule_config_save()
+        if cfg.toggle_hotkey:
+            cfg.toggle_hotkey = ""
+            self._schedule_config_save()
 
     def _on_clear_chat_hotkey(self) -> None:
         if not self._global_hotkeys_supported:
             return
-        self._config.chat_hotkey = ""
-        self._config.focus_hotkey_enabled = False
-        self._hotkey_edit.blockSignals(True)
-        self._hotkey_edit.setKeySequence(QKeySequence())
-        self._hotkey_edit.blockSignals(False)
+        _set_sequence_quiet(self._hotkey_edit, _key_sequence())
         if self._hotkey_apply_callback is not None:
             self._hotkey_apply_callback("")
         self._update_hotkey_hint("")
-        self._schedule_config_save()
+        if self._config.chat_hotkey or self._config.focus_hotkey_enabled:
+            self._config.chat_hotkey = ""
+            self._config.focus_hotkey_enabled = False
+            self._schedule_config_save()
 
     def _on_click_through_hotkey_changed(self, sequence: QKeySequence) -> None:
         if not self._global_hotkeys_supported:
             return
-        hotkey_text = sequence.toString(QKeySequence.PortableText).strip()
+        hotkey_text = sequence.toString(_PORTABLE_TEXT).strip()
         applied = hotkey_text
         if self._click_through_hotkey_callback is not None:
             applied = self._click_through_hotkey_callback(hotkey_text) if hotkey_text else self._click_through_hotkey_callback("")
         if applied != hotkey_text and hotkey_text:
-            self._click_through_hotkey_edit.blockSignals(True)
-            self._click_through_hotkey_edit.setKeySequence(QKeySequence(applied))
-            self._click_through_hotkey_edit.blockSignals(False)
+            _set_sequence_quiet(self._click_through_hotkey_edit, _key_sequence(applied))
         if self._config.click_through_hotkey != applied:
             self._config.click_through_hotkey = applied or ""
             self._schedule_config_save()
@@ -2965,75 +2867,115 @@ class ControlPanel(QWidget):
     def _on_clear_click_through_hotkey(self) -> None:
         if not self._global_hotkeys_supported:
             return
-        self._config.click_through_hotkey = ""
-        self._click_through_hotkey_edit.blockSignals(True)
-        self._click_through_hotkey_edit.setKeySequence(QKeySequence())
-        self._click_through_hotkey_edit.blockSignals(False)
+        _set_sequence_quiet(self._click_through_hotkey_edit, _key_sequence())
         if self._click_through_hotkey_callback is not None:
             self._click_through_hotkey_callback("")
         self._btn_clear_click_through_hotkey.setEnabled(False)
         self._update_click_through_hint("")
-        self._schedule_config_save()
+        if self._config.click_through_hotkey:
+            self._config.click_through_hotkey = ""
+            self._schedule_config_save()
 
     def toggle_click_through_hotkey(self) -> None:
         overlay_id = self._get_selected_id()
         if not overlay_id:
             return
         cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id)
-        if not cfg or not win:
+        if not cfg:
             return
         cfg.click_through = not cfg.click_through
-        win.set_click_through(cfg.click_through)
+        # A hidden overlay without a window picks this up from its config when it is built
+        win = self._overlay_windows.get(overlay_id)
+        if win is not None:
+            win.set_click_through(cfg.click_through)
         row = self._row_widgets.get(overlay_id)
         if row:
             row.set_click_through(cfg.click_through)
         self._schedule_config_save()
 
     def set_click_through_hotkey_text(self, hotkey_text: str) -> None:
-        self._click_through_hotkey_edit.blockSignals(True)
-        self._click_through_hotkey_edit.setKeySequence(QKeySequence(hotkey_text))
-        self._click_through_hotkey_edit.blockSignals(False)
+        _set_sequence_quiet(self._click_through_hotkey_edit, _key_sequence(hotkey_text))
         self._update_click_through_hint(hotkey_text)
         self._btn_clear_click_through_hotkey.setEnabled(bool(hotkey_text))
 
     def toggle_overlay_visibility_by_id(self, overlay_id: str) -> None:
         cfg = self._find_config(overlay_id)
-        win = self._overlay_windows.get(overlay_id)
+        win = self._ensure_overlay_window(overlay_id)
         if not cfg or not win:
             return
         cfg.visible = not cfg.visible
         if cfg.visible:
             win.show()
-            if hasattr(win, "ensure_topmost"):
-                win.ensure_topmost()
             self._raise_overlay_later(win)
         else:
             win.hide()
+        self._sync_topmost_timer()
         row = self._row_widgets.get(overlay_id)
         if row:
             row.set_visible(cfg.visible)
         self._schedule_config_save()
 
-    def _refresh_overlay_topmost(self) -> None:
-        if self.isVisible():
+    def _sync_topmost_timer(self) -> None:
+        """Run the fallback topmost refresh only while the panel is hidden and some overlay is on screen."""
+        wanted = (
+            not self._allow_close
+            and not self.isVisible()
+            and any(win.isVisible() for win in self._overlay_windows.values())
+        )
+        if not wanted:
+            self._topmost_timer.stop()
+        elif not self._topmost_timer.isActive():
+            self._topmost_timer.start()
+
+    def _on_focus_window_changed(self, focus_window) -> None:
+        # Focus moving onto one of our overlays can't bury the others; only another window taking it can
+        if focus_window is not None and any(
+            win.windowHandle() is focus_window for win in self._overlay_windows.values()
+        ):
             return
-        for cfg in self._get_active_profile().overlays:
-            if not cfg.visible:
-                continue
-            win = self._overlay_windows.get(cfg.id)
-            if win and hasattr(win, "ensure_topmost"):
+        self._refresh_overlay_topmost()
+
+    def _refresh_overlay_topmost(self) -> bool:
+        """Re-assert topmost on visible overlays; returns whether any were refreshed."""
+        if self.isVisible() or not self._overlay_windows:
+            return False
+        refreshed = False
+        # Walk the windows themselves: overlays hidden since their profile loaded may not have one yet
+        for win in self._overlay_windows.values():
+            if win.isVisible() and not win.isMinimized():
                 win.ensure_topmost()
+                refreshed = True
+        return refreshed
+
+    def _on_topmost_timer(self) -> None:
+        # Nothing on screen to keep on top; showing an overlay restarts the timer via _sync_topmost_timer
+        if not self._refresh_overlay_topmost():
+            self._topmost_timer.stop()
 
     def _on_fit_content_clicked(self) -> None:
         overlay_id = self._get_selected_id()
         if not overlay_id:
             return
-        win = self._overlay_windows.get(overlay_id)
+        win = self._ensure_overlay_window(overlay_id)
         if isinstance(win, ImageOverlayWindow):
             win.fit_to_content()
-            self._update_config_from_window(overlay_id)
-            self._schedule_config_save()
+            if self._update_config_from_window(overlay_id):
+                self._schedule_config_save()
+
+    def _default_focus_target(self) -> Optional[str]:
+        """First visible web or window overlay, rescanned only after the config has changed."""
+        if self._focus_target_dirty:
+            self._focus_target_id = next(
+                (
+                    cfg.id
+                    for cfg in self._get_active_profile().overlays
+                    if cfg.visible
+                    and (cfg.type == "web" or (cfg.type == "screen" and cfg.capture_mode == "window"))
+                ),
+                None,
+            )
+            self._focus_target_dirty = False
+        return self._focus_target_id
 
     def focus_chat_input_hotkey(self) -> None:
         if not self._config.focus_hotkey_enabled:
@@ -3048,20 +2990,12 @@ class ControlPanel(QWidget):
             ):
                 target_id = None
         if target_id is None:
-            for cfg in self._get_active_profile().overlays:
-                if not cfg.visible:
-                    continue
-                if cfg.type == "web":
-                    target_id = cfg.id
-                    break
-                if cfg.type == "screen" and cfg.capture_mode == "window":
-                    target_id = cfg.id
-                    break
+            target_id = self._default_focus_target()
         if target_id is None:
             return
 
         cfg = self._find_config(target_id)
-        win = self._overlay_windows.get(target_id)
+        win = self._ensure_overlay_window(target_id)
         if not cfg or not isinstance(win, WebOverlayWindow):
             return
 
@@ -3080,29 +3014,31 @@ class ControlPanel(QWidget):
 
         self._chat_focus_overlay_id = target_id
         self._chat_focus_was_click_through = cfg.click_through
-        if cfg.click_through:
+        release_click_through = cfg.click_through
+        reveal = not cfg.visible
+        if release_click_through or reveal:
             cfg.click_through = False
-            win.set_click_through(False)
-            row = self._row_widgets.get(target_id)
-            if row:
-                row.set_click_through(False)
-            self._schedule_config_save()
-
-        if not cfg.visible:
             cfg.visible = True
-            win.show()
-            if hasattr(win, "ensure_topmost"):
-                win.ensure_topmost()
+            # Clear click-through before showing: off Windows it rebuilds the native window, which would
+            # hide and re-show an already visible overlay. Both set_click_through and showEvent re-assert topmost.
+            if release_click_through:
+                win.set_click_through(False)
+            if reveal:
+                win.show()
+                self._sync_topmost_timer()
             row = self._row_widgets.get(target_id)
             if row:
-                row.set_visible(True)
+                row.apply_state(
+                    visible=True if reveal else None,
+                    click_through=False if release_click_through else None,
+                )
             self._schedule_config_save()
-
         win.focus_chat_input()
 
     def prepare_for_quit(self) -> None:
         self._allow_close = True
         # Persist overlay state (visibility, lock, click-through, etc.) before closing
+        self._flush_detail_timers()
         if self._save_timer.isActive():
             self._save_timer.stop()
             self._flush_config()
@@ -3116,36 +3052,45 @@ class ControlPanel(QWidget):
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
+        # Not restarted while pending: a drag-resize relayouts at most once per frame and the last tick sees the final size
+        if not self._resize_coalesce.isActive():
+            self._resize_coalesce.start()
+
+    def _apply_resize(self) -> None:
         self._update_list_row_widths()
         self._update_header_responsive()
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
-        QTimer.singleShot(0, self._update_list_row_widths)
-        QTimer.singleShot(0, self._update_header_responsive)
-        QTimer.singleShot(0, self._bring_panel_to_front)
+        # The topmost refresh only matters while the panel is hidden (it is a no-op otherwise)
+        self._topmost_timer.stop()
+        QTimer.singleShot(0, self._post_show)
+
+    def _post_show(self) -> None:
+        """Deferred show work, run once the panel has its final size."""
+        self._apply_resize()
+        self._bring_panel_to_front()
 
     def _update_header_responsive(self) -> None:
         """Adjust header sizing/visibility so it stays balanced at smaller widths."""
         header = getattr(self, "_header_container", None)
         if header is None:
             return
-        w = self.width()
-        if w < 900:
+        mode = "compact" if self.width() < 900 else "wide"
+        if mode == self._header_mode:
+            return
+        self._header_mode = mode
+        if mode == "compact":
             header.setFixedHeight(120)
             self._header_icon.setFixedSize(120, 82)
             if not self._header_icon_pix.isNull():
-                self._header_icon.setPixmap(
-                    self._header_icon_pix.scaled(104, 70, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                )
+                self._header_icon.setPixmap(_header_icon_scaled(self._header_icon_pix, 104, 70))
             self._header_subtitle.setVisible(False)
         else:
             header.setFixedHeight(150)
             self._header_icon.setFixedSize(160, 110)
             if not self._header_icon_pix.isNull():
-                self._header_icon.setPixmap(
-                    self._header_icon_pix.scaled(140, 90, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                )
+                self._header_icon.setPixmap(_header_icon_scaled(self._header_icon_pix, 140, 90))
             self._header_subtitle.setVisible(True)
 
     def _bring_panel_to_front(self) -> None:
@@ -3156,25 +3101,40 @@ class ControlPanel(QWidget):
 
     def _update_list_row_widths(self) -> None:
         w = self._list.viewport().width()
-        if w > 0:
-            for row_widget in self._row_widgets.values():
-                row_widget.setMinimumWidth(w)
-                row_widget.setMaximumWidth(w)
+        # Rows added since the last pass get this width in _add_list_item, so an unchanged width means nothing to do
+        if w <= 0 or w == self._last_row_width:
+            return
+        self._last_row_width = w
+        for row_widget in self._row_widgets.values():
+            row_widget.setFixedWidth(w)
 
     def _on_show_controls_toggled(self, checked: bool) -> None:
         self._btn_show_controls.setText(FA_TOGGLE_ON if checked else FA_TOGGLE_OFF)
         self._toggle_tools_label.setText("Hide overlay tools" if checked else "Show overlay tools")
-        for row_widget in self._row_widgets.values():
-            row_widget.set_tools_visible(checked)
+        # One relayout/repaint of the list instead of one per row
+        self._list.setUpdatesEnabled(False)
+        try:
+            for row_widget in self._row_widgets.values():
+                row_widget.set_tools_visible(checked)
+        finally:
+            self._list.setUpdatesEnabled(True)
 
     def _update_capture_tab_visibility(self, overlay_id: Optional[str]) -> None:
-        cfg = self._find_config(overlay_id) if overlay_id else None
+        cfg = self._find_config(overlay_id)
         is_screen = cfg is not None and cfg.type == "screen"
-        idx = self._tab_widget.indexOf(self._capture_tab_widget)
-        if is_screen and idx == -1:
+        if is_screen == self._capture_tab_present:
+            return
+        if self._capture_tab_widget is None:
+            self._capture_tab_widget = self._build_capture_tab()
+        if is_screen:
             self._tab_widget.insertTab(2, self._capture_tab_widget, self._capture_tab_title)
-        elif not is_screen and idx >= 0:
-            self._tab_widget.removeTab(idx)
+        else:
+            self._tab_widget.removeTab(self._tab_widget.indexOf(self._capture_tab_widget))
+        self._capture_tab_present = is_screen
+
+    def hideEvent(self, event) -> None:
+        super().hideEvent(event)
+        self._sync_topmost_timer()
 
     def changeEvent(self, event: QEvent) -> None:
         if event.type() == QEvent.Type.WindowStateChange:
@@ -3191,11 +3151,13 @@ class ControlPanel(QWidget):
             if self._on_quit_requested is not None:
                 self._on_quit_requested()
             self._topmost_timer.stop()
+            self._flush_detail_timers()
             if self._save_timer.isActive():
                 self._save_timer.stop()
                 self._flush_config()
             return super().closeEvent(event)
         self._topmost_timer.stop()
+        self._flush_detail_timers()
         if self._save_timer.isActive():
             self._save_timer.stop()
             self._flush_config()
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
-from PySide6.QtCore import Qt, QPoint, QRect, Signal
+from PySide6.QtCore import Qt, QPoint, QRect, QTimer, Signal
 from PySide6.QtGui import QPainter, QColor, QMouseEvent, QCloseEvent
 from PySide6.QtWidgets import QApplication, QWidget
 
 
+_DIM = QColor(0, 0, 0, 80)
+_BORDER = QColor(66, 208, 255)
+
+
 class RegionPickerOverlay(QWidget):
     """
     Fullscreen semi-transparent overlay. User clicks and drags to select a rectangle.
@@ -25,6 +29,13 @@ class RegionPickerOverlay(QWidget):
         self._current: Optional[QPoint] = None
         self._result: Optional[Tuple[int, int, int, int]] = None  # (x, y, w, h)
         self._screen_geometry = self._get_screen_geometry()
+        # Selection last handed to update(); repaints only cover old + new rect
+        self._painted_rect = QRect()
+        # Coalesce mouse-move repaints to roughly one per frame
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
 
     def _get_screen_geometry(self) -> QRect:
         screen = QApplication.primaryScreen()
@@ -43,11 +54,23 @@ class RegionPickerOverlay(QWidget):
         """Returns (x, y, width, height) in screen coordinates, or None if cancelled."""
         return self._result
 
+    def _selection_rect(self) -> QRect:
+        if self._start is None or self._current is None:
+            return QRect()
+        return QRect(self._start, self._current).normalized()
+
+    def _flush_repaint(self) -> None:
+        rect = self._selection_rect()
+        # Pad by the border width so the old outline is erased too
+        self.update(self._painted_rect.united(rect).adjusted(-2, -2, 2, 2))
+        self._painted_rect = rect
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.LeftButton:
             self._start = event.globalPosition().toPoint()
             self._current = self._start
             self._result = None
+            self._painted_rect = self._selection_rect()
             self.update()
         elif event.button() == Qt.RightButton:
             self._result = None
@@ -57,7 +80,8 @@ class RegionPickerOverlay(QWidget):
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._start is not None:
             self._current = event.globalPosition().toPoint()
-            self.update()
+            if not self._repaint_timer.isActive():
+                self._repaint_timer.start()
         event.accept()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
@@ -86,16 +110,19 @@ class RegionPickerOverlay(QWidget):
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, False)
-        # Dim entire screen
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 80))
-        if self._start is not None and self._current is not None:
-            rect = QRect(self._start, self._current).normalized()
-            # Clear the selection area so it's bright
-            painter.setCompositionMode(QPainter.CompositionMode_Clear)
-            painter.fillRect(rect, Qt.transparent)
-            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        rect = self._selection_rect()
+        if rect.isNull():
+            painter.fillRect(self.rect(), _DIM)
+        else:
+            # Dim only the four strips around the selection; the translucent backing store is already
+            # cleared, so the selection stays bright without a CompositionMode_Clear pass
+            w, h = self.width(), self.height()
+            painter.fillRect(QRect(0, 0, w, rect.top()), _DIM)
+            painter.fillRect(QRect(0, rect.bottom() + 1, w, h - rect.bottom() - 1), _DIM)
+            painter.fillRect(QRect(0, rect.top(), rect.left(), rect.height()), _DIM)
+            painter.fillRect(QRect(rect.right() + 1, rect.top(), w - rect.right() - 1, rect.height()), _DIM)
             # Border around selection
-            painter.setPen(QColor(66, 208, 255))
+            painter.setPen(_BORDER)
             painter.setBrush(Qt.NoBrush)
             painter.drawRect(rect)
         painter.end()
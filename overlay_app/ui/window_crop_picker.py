@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
-from PySide6.QtCore import Qt, QPoint, QRect, QSize, Signal
+from PySide6.QtCore import Qt, QPoint, QRect, QRectF, QSize, QTimer, Signal
 from PySide6.QtGui import (
     QPainter,
     QColor,
@@ -27,6 +27,35 @@ from overlay_app.models.config import CaptureRect
 
 HANDLE_SIZE = 10
 MIN_CROP_SIZE = 20
+# Largest grab kept for the crop preview (device pixels)
+_MAX_PREVIEW_W = 1920
+_MAX_PREVIEW_H = 1080
+_BORDER_PEN = QPen(QColor(0, 200, 255), 2)
+_HANDLE_BRUSH = QBrush(QColor(0, 200, 255))
+_HANDLE_PEN = QPen(QColor(0, 150, 190), 1)
+# Handle under the cursor by (row, column) band: outside, near the start edge, inside, near the end edge, outside
+_HIT_TABLE = (
+    (None, None, None, None, None),
+    (None, "top_left", "top", "top_right", None),
+    (None, "left", "move", "right", None),
+    (None, "bottom_left", "bottom", "bottom_right", None),
+    (None, None, None, None, None),
+)
+
+
+def _hit_band(v: int, lo: int, hi: int) -> int:
+    """Band of v against the crop span [lo, hi): 0/4 outside, 1/3 near the start/end edge, 2 inside."""
+    # Edge bands reach at most a third of the way in, so small crops keep a "move" band in the middle
+    inner = min(HANDLE_SIZE, (hi - lo) // 3)
+    if v < lo - HANDLE_SIZE:
+        return 0
+    if v < lo + inner:
+        return 1
+    if v < hi - inner:
+        return 2
+    if v < hi + HANDLE_SIZE:
+        return 3
+    return 4
 
 
 def _capture_rect(left: int, top: int, width: int, height: int) -> Optional[QPixmap]:
@@ -72,9 +101,22 @@ class CropPreviewWidget(QWidget):
         self._preview_rect = QRect()  # set in paintEvent / resize
         self._scale_x = 1.0
         self._scale_y = 1.0
+        # Preview pixmap pre-scaled for the current widget size
+        self._scaled_pix: Optional[QPixmap] = None
+        self._scaled_for = QSize()
+        self._hit_bounds = (0, 0, 0, 0)
         self._drag_handle: Optional[str] = None
         self._drag_start: Optional[QPoint] = None
         self._drag_start_crop: Optional[Tuple[int, int, int, int]] = None
+        # Crop last reported through crop_changed during the current drag
+        self._drag_last_emitted: Optional[Tuple[int, int, int, int]] = None
+        # Coalesce drag repaints to roughly one per frame
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+        # Crop rect as last painted, so drag repaints cover only old + new handles
+        self._painted_crop = QRect()
         # Larger default so users can clearly see what they're cropping
         self.setMinimumSize(640, 360)
         self.setMouseTracking(True)
@@ -98,35 +140,15 @@ class CropPreviewWidget(QWidget):
         h = max(1, int(self._ch * self._scale_y))
         return QRect(x, y, w, h)
 
-    def _hit_handle(self, pos: QPoint) -> Optional[str]:
+    def _rebuild_hit_bounds(self) -> None:
+        """Cache the crop edges (preview coords) that _hit_handle classifies against."""
         r = self._crop_preview_rect()
-        hs = HANDLE_SIZE
-        # Corners first (inner square of handle area)
-        if (pos - r.topLeft()).manhattanLength() < hs:
-            return "top_left"
-        if (pos - r.topRight()).manhattanLength() < hs:
-            return "top_right"
-        if (pos - r.bottomLeft()).manhattanLength() < hs:
-            return "bottom_left"
-        if (pos - r.bottomRight()).manhattanLength() < hs:
-            return "bottom_right"
-        # Edges (expand rect by hs for hit area)
-        left = r.x() - hs
-        right = r.x() + r.width() + hs
-        top = r.y() - hs
-        bottom = r.y() + r.height() + hs
-        if left <= pos.x() <= r.x() and r.y() <= pos.y() <= r.y() + r.height():
-            return "left"
-        if r.x() + r.width() <= pos.x() <= right and r.y() <= pos.y() <= r.y() + r.height():
-            return "right"
-        if r.x() <= pos.x() <= r.x() + r.width() and top <= pos.y() <= r.y():
-            return "top"
-        if r.x() <= pos.x() <= r.x() + r.width() and r.y() + r.height() <= pos.y() <= bottom:
-            return "bottom"
-        # Inside the crop rectangle: allow click-drag to move the whole crop
-        if r.contains(pos):
-            return "move"
-        return None
+        self._hit_bounds = (r.x(), r.y(), r.x() + r.width(), r.y() + r.height())
+
+    def _hit_handle(self, pos: QPoint) -> Optional[str]:
+        # Bucket each axis into outside / near-start / inside / near-end / outside, then look up the handle
+        x0, y0, x1, y1 = self._hit_bounds
+        return _HIT_TABLE[_hit_band(pos.y(), y0, y1)][_hit_band(pos.x(), x0, x1)]
 
     def _cursor_for_handle(self, handle: Optional[str]):
         cursors = {
@@ -154,10 +176,14 @@ class CropPreviewWidget(QWidget):
         self.crop_changed.emit(self.get_crop_rect())
 
     def _clamp_crop(self) -> None:
-        self._cx = max(0, min(self._cx, self._win_w - MIN_CROP_SIZE))
-        self._cy = max(0, min(self._cy, self._win_h - MIN_CROP_SIZE))
-        self._cw = max(MIN_CROP_SIZE, min(self._cw, self._win_w - self._cx))
-        self._ch = max(MIN_CROP_SIZE, min(self._ch, self._win_h - self._cy))
+        # Runs on every drag step: work on locals and store all four values once
+        win_w, win_h, m = self._win_w, self._win_h, MIN_CROP_SIZE
+        cx = max(0, min(self._cx, win_w - m))
+        cy = max(0, min(self._cy, win_h - m))
+        self._cx, self._cy = cx, cy
+        self._cw = max(m, min(self._cw, win_w - cx))
+        self._ch = max(m, min(self._ch, win_h - cy))
+        self._rebuild_hit_bounds()
 
     def _apply_drag(self, pos: QPoint) -> None:
         if not self._drag_handle or self._drag_start is None or self._drag_start_crop is None:
@@ -199,9 +225,19 @@ class CropPreviewWidget(QWidget):
             self._cx = cx0 + dx
             self._cy = cy0 + dy
         self._clamp_crop()
-        self.update()
+        crop = (self._cx, self._cy, self._cw, self._ch)
+        if crop == self._drag_last_emitted:
+            # Clamped against an edge or moved within one window pixel
+            return
+        self._drag_last_emitted = crop
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
         self.crop_changed.emit(self.get_crop_rect())
 
+    def _flush_repaint(self) -> None:
+        hs = HANDLE_SIZE
+        self.update(self._painted_crop.united(self._crop_preview_rect()).adjusted(-hs, -hs, hs, hs))
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.LeftButton:
             h = self._hit_handle(event.position().toPoint())
@@ -209,6 +245,7 @@ class CropPreviewWidget(QWidget):
                 self._drag_handle = h
                 self._drag_start = event.position().toPoint()
                 self._drag_start_crop = (self._cx, self._cy, self._cw, self._ch)
+                self._drag_last_emitted = self._drag_start_crop
         event.accept()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
@@ -224,58 +261,80 @@ class CropPreviewWidget(QWidget):
             self._drag_handle = None
             self._drag_start = None
             self._drag_start_crop = None
+            self._drag_last_emitted = None
         event.accept()
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
+        self._scaled_pix = None
         self.update()
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
         if self._pix.isNull():
             painter.fillRect(self.rect(), QColor(60, 60, 60))
             painter.end()
             return
-        # Scale pixmap to fit, keep aspect ratio
-        pix_w = self._pix.width()
-        pix_h = self._pix.height()
-        if pix_w < 1 or pix_h < 1:
-            painter.end()
-            return
-        scale = min(self.width() / pix_w, self.height() / pix_h)
-        pw = int(pix_w * scale)
-        ph = int(pix_h * scale)
-        px = (self.width() - pw) // 2
-        py = (self.height() - ph) // 2
-        self._preview_rect = QRect(px, py, pw, ph)
-        self._scale_x = pw / pix_w
-        self._scale_y = ph / pix_h
-
-        painter.drawPixmap(self._preview_rect, self._pix)
+        if self._scaled_pix is None or self._scaled_for != self.size():
+            # Lay out against the window size: the pixmap may be a downscaled grab (see WindowCropPickerDialog)
+            scale = min(self.width() / self._win_w, self.height() / self._win_h)
+            pw = max(1, int(self._win_w * scale))
+            ph = max(1, int(self._win_h * scale))
+            px = (self.width() - pw) // 2
+            py = (self.height() - ph) // 2
+            self._preview_rect = QRect(px, py, pw, ph)
+            self._scale_x = pw / self._win_w
+            self._scale_y = ph / self._win_h
+            # Scale to device pixels so the cached preview stays sharp on HiDPI screens
+            dpr = self.devicePixelRatioF()
+            self._scaled_pix = self._pix.scaled(
+                max(1, round(pw * dpr)), max(1, round(ph * dpr)), Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+            )
+            self._scaled_pix.setDevicePixelRatio(dpr)
+            self._scaled_for = self.size()
+
+        # Blit only the part of the cached preview inside the dirty rect
+        dirty = event.rect().intersected(self._preview_rect)
+        if not dirty.isEmpty():
+            dpr = self._scaled_pix.devicePixelRatio()
+            src = dirty.translated(-self._preview_rect.topLeft())
+            painter.drawPixmap(
+                QRectF(dirty),
+                self._scaled_pix,
+                QRectF(src.x() * dpr, src.y() * dpr, src.width() * dpr, src.height() * dpr),
+            )
 
         # Crop border and handles (no dark overlay so the whole window stays visible)
-        crop_r = self._crop_preview_rect()
-        painter.setPen(QPen(QColor(0, 200, 255), 2))
+        crop_r = self._painted_crop = self._crop_preview_rect()
+        self._rebuild_hit_bounds()
+        painter.setPen(_BORDER_PEN)
         painter.setBrush(Qt.NoBrush)
         painter.drawRect(crop_r)
 
-        handle_color = QColor(0, 200, 255)
-        painter.setBrush(QBrush(handle_color))
-        painter.setPen(QPen(QColor(0, 150, 190), 1))
+        painter.setBrush(_HANDLE_BRUSH)
+        painter.setPen(_HANDLE_PEN)
         hs = HANDLE_SIZE
-        cx, cy = crop_r.center().x(), crop_r.center().y()
-        for pt in [
-            crop_r.topLeft(),
-            crop_r.topRight(),
-            crop_r.bottomLeft(),
-            crop_r.bottomRight(),
-            QPoint(crop_r.x(), cy),
-            QPoint(crop_r.x() + crop_r.width(), cy),
-            QPoint(cx, crop_r.y()),
-            QPoint(cx, crop_r.y() + crop_r.height()),
-        ]:
-            painter.drawRect(pt.x() - hs // 2, pt.y() - hs // 2, hs, hs)
+        half = hs // 2
+        left = crop_r.x() - half
+        top = crop_r.y() - half
+        # Corners sit on right()/bottom() (last pixel); side midpoints sit one past it
+        corner_r = crop_r.right() - half
+        corner_b = crop_r.bottom() - half
+        edge_r = corner_r + 1
+        edge_b = corner_b + 1
+        mid_x = crop_r.center().x() - half
+        mid_y = crop_r.center().y() - half
+        for x, y in (
+            (left, top),
+            (corner_r, top),
+            (left, corner_b),
+            (corner_r, corner_b),
+            (left, mid_y),
+            (edge_r, mid_y),
+            (mid_x, top),
+            (mid_x, edge_b),
+        ):
+            painter.drawRect(x, y, hs, hs)
 
         painter.end()
 
@@ -302,6 +361,9 @@ class WindowCropPickerDialog(QDialog):
         self._result: Optional[CaptureRect] = None
 
         pix = _capture_rect(left, top, width, height)
+        if pix is not None and (pix.width() > _MAX_PREVIEW_W or pix.height() > _MAX_PREVIEW_H):
+            # The preview never shows more than this; crop math stays in window coords
+            pix = pix.scaled(_MAX_PREVIEW_W, _MAX_PREVIEW_H, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         if pix is None or pix.isNull():
             self._preview = QLabel("Could not capture window.")
             self._preview.setAlignment(Qt.AlignCenter)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import sys
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -16,31 +17,50 @@ from PySide6.QtWidgets import (
 )
 
 
-def _enumerate_windows_win32() -> List[Tuple[int, str]]:
-    """Returns list of (hwnd, title) for visible windows with non-empty titles."""
-    if sys.platform != "win32":
-        return []
+_TITLE_BUF_LEN = 512
 
+
+@functools.lru_cache(maxsize=1)
+def _win32_enum_hooks():
+    """Typed user32 bindings, a reusable title buffer and the EnumWindows callback, built once."""
     import ctypes
     from ctypes import wintypes
 
-    user32 = ctypes.windll.user32
+    # Private WinDLL so these prototypes don't leak into other windll.user32 callers
+    user32 = ctypes.WinDLL("user32")
+    user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    user32.IsWindowVisible.restype = wintypes.BOOL
+    user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+    user32.EnumWindows.restype = wintypes.BOOL
+
+    buf = ctypes.create_unicode_buffer(_TITLE_BUF_LEN)
     result: List[Tuple[int, str]] = []
 
     def enum_callback(hwnd: int, _: int) -> int:
         if not user32.IsWindowVisible(hwnd):
             return 1
-        length = user32.GetWindowTextLengthW(hwnd) + 1
-        buf = ctypes.create_unicode_buffer(length)
-        user32.GetWindowTextW(hwnd, buf, length)
-        title = buf.value.strip()
-        if title:
-            result.append((hwnd, title))
+        # GetWindowTextW returns the copied length, so no separate length query is needed
+        if user32.GetWindowTextW(hwnd, buf, _TITLE_BUF_LEN) > 0:
+            title = buf.value.strip()
+            if title:
+                result.append((hwnd, title))
         return 1
 
-    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-    user32.EnumWindows(WNDENUMPROC(enum_callback), 0)
-    return result
+    return user32, WNDENUMPROC(enum_callback), result
+
+
+def _enumerate_windows_win32() -> List[Tuple[int, str]]:
+    """Returns list of (hwnd, title) for visible windows with non-empty titles."""
+    if sys.platform != "win32":
+        return []
+
+    user32, callback, result = _win32_enum_hooks()
+    result.clear()
+    user32.EnumWindows(callback, 0)
+    return list(result)
 
 
 def _enumerate_windows_macos() -> List[Tuple[int, str]]:
@@ -57,21 +77,22 @@ def _enumerate_windows_macos() -> List[Tuple[int, str]]:
         raw = Quartz.CGWindowListCopyWindowInfo(options, Quartz.kCGNullWindowID)
         if raw is None:
             return []
+        # Bind the Quartz keys once; OnScreenOnly already filters, so kCGWindowIsOnScreen isn't rechecked
+        name_key = Quartz.kCGWindowName
+        owner_key = Quartz.kCGWindowOwnerName
+        layer_key = Quartz.kCGWindowLayer
+        number_key = Quartz.kCGWindowNumber
         result: List[Tuple[int, str]] = []
+        append = result.append
         for w in raw:
-            if not w.get(Quartz.kCGWindowIsOnScreen):
+            if w.get(layer_key, 0) != 0:
                 continue
-            layer = w.get(Quartz.kCGWindowLayer, 0)
-            if layer != 0:
+            wid = w.get(number_key)
+            if wid is None:
                 continue
-            name = w.get(Quartz.kCGWindowName) or ""
-            owner = w.get(Quartz.kCGWindowOwnerName) or ""
-            title = (name or owner or "").strip()
-            if not title:
-                title = owner.strip() or "Untitled"
-            wid = w.get(Quartz.kCGWindowNumber)
-            if wid is not None:
-                result.append((int(wid), title))
+            owner = w.get(owner_key) or ""
+            title = (w.get(name_key) or owner).strip() or owner.strip() or "Untitled"
+            append((int(wid), title))
         return result
     except Exception:
         return []
@@ -86,6 +107,8 @@ class WindowPickerDialog(QDialog):
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowMaximizeButtonHint)
         self.setMaximumSize(700, 550)
         self._result: Optional[Tuple[int, str]] = None
+        # Window id -> title currently shown in the list
+        self._last_windows: Dict[int, str] = {}
         self._list = QListWidget()
         self._list.setAlternatingRowColors(True)
         self._list.doubleClicked.connect(self._on_accept)
@@ -108,17 +131,40 @@ class WindowPickerDialog(QDialog):
         self._populate()
 
     def _populate(self) -> None:
-        self._list.clear()
         if sys.platform == "win32":
             windows = _enumerate_windows_win32()
         elif sys.platform == "darwin":
             windows = _enumerate_windows_macos()
         else:
             windows = []
-        for window_id, title in windows:
-            item = QListWidgetItem(title)
-            item.setData(Qt.UserRole, (window_id, title))
-            self._list.addItem(item)
+        new = dict(windows)
+        old = self._last_windows
+        if list(new.items()) == list(old.items()):
+            return
+        self._list.setUpdatesEnabled(False)
+        try:
+            if list(new) == list(old):
+                # Same windows in the same z-order: only retitle the rows that changed
+                for row in range(self._list.count()):
+                    item = self._list.item(row)
+                    window_id = item.data(Qt.UserRole)[0]
+                    if new[window_id] != old[window_id]:
+                        item.setText(new[window_id])
+                        item.setData(Qt.UserRole, (window_id, new[window_id]))
+            else:
+                # Windows came, went or restacked: rebuild so the list keeps the enumeration (z-)order
+                current = self._list.currentItem()
+                current_id = current.data(Qt.UserRole)[0] if current else None
+                self._list.clear()
+                for window_id, title in new.items():
+                    item = QListWidgetItem(title)
+                    item.setData(Qt.UserRole, (window_id, title))
+                    self._list.addItem(item)
+                    if window_id == current_id:
+                        self._list.setCurrentItem(item)
+        finally:
+            self._list.setUpdatesEnabled(True)
+        self._last_windows = new
 
     def _on_accept(self) -> None:
         item = self._list.currentItem()
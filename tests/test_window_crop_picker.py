@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QPoint  # noqa: E402
+from PySide6.QtGui import QColor, QPixmap  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from overlay_app.models.config import CaptureRect  # noqa: E402
+from overlay_app.ui.window_crop_picker import CropPreviewWidget  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize("size", [50, 60])
+def test_small_crop_centre_hits_move(app, size):
+    pix = QPixmap(1920, 1080)
+    pix.fill(QColor(0, 0, 0))
+    widget = CropPreviewWidget(pix, 1920, 1080, CaptureRect(x=900, y=500, width=size, height=size))
+    widget.resize(640, 360)
+    widget.grab()  # runs paintEvent, which lays out the preview and caches the hit bounds
+    centre = widget._crop_preview_rect().center()
+    assert widget._hit_handle(centre) == "move"
+    assert widget._hit_handle(QPoint(centre.x(), 0)) is None